@@ -0,0 +1,54 @@
+# precomputed neighbours of every cell, per grid and neighbour mode
+# neighbours[id] is a tuple of the cell's unblocked neighbours (in neighboursOrder), shared by every search:
+# getNeighbours doesn't allocate or check bounds/BLOCKED anymore, blocking/unblocking a cell only
+# rebuilds the tuples of the cells around it
+from model import *
+
+class Adjacency:
+    def __init__(self,grid: GridModel,diagonal: bool = False):
+        self.grid = grid
+        self.diagonal = diagonal
+        self.neighboursOrder = NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER
+        self.ids = list(range(grid.size)) # shared int objects
+        self.neighbours = [()]*grid.size
+        for id in range(grid.size):
+            self.neighbours[id] = self.build(id)
+        grid.listeners.append(self)
+
+    def detach(self):
+        if self in self.grid.listeners:
+            self.grid.listeners.remove(self)
+
+    # unblocked neighbours of a cell (whatever its own state)
+    def build(self,id) -> tuple:
+        grid = self.grid
+        cells = grid.cells
+        x,y = divmod(id,grid.columns)
+        neighbours = list()
+        for dx,dy in self.neighboursOrder:
+            nx,ny = x+dx, y+dy
+            if 0 <= nx < grid.rows and 0 <= ny < grid.columns:
+                n = nx*grid.columns+ny
+                if cells[n] != BLOCKED:
+                    neighbours.append(self.ids[n])
+        return tuple(neighbours)
+
+    # GridModel listener
+    def onGridEdited(self,grid: GridModel,id,previous,previousHash):
+        if (previous == BLOCKED) != (grid.cells[id] == BLOCKED):
+            x,y = divmod(id,grid.columns)
+            for dx,dy in self.neighboursOrder:
+                n = grid.get(x+dx,y+dy)
+                if n is not None:
+                    self.neighbours[n] = self.build(n)
+
+CACHE = "adjacency" # GridModel.caches key of the grid's adjacencies: {diagonal: Adjacency}
+
+# returns the adjacency of a grid, building it if necessary
+def getAdjacency(grid: GridModel,diagonal: bool) -> Adjacency:
+    adjacencies = grid.caches.setdefault(CACHE,dict())
+    adjacency = adjacencies.get(diagonal)
+    if adjacency is None:
+        adjacency = Adjacency(grid,diagonal)
+        adjacencies[diagonal] = adjacency
+    return adjacency
@@ -1,144 +1,173 @@
-from queue import Queue, Empty
+from queue import Queue
 import time
 import threading
-from grid import *
-from messages import *
-from math import isclose
+from model import *
+from frontier import PriorityQueue, BucketQueue
+import hpa
+import landmarks
+import components
+import heuristics
+import searchdata
+from heuristics import TIE_FIFO, TIE_HIGH_G, TIE_LOW_H
+from adjacency import getAdjacency
+from profiling import SearchProfile
+from control import SearchControl
+from math import inf
 
-SLEEP_TIME = 1/60 # thread sleep time in seconds
-
-STATE_RUNNING = 0
-STATE_PAUSED = 1
-STATE_STEP = 2
-
-MAX_DISTANCE = 999999
-
-# order in which getNeighbours(cell) returns 
-# [(-1,0),(1,0),(0,-1),(0,1)] # WEST, EAST, NORTH, SOUTH
-NEIGHBOURS_ORDER = [(0,1),(1,0),(0,-1),(-1,0)] # N, E, S, W
-NEIGHBOURS_ORDER_DIAGONAL = [(0,1),(1,1),(1,0),(1,-1),(0,-1),(-1,-1),(-1,0),(-1,1)] # N, NE, E, SE, S, SW, W, NW
+EPSILON = 2.0 # default suboptimality bound of the bounded searches (see setEpsilon)
+ARA_EPSILON_STEP = 0.5 # ARA* lowers epsilon by this much after every solution
 
 # extend thread class
 class PathFindingAlgorithm(threading.Thread):
 
     name = None # algorithm name, if None the class name is used
     info = None # information about the algorithm (string)
+    optimal = False # always returns a shortest path (in both neighbour modes, by move count or by moveCost for Dijkstra/A*)
+    frontiers = ("list",) # frontier attributes (dotted paths), counted and timed by a SearchProfile
+    neighbourMethods = ("getNeighbours",) # neighbour generation methods (dotted paths), timed by a SearchProfile
+    weighted = False # searches by moveCost (terrain costs, sqrt(2) diagonally), the others count moves
+    informed = False # uses the selected heuristic and tie-breaking policy (see setHeuristic)
+    bounded = False # bounded-suboptimal, the path costs at most epsilon times the shortest one (see setEpsilon)
+    epsilon = 1.0
 
-    def __init__(self,queue: Queue, app, grid: Grid, speed, diagonal: bool, stepOnce: bool):
+    # grid is a headless GridModel, nodes are cell ids
+    # app (UI callbacks) can be None when not run as a thread
+    # control: per-run control channel (pause/resume/step/speed/cancel), None for a new one, running at the given
+    # speed or paused after the first step (stepOnce)
+    # origin/destination default to the grid's start/end
+    def __init__(self,control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
         threading.Thread.__init__(self,daemon=True)
-        self.__queue = queue
+        self.control = control or SearchControl(speed,stepOnce)
         self.app = app
         self.grid = grid
-        self.__setSpeed(speed)
+        self.view = grid.view # receives the search state changes (onCellChanged)
+        self.diagonal = diagonal
         self.neighboursOrder = NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER
-        grid.saveState()
+        self.adjacency = getAdjacency(grid,diagonal).neighbours # unblocked neighbours per cell, kept up to date on edits
+        self.costs = grid.costs # terrain cost per cell (see moveCost)
+        self.heuristicName, self.heuristicFunction = heuristics.resolve(None,diagonal) # see setHeuristic
+        self.tieBreaking = TIE_FIFO
         # search state
-        self.origin = self.grid.start
-        self.destination = self.grid.end
+        self.origin = self.grid.start if origin is None else origin
+        self.destination = self.grid.end if destination is None else destination
         #self.nodes = [self.origin] # nodes in the stack to be visited
         self.iterations = 0
         self.visited = 0
         self.path = dict() # for path search
+        self.marks = bytearray(self.grid.size) # DISCOVERED/VISITED/PATH per cell, the grid itself is never written
+        self.profile = None # SearchProfile (see instrument)
+        self.finished = False # the search ran to completion (not stopped or out of budget)
         #self.origin.discovered()
-        # execution state
-        self.state = STATE_STEP if stepOnce else STATE_RUNNING
+
+    # builds the per-grid data the algorithm's searches share (kept on the grid and reused by the next searches),
+    # e.g. to time a search on a fresh grid without them
+    @classmethod
+    def prepare(cls,grid: GridModel,diagonal: bool):
+        components.getIndex(grid,diagonal)
+        getAdjacency(grid,diagonal)
+        grid.maxCost()
 
     def run(self):
+        if components.unreachable(self.grid,self.origin,self.destination,self.diagonal): # different components, nothing to search
+            self.finish()
+            self.app.onSearchComplete(0,0,[])
+            return
         self.startTime = time.time()
-        self.previousStep = 0
-        self.nextStep = 0
-        # run loop
-        while True:
-            #print("THREAD: ", time.time()-self.startTime)
-            # process queue
-            if not self.__processQueue():
+        # run loop, every step waits for the control channel (scheduled or single step), until cancelled
+        while self.control.wait():
+            if self.isEmpty() or self.step():
+                #self.dfsCheck(self.getPath())
+                self.complete()
                 break
-            # check state
-            if self.state == STATE_RUNNING: # RUNNING
-                # check if it's time to execute step
-                if time.time() >= self.nextStep:
-                    self.previousStep = time.time()
-                    self.nextStep = self.previousStep+self.speed
-                    if self.isEmpty() or self.step():
-                        #self.dfsCheck(self.getPath())
-                        self.app.onSearchComplete(self.iterations,self.visited,self.getPath())
-                        break
-            elif self.state == STATE_STEP: # STEPPING
-                if self.isEmpty() or self.step():
-                    self.app.onSearchComplete(self.iterations,self.visited,self.getPath())
-                    break
-                self.state = STATE_PAUSED
-            # sleep
-            time.sleep(SLEEP_TIME)
+        if self.profile:
+            self.profile.detach()
+        self.finish()
         #print("EXIT")
         return
 
+    # attaches a SearchProfile (counters, phase timers, optional memory peak and trace events, see profiling.py)
+    # nothing is measured (or slowed down) unless this is called
+    def instrument(self,profile: SearchProfile = None) -> SearchProfile:
+        self.profile = profile or SearchProfile()
+        self.profile.attach(self)
+        return self.profile
+
+    # reports the path and its bound to the app once the search ran to completion
+    def complete(self):
+        self.finished = True
+        path = self.getPath()
+        self.app.onSearchComplete(self.iterations,self.visited,path,self.bound() if path else None)
+
     def isEmpty(self) -> bool:
         return False
 
+    # proven suboptimality bound of getPath(): its cost (see GridModel.pathCost) is at most bound times the shortest one
+    # None if unknown (the algorithm can't tell or the search didn't finish)
+    # searches that count moves only know it without terrain and diagonal moves (every move costs the same)
+    def bound(self):
+        if not self.finished or not self.optimal:
+            return None
+        return 1.0 if self.weighted or (not self.diagonal and self.grid.maxCost() == DEFAULT_COST) else None
+
+    # gives back the per-run resources (pooled search data) once the search is over
+    def finish(self):
+        pass
+
     def getPath(self) -> list:
         path = list()
         node = self.path.get(self.destination)
-        while(node):
+        while(node is not None):
             path.append(node)
-            node.path()
+            self.mark(node,PATH)
             node = self.path.get(node)
         if path:
             path.reverse()
             path.append(self.destination)
-            self.destination.path()
+            self.mark(self.destination,PATH)
         return path
 
-    # process queue message
-    def __processQueue(self) -> bool:
-        try:
-            message = self.__queue.get(block=False)
-            #print("Message: ", message)
-            if message is None: # stop
-                return False
-            elif message[0] == MSG_SPEED: # update speed
-                self.__setSpeed(float(message[1]))
-                self.nextStep = self.previousStep+self.speed
-            elif message[0] == MSG_PAUSE: # pause/resume
-                if self.state == 1: # resume
-                    self.nextStep = 0
-                    self.previousStep = 0
-                    self.state = 0
-                else:
-                    self.state = 1 # pause
-            elif message[0] == MSG_STEP: # step
-                self.state = 2
-            return True
-        except Empty:
-            return True
+    # sets the search state of a node and forwards it to the view
+    def mark(self,node,state):
+        self.marks[node] = state
+        if self.view:
+            self.view.onCellChanged(node,state)
 
     # returns True if finished
     def step(self) -> bool:
         self.iterations += 1
-        self.app.onStep(self.iterations,self.visited)
+        if self.app:
+            self.app.onStep(self.iterations,self.visited)
         #print("STEP - ", self.iterations)
 
-    def __setSpeed(self,speed):
-        # convert speed to seconds
-        if isclose(speed,0.5):
-            self.speed = 0.75
-        elif isclose(speed,1):
-            self.speed = 0.25
-        elif isclose(speed,1.5):
-            self.speed = 0.05
-        else:
-            self.speed = 0.025
+    # returns the unblocked neighbours (precomputed tuple, must not be modified)
+    def getNeighbours(self,cell: int) -> tuple:
+        return self.adjacency[cell]
 
-    # returns a list of unblocked neighbours
-    def getNeighbours(self,cell: Cell):
-        neighbours = list()
-        x,y = cell.x, cell.y
-        for dir in self.neighboursOrder:
-            node = self.grid.get(x+dir[0],y+dir[1])
-            if node:
-                if node.state != BLOCKED:
-                    neighbours.append(node)
-        return neighbours
+    # cost of a move to a neighbour: the neighbour's terrain cost, times sqrt(2) for diagonal moves (octile)
+    def moveCost(self,node,n):
+        columns = self.grid.columns
+        if self.diagonal and node % columns != n % columns and node // columns != n // columns:
+            return self.costs[n]*SQRT2
+        return self.costs[n]
+
+    # selects the heuristic (heuristics.HEURISTICS name, None/AUTO for the one that fits the neighbour mode)
+    # and the tie-breaking policy (heuristics.TIE_BREAKING) of an informed search, before its first step
+    def setHeuristic(self,name=None,tieBreaking=TIE_FIFO):
+        if tieBreaking not in heuristics.TIE_BREAKING:
+            raise ValueError("unknown tie-breaking policy '%s'" % tieBreaking)
+        self.heuristicName, self.heuristicFunction = heuristics.resolve(name,self.diagonal)
+        self.tieBreaking = tieBreaking
+
+    # suboptimality bound of a bounded search (at least 1), before its first step
+    def setEpsilon(self,epsilon):
+        if epsilon < 1:
+            raise ValueError("epsilon must be at least 1")
+        self.epsilon = epsilon
+
+    # estimated cost between two nodes (selected heuristic)
+    def distance(self,a,b):
+        (ax,ay), (bx,by) = self.grid.coords(a), self.grid.coords(b)
+        return self.heuristicFunction(abs(ax-bx),abs(ay-by))
 
 # STACK DFS
 class DepthFirstSearchStack(PathFindingAlgorithm):
@@ -146,9 +175,10 @@ class DepthFirstSearchStack(PathFindingAlgorithm):
     info = '''This is a stack based implementation of DFS (rather than recursive) and, as such,
     more steps have to be performed to respect node discovery order.
     This results in 'ghost' steps, where the popped node has already been visited.'''
+    frontiers = ("stack",)
 
-    def __init__(self, queue: Queue, app, grid: Grid, speed, diagonal: bool, stepOnce: bool):
-        super().__init__(queue, app, grid, speed, diagonal, stepOnce)
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
         self.stack = [self.origin]
 
     def isEmpty(self) -> bool:
@@ -156,21 +186,20 @@ class DepthFirstSearchStack(PathFindingAlgorithm):
 
     def step(self) -> bool:
         node = self.stack.pop()
-        if node.state != VISITED:
+        if self.marks[node] != VISITED:
             self.visited += 1
         super().step()
-        if node.state == VISITED:
+        if self.marks[node] == VISITED:
             return False
-        node.visited()
+        self.mark(node,VISITED)
         if node == self.destination:
             return True
         # get neigbhours
-        neighbours = self.getNeighbours(node)
-        neighbours.reverse() # for order consistency
+        neighbours = reversed(self.getNeighbours(node)) # for order consistency
         selectedNeighbours = []
         # add path
         for n in neighbours:
-            if n.state != VISITED:
+            if self.marks[n] != VISITED:
                 selectedNeighbours.append(n)
                 self.path[n] = node
         # push to stack
@@ -186,7 +215,7 @@ class DepthFirstSearchStack(PathFindingAlgorithm):
         # get path
         recPath = list()
         node = self.dfsPath.get(self.destination)
-        while(node):
+        while(node is not None):
             recPath.append(node)
             node = self.dfsPath.get(node)
         if recPath:
@@ -206,8 +235,10 @@ class DepthFirstSearchStack(PathFindingAlgorithm):
 # STACK DFS ALT - less efficient version (more 'ghost' steps)
 class DepthFirstSearchStackAlt(PathFindingAlgorithm):
 
-    def __init__(self, queue: Queue, app, grid: Grid, speed, diagonal: bool, stepOnce: bool):
-        super().__init__(queue, app, grid, speed, diagonal, stepOnce)
+    frontiers = ("stack",)
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
         self.stack = [self.origin]
 
     def isEmpty(self) -> bool:
@@ -216,19 +247,19 @@ class DepthFirstSearchStackAlt(PathFindingAlgorithm):
     def step(self) -> bool:
         #print(DepthFirstSearch.__mro__)
         node = self.stack.pop()
-        if node.state != VISITED:
+        if self.marks[node] != VISITED:
             self.visited += 1
         super().step()
-        if node.state == VISITED:
+        if self.marks[node] == VISITED:
             return False
-        node.visited()
+        self.mark(node,VISITED)
         if node == self.destination:
             return True
         # get neigbhours
         neighbours = self.getNeighbours(node)
         # add path
         for n in neighbours:
-            if n.state != VISITED:
+            if self.marks[n] != VISITED:
                 self.path[n] = node
         # push to stack
         self.stack += neighbours
@@ -236,8 +267,11 @@ class DepthFirstSearchStackAlt(PathFindingAlgorithm):
 
 class BreadthFirstSearch(PathFindingAlgorithm):
 
-    def __init__(self, queue: Queue, app, grid: Grid, speed, diagonal: bool, stepOnce: bool):
-        super().__init__(queue, app, grid, speed, diagonal, stepOnce)
+    optimal = True
+    frontiers = ("queue",)
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
         self.queue = Queue()
         self.queue.put(self.origin)
 
@@ -248,105 +282,844 @@ class BreadthFirstSearch(PathFindingAlgorithm):
         self.visited += 1
         super().step()
         node = self.queue.get()
-        node.visited()
+        self.mark(node,VISITED)
         if node == self.destination:
             return True
         # get neigbhours
         neighbours = self.getNeighbours(node)
         # add to queue and path
         for n in neighbours:
-            if n.state != DISCOVERED and n.state != VISITED:
+            if self.marks[n] != DISCOVERED and self.marks[n] != VISITED:
                 self.queue.put(n)
-                n.discovered()
+                self.mark(n,DISCOVERED)
                 self.path[n] = node
         return False
 
-# Implemented using a List with nodes (not ideal, but is good enough for this exercise).
-# It adds neighbour nodes to the the List at each iteration (like A*) rather than
+# Implemented using a bucket queue (frontier.BucketQueue, Dial's algorithm): move costs are small
+# (terrain cost, times sqrt(2) diagonally), so pushes and pops are O(1) instead of a heap's O(log n).
+# It adds neighbour nodes to the the queue at each iteration (like A*) rather than
 # adding all the nodes at initialization. This was mainly done to prevent the
 # search to reach disconnected nodes.
 class Dijkstra(PathFindingAlgorithm):
 
-    info = """Note that BFS is equivalent to Dijkstra in this demonstration.
-    This is because the distance from a node to its neighbours is uniform."""
+    info = """Uses the terrain costs (and sqrt(2) for diagonal moves), BFS only counts moves.
+    On a map without terrain and 4 neighbours both find the same path."""
+    optimal = True
+    weighted = True
 
-    def __init__(self, queue: Queue, app, grid: Grid, speed, diagonal: bool, stepOnce: bool):
-        super().__init__(queue, app, grid, speed, diagonal, stepOnce)
-        self.list = list()
-        self.distances = dict()
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        self.list = BucketQueue(self.grid.maxCost()*(SQRT2 if diagonal else 1)) # by distance
+        self.distances = searchdata.acquire(grid) # inf until set, no pass over every cell
         #self.path = dict()
-        for x in self.grid.state.values():
-            for n in x.values():
-                if n.state != BLOCKED:
-                    self.distances[n] = MAX_DISTANCE
-        self.list.append(self.origin)
+        self.list.push(self.origin,0)
         self.distances[self.origin] = 0
 
+    def finish(self):
+        if self.distances is not None:
+            searchdata.release(self.grid,self.distances)
+            self.distances = None
+
     def isEmpty(self) -> bool:
         return not self.list
 
     def step(self) -> bool:
         self.visited += 1
         super().step()
-        self.list.sort(key = lambda x: self.distances[x]) # sort list by distance
-        node = self.list.pop(0)
-        node.visited()
+        node = self.list.pop()
+        self.mark(node,VISITED)
         if node == self.destination:
             return True
+        values, stamps, generation = self.distances.values, self.distances.stamps, self.distances.generation
         for n in self.getNeighbours(node):
-            distance = self.distances[node] + 1
-            if (distance < self.distances[n]):
-                self.distances[n] = distance
+            distance = values[node] + self.moveCost(node,n)
+            if stamps[n] != generation or distance < values[n]: # not reached yet (inf) or shorter
+                values[n] = distance
+                stamps[n] = generation
                 self.path[n] = node
                 if n not in self.list:
-                    n.discovered()
-                    self.list.append(n)
+                    self.mark(n,DISCOVERED)
+                self.list.push(n,distance)
         return False
 
 class A_Star(PathFindingAlgorithm):
 
     name = "A*"
-    info = """The heuristic is the manhattan distance from the current node
-    to the target (B)."""
+    info = """The heuristic is the manhattan distance (octile distance with diagonals)
+    from the current node to the target (B), unless another one is selected."""
+    optimal = True # with the default heuristic
+    weighted = True
+    informed = True
 
-    def __init__(self, queue: Queue, app, grid: Grid, speed, diagonal: bool, stepOnce: bool):
-        super().__init__(queue, app, grid, speed, diagonal, stepOnce)
-        self.list = list()
-        self.distances = dict()
-        self.heuristicCost = dict()
-        for x in self.grid.state.values():
-            for n in x.values():
-                if n.state != BLOCKED:
-                    self.distances[n] = MAX_DISTANCE
-                    self.heuristicCost[n] = MAX_DISTANCE
-                    #self.list.append(n)
-        self.list.append(self.origin)
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        self.list = PriorityQueue() # by distance+heuristic
+        self.distances = searchdata.acquire(grid) # inf until set, no pass over every cell
+        self.heuristicCost = dict() # f of the reached nodes
+        self.list.push(self.origin,self.key(0,0))
         self.distances[self.origin] = 0
         self.heuristicCost[self.origin] = 0 #self.heuristic(self.origin)
 
+    def setHeuristic(self,name=None,tieBreaking=TIE_FIFO):
+        super().setHeuristic(name,tieBreaking)
+        self.list = PriorityQueue() # the origin again, with the same kind of key as the nodes pushed from now on
+        self.list.push(self.origin,self.key(0,0))
+
+    def finish(self):
+        if self.distances is not None:
+            searchdata.release(self.grid,self.distances)
+            self.distances = None
+
     def isEmpty(self) -> bool:
         return not self.list
 
-    # manhattan distance from a node to the target
+    # selected heuristic from a node to the target
     def heuristic(self,node):
-        return abs(node.x-self.destination.x) + abs(node.y-self.destination.y)
+        return self.distance(node,self.destination)
+
+    # frontier priority: f = g+h, ties broken by the tie-breaking policy
+    def key(self,g,h):
+        if self.tieBreaking == TIE_HIGH_G:
+            return (g+h,-g)
+        elif self.tieBreaking == TIE_LOW_H:
+            return (g+h,h)
+        return g+h
+
+    # nodes that can still be expanded (their g+h bounds the shortest path cost from below)
+    def openNodes(self):
+        return self.list.entries.keys()
+
+    # cost of the path to the target found so far over the lowest g+h of the open nodes (at most the shortest
+    # path cost with an admissible heuristic), epsilon once a bounded search finished
+    def bound(self):
+        if self.distances is None or self.destination not in self.distances or not heuristics.admissible(self.heuristicName,self.diagonal):
+            return None
+        if self.finished and self.optimal:
+            return 1.0
+        cost = self.distances[self.destination]
+        lower = min(cost,min((self.heuristicCost[n] for n in self.openNodes()),default=cost))
+        if cost == 0:
+            return 1.0
+        if lower <= 0:
+            return None
+        bound = max(1.0,cost/lower)
+        if self.finished and self.bounded:
+            bound = min(bound,self.epsilon)
+        return bound
 
     def step(self) -> bool:
         self.visited += 1
         super().step()
-        self.list.sort(key = lambda x: self.heuristicCost[x]) # sort list by distance+heuristic
-        node = self.list.pop(0)
-        node.visited()
+        node = self.list.pop()
+        self.mark(node,VISITED)
+        if node == self.destination:
+            return True
+        values, stamps, generation = self.distances.values, self.distances.stamps, self.distances.generation
+        for n in self.getNeighbours(node):
+            distance = values[node] + self.moveCost(node,n)
+            if stamps[n] != generation or distance < values[n]: # not reached yet (inf) or shorter
+                h = self.heuristic(n)
+                values[n] = distance
+                stamps[n] = generation
+                self.heuristicCost[n] = distance + h
+                self.path[n] = node
+                if n not in self.list:
+                    #if self.marks[n] != DISCOVERED and self.marks[n] != VISITED:
+                    self.mark(n,DISCOVERED)
+                self.list.push(n,self.key(distance,h))
+        return False
+
+# A* with landmark (ALT) lower bounds, precomputed per grid and neighbour mode (see landmarks.py)
+class ALT_Star(A_Star):
+
+    name = "A* (ALT)"
+    info = """The heuristic is the best landmark lower bound |d(L,B)-d(L,n)|
+    (move counts precomputed from a few landmark cells) or the selected heuristic (manhattan/octile)."""
+    optimal = True
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        tables = landmarks.getTables(grid,diagonal)
+        self.tables = [(table,table[self.destination]) for table in tables.tables if table[self.destination] != landmarks.UNREACHABLE]
+
+    @classmethod
+    def prepare(cls,grid: GridModel,diagonal: bool):
+        super().prepare(grid,diagonal)
+        landmarks.getTables(grid,diagonal)
+
+    # move counts are lower bounds of the costs too (every move costs at least 1)
+    def heuristic(self,node):
+        best = self.distance(node,self.destination)
+        for table,target in self.tables:
+            distance = table[node]
+            if distance != landmarks.UNREACHABLE and abs(target-distance) > best:
+                best = abs(target-distance)
+        return best
+
+# weighted A*: f = g + epsilon*h, greedier than A* (fewer expansions) with a path at most epsilon times the shortest
+class WeightedA_Star(A_Star):
+
+    name = "Weighted A*"
+    info = """The heuristic is weighted by epsilon (f = g + ε·h): fewer expansions than A*
+    and a path that costs at most ε times the shortest one."""
+    optimal = False
+    bounded = True
+    epsilon = EPSILON
+
+    def key(self,g,h):
+        return super().key(g,self.epsilon*h)
+
+# anytime repairing A* (Likhachev et al.): a weighted A* solution first, then better ones with a lower epsilon,
+# reusing the previous search: the nodes improved after their expansion wait in incons (not reopened) and go back
+# to the open list with the others, re-prioritised, when epsilon is lowered
+# stopped early (budget), the best path so far comes with its proven bound
+class ARA_Star(WeightedA_Star):
+
+    name = "ARA*"
+    info = """Finds a path with ε-weighted A*, then improves it with a lower ε (by %g)
+    until the path is proven shortest (ε = 1). Stopped early, it has the best path so far.""" % ARA_EPSILON_STEP
+    optimal = True
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        self.closed = set() # expanded with the current epsilon
+        self.incons = set() # closed nodes improved with the current epsilon
+        self.solutionEpsilon = None # epsilon of the last solution
+
+    def isEmpty(self) -> bool:
+        return not self.list and self.destination not in self.distances
+
+    def openNodes(self):
+        return list(self.list.entries.keys()) + list(self.incons)
+
+    def bound(self):
+        bound = super().bound()
+        if bound is not None and self.solutionEpsilon is not None:
+            bound = min(bound,self.solutionEpsilon)
+        return bound
+
+    def step(self) -> bool:
+        PathFindingAlgorithm.step(self)
+        if self.destination in self.distances: # solution with the current epsilon once no open node can improve it
+            priority = self.list.peek()
+            if priority is None or self.key(self.distances[self.destination],0) <= priority:
+                return self.improve()
+        self.visited += 1
+        node = self.list.pop()
+        self.closed.add(node)
+        self.mark(node,VISITED)
+        values, stamps, generation = self.distances.values, self.distances.stamps, self.distances.generation
+        for n in self.getNeighbours(node):
+            distance = values[node] + self.moveCost(node,n)
+            if stamps[n] != generation or distance < values[n]: # not reached yet (inf) or shorter
+                h = self.heuristic(n)
+                values[n] = distance
+                stamps[n] = generation
+                self.heuristicCost[n] = distance + h
+                self.path[n] = node
+                if n in self.closed:
+                    self.incons.add(n)
+                else:
+                    if n not in self.list:
+                        self.mark(n,DISCOVERED)
+                    self.list.push(n,self.key(distance,h))
+        return False
+
+    # reports the solution of the current epsilon, returns True if it's the shortest path
+    # otherwise lowers epsilon and starts the next search from the open and inconsistent nodes
+    def improve(self) -> bool:
+        self.solutionEpsilon = self.epsilon
+        bound = self.bound()
+        if self.app:
+            self.app.onSolution(bound)
+        if self.epsilon <= 1 or (bound is not None and bound <= 1):
+            return True
+        self.epsilon = max(1.0,self.epsilon-ARA_EPSILON_STEP)
+        values = self.distances.values
+        for n in self.openNodes():
+            self.list.push(n,self.key(values[n],self.heuristic(n)))
+        self.closed.clear()
+        self.incons.clear()
+        return False
+
+# focal search (A*_epsilon, Pearl and Kim): expands the node closest to the target among the open nodes whose f is
+# within epsilon of the lowest f (the focal list), the path costs at most epsilon times the shortest one
+# open nodes are either in focal (by h) or pending (by f), pending ones join focal when the lowest f grows
+class FocalSearch(A_Star):
+
+    name = "Focal Search"
+    info = """Expands the open node closest to the target (B) among those with f <= ε·(lowest f):
+    a path that costs at most ε times the shortest one, the tie-breaking policy is not used."""
+    optimal = False
+    bounded = True
+    epsilon = EPSILON
+    frontiers = ("list","focal","pending")
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        self.focal = PriorityQueue() # open nodes with f <= epsilon*(lowest f), by h then deepest
+        self.pending = PriorityQueue() # the other open nodes, by f
+        self.focal.push(self.origin,(0,0))
+
+    # open list by f only (focal orders the nodes)
+    def key(self,g,h):
+        return g+h
+
+    def step(self) -> bool:
+        self.visited += 1
+        PathFindingAlgorithm.step(self)
+        limit = self.epsilon*self.list.peek()
+        values, stamps, generation = self.distances.values, self.distances.stamps, self.distances.generation
+        while self.pending and self.pending.peek() <= limit:
+            n = self.pending.pop()
+            self.focal.push(n,(self.heuristic(n),-values[n]))
+        node = self.focal.pop()
+        self.list.remove(node)
+        self.mark(node,VISITED)
         if node == self.destination:
             return True
         for n in self.getNeighbours(node):
-            distance = self.distances[node] + 1
-            if (distance < self.distances[n]):
+            distance = values[node] + self.moveCost(node,n)
+            if stamps[n] != generation or distance < values[n]: # not reached yet (inf) or shorter
+                h = self.heuristic(n)
+                values[n] = distance
+                stamps[n] = generation
+                self.heuristicCost[n] = distance + h
+                self.path[n] = node
+                if n not in self.list:
+                    self.mark(n,DISCOVERED)
+                self.list.push(n,distance+h)
+                if n in self.focal or distance+h <= limit:
+                    if n in self.pending:
+                        self.pending.remove(n)
+                    self.focal.push(n,(h,-distance))
+                else:
+                    self.pending.push(n,distance+h)
+        return False
+
+LPA_CACHE = "lpa" # GridModel.caches key of the grid's LPAStarState
+
+# persistent LPA* search data for a grid, origin, destination and neighbour mode
+# listens to the grid's edits and keeps the cells whose edges changed until the next run
+class LPAStarState:
+    def __init__(self,grid: GridModel,origin,destination,diagonal: bool):
+        self.grid = grid
+        self.origin = origin
+        self.destination = destination
+        self.diagonal = diagonal
+        self.g = dict() # cost estimates (inf if missing)
+        self.rhs = dict() # one-step lookahead costs (inf if missing)
+        self.list = PriorityQueue() # locally inconsistent nodes by key
+        self.changed = list() # cells blocked/unblocked since the last update
+        self.version = grid.version
+        self.rhs[origin] = 0
+        grid.listeners.append(self)
+
+    def detach(self):
+        if self in self.grid.listeners:
+            self.grid.listeners.remove(self)
+
+    # GridModel listener
+    def onGridEdited(self,grid: GridModel,id,previous,previousHash):
+        self.version = grid.version
+        if previous == BLOCKED or grid.cells[id] == BLOCKED:
+            self.changed.append(id)
+
+# Lifelong Planning A* (incremental A*)
+# g/rhs values are kept between runs (LPAStarState), after obstacle changes only the
+# affected nodes are updated and expanded again
+class LPA_Star(PathFindingAlgorithm):
+
+    name = "LPA*"
+    info = """Keeps its search data between runs (same start, end and mode).
+    After blocking/unblocking cells only the affected region is searched again."""
+    optimal = True
+    frontiers = ("lpa.list",)
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        state = grid.caches.get(LPA_CACHE)
+        fresh = state is None or state.origin != self.origin or state.destination != self.destination or state.diagonal != diagonal or state.version != grid.version
+        if fresh:
+            if state is not None:
+                state.detach()
+            state = LPAStarState(grid,self.origin,self.destination,diagonal)
+            grid.caches[LPA_CACHE] = state
+        self.lpa = state
+        if fresh:
+            state.list.push(self.origin,self.key(self.origin))
+        # edits since the previous run are applied by the first step (see isEmpty), once the view is set
+
+    # drops the search data kept for a grid (next run starts from scratch)
+    @staticmethod
+    def forget(grid: GridModel):
+        state = grid.caches.pop(LPA_CACHE,None)
+        if state is not None:
+            state.detach()
+
+    # consistent heuristic: manhattan distance (4 neighbours), chebyshev distance (8 neighbours)
+    def heuristic(self,node):
+        x,y = self.grid.coords(node)
+        dx,dy = self.grid.coords(self.destination)
+        if self.lpa.diagonal:
+            return max(abs(x-dx),abs(y-dy))
+        return abs(x-dx) + abs(y-dy)
+
+    def key(self,node) -> tuple:
+        g = min(self.lpa.g.get(node,inf),self.lpa.rhs.get(node,inf))
+        return (g+self.heuristic(node),g)
+
+    def updateVertex(self,node):
+        g, rhs = self.lpa.g, self.lpa.rhs
+        if node != self.origin:
+            best = inf
+            if self.grid.cells[node] != BLOCKED:
+                for n in self.getNeighbours(node):
+                    distance = g.get(n,inf) + 1
+                    if distance < best:
+                        best = distance
+            rhs[node] = best
+        if g.get(node,inf) != rhs.get(node,inf):
+            if node not in self.lpa.list:
+                self.mark(node,DISCOVERED)
+            self.lpa.list.push(node,self.key(node))
+        elif node in self.lpa.list:
+            self.lpa.list.remove(node)
+
+    # applies the blocked/unblocked cells since the last update
+    def update(self):
+        changed = self.lpa.changed
+        self.lpa.changed = list()
+        for cell in changed:
+            self.updateVertex(cell)
+            x,y = self.grid.coords(cell)
+            for dir in self.neighboursOrder:
+                n = self.grid.get(x+dir[0],y+dir[1])
+                if n is not None:
+                    self.updateVertex(n)
+
+    def isEmpty(self) -> bool:
+        if self.lpa.changed:
+            return False
+        top = self.lpa.list.peek()
+        if top is None:
+            return True
+        return not (top < self.key(self.destination) or self.lpa.rhs.get(self.destination,inf) != self.lpa.g.get(self.destination,inf))
+
+    def step(self) -> bool:
+        self.update()
+        if self.lpa.list.peek() is None:
+            return True
+        self.visited += 1
+        super().step()
+        g, rhs = self.lpa.g, self.lpa.rhs
+        node = self.lpa.list.pop()
+        self.mark(node,VISITED)
+        if g.get(node,inf) > rhs.get(node,inf):
+            g[node] = rhs[node]
+        else:
+            g[node] = inf
+            self.updateVertex(node)
+        for n in self.getNeighbours(node):
+            self.updateVertex(n)
+        return self.isEmpty()
+
+    # follows the neighbours with the lowest cost estimate back from the destination
+    def getPath(self) -> list:
+        g = self.lpa.g
+        self.path = dict()
+        node = self.destination
+        if g.get(node,inf) == inf:
+            return list()
+        while node != self.origin:
+            best, distance = None, inf
+            for n in self.getNeighbours(node):
+                if g.get(n,inf) < distance and n not in self.path:
+                    best, distance = n, g[n]
+            if best is None:
+                return list()
+            self.path[node] = best
+            node = best
+        return super().getPath()
+
+# Jump Point Search (A* that skips symmetric paths on uniform-cost grids)
+# neighbours are pruned by the direction of travel and straight/diagonal lines are scanned
+# ("jumps") until a forced neighbour or the target is found, only those jump points enter the open list
+# 8 neighbours: diagonal moves cost sqrt(2) (the pruning rules assume octile costs), corners can be cut like in getNeighbours
+# 4 neighbours: vertical jumps also look for horizontal jump points
+class JumpPointSearch(PathFindingAlgorithm):
+
+    name = "JPS"
+    info = """Only jump points (cells with forced neighbours) are added to the list.
+    With diagonal search, diagonal moves cost sqrt(2)."""
+    optimal = True
+    neighbourMethods = ("prunedNeighbours","jump")
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        self.diagonal = diagonal
+        self.target = self.grid.coords(self.destination)
+        self.list = PriorityQueue() # by distance+heuristic
+        self.distances = dict()
+        self.list.push(self.origin,0)
+        self.distances[self.origin] = 0
+
+    def isEmpty(self) -> bool:
+        return not self.list
+
+    # octile (8 neighbours) or manhattan (4 neighbours) distance between two cells
+    def cost(self,x,y,tx,ty):
+        dx, dy = abs(tx-x), abs(ty-y)
+        if self.diagonal:
+            return SQRT2*min(dx,dy) + abs(dx-dy)
+        return dx + dy
+
+    def heuristic(self,node):
+        x,y = self.grid.coords(node)
+        return self.cost(x,y,*self.target)
+
+    def walkable(self,x,y) -> bool:
+        node = self.grid.get(x,y)
+        return node is not None and self.grid.cells[node] != BLOCKED
+
+    def step(self) -> bool:
+        self.visited += 1
+        super().step()
+        node = self.list.pop()
+        self.mark(node,VISITED)
+        if node == self.destination:
+            return True
+        x,y = self.grid.coords(node)
+        for nx,ny in self.prunedNeighbours(node,x,y):
+            jumpPoint = self.jump(nx,ny,x,y)
+            if jumpPoint is None:
+                continue
+            n = self.grid.get(*jumpPoint)
+            if self.marks[n] == VISITED:
+                continue
+            distance = self.distances[node] + self.cost(x,y,*jumpPoint)
+            if distance < self.distances.get(n,inf):
                 self.distances[n] = distance
-                self.heuristicCost[n] = distance + self.heuristic(n)
                 self.path[n] = node
                 if n not in self.list:
-                    #if n.state != DISCOVERED and n.state != VISITED:
-                    n.discovered()
-                    self.list.append(n)
-        return False
\ No newline at end of file
+                    self.mark(n,DISCOVERED)
+                self.list.push(n,distance + self.heuristic(n))
+        return False
+
+    # neighbours worth jumping to, given the direction the node was reached from
+    def prunedNeighbours(self,node,x,y) -> list:
+        parent = self.path.get(node)
+        if parent is None: # origin
+            return [(x+dir[0],y+dir[1]) for dir in self.neighboursOrder if self.walkable(x+dir[0],y+dir[1])]
+        px,py = self.grid.coords(parent)
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        w = self.walkable
+        neighbours = list()
+        if not self.diagonal:
+            if dx:
+                candidates = [(x,y-1),(x,y+1),(x+dx,y)]
+            else:
+                candidates = [(x-1,y),(x+1,y),(x,y+dy)]
+            return [n for n in candidates if w(*n)]
+        if dx and dy:
+            if w(x,y+dy): neighbours.append((x,y+dy))
+            if w(x+dx,y): neighbours.append((x+dx,y))
+            if w(x+dx,y+dy): neighbours.append((x+dx,y+dy))
+            if not w(x-dx,y): neighbours.append((x-dx,y+dy))
+            if not w(x,y-dy): neighbours.append((x+dx,y-dy))
+        elif dx:
+            if w(x+dx,y): neighbours.append((x+dx,y))
+            if not w(x,y+1): neighbours.append((x+dx,y+1))
+            if not w(x,y-1): neighbours.append((x+dx,y-1))
+        else:
+            if w(x,y+dy): neighbours.append((x,y+dy))
+            if not w(x+1,y): neighbours.append((x+1,y+dy))
+            if not w(x-1,y): neighbours.append((x-1,y+dy))
+        return neighbours
+
+    # scans from (x,y) in the direction away from (px,py), returns the first jump point (or None)
+    def jump(self,x,y,px,py):
+        dx, dy = x-px, y-py
+        w = self.walkable
+        while True:
+            if not w(x,y):
+                return None
+            if (x,y) == self.target:
+                return (x,y)
+            if self.diagonal:
+                if dx and dy:
+                    if (w(x-dx,y+dy) and not w(x-dx,y)) or (w(x+dx,y-dy) and not w(x,y-dy)):
+                        return (x,y)
+                    if self.jump(x+dx,y,x,y) is not None or self.jump(x,y+dy,x,y) is not None:
+                        return (x,y)
+                elif dx:
+                    if (w(x+dx,y+1) and not w(x,y+1)) or (w(x+dx,y-1) and not w(x,y-1)):
+                        return (x,y)
+                else:
+                    if (w(x+1,y+dy) and not w(x+1,y)) or (w(x-1,y+dy) and not w(x-1,y)):
+                        return (x,y)
+            elif dx:
+                if (w(x,y-1) and not w(x-dx,y-1)) or (w(x,y+1) and not w(x-dx,y+1)):
+                    return (x,y)
+            else:
+                if (w(x-1,y) and not w(x-1,y-dy)) or (w(x+1,y) and not w(x+1,y-dy)):
+                    return (x,y)
+                if self.jump(x+1,y,x,y) is not None or self.jump(x-1,y,x,y) is not None:
+                    return (x,y)
+            x += dx
+            y += dy
+
+    # fills in the cells between consecutive jump points
+    def getPath(self) -> list:
+        cells = dict()
+        node = self.destination
+        while node in self.path:
+            parent = self.path[node]
+            x,y = self.grid.coords(node)
+            px,py = self.grid.coords(parent)
+            dx = (px > x) - (px < x)
+            dy = (py > y) - (py < y)
+            while (x,y) != (px,py):
+                n = self.grid.get(x,y)
+                x += dx
+                y += dy
+                cells[n] = self.grid.get(x,y)
+            node = parent
+        self.path = cells
+        return super().getPath()
+
+# searches forward from the origin and backward from the destination at the same time
+# (bidirectional Dijkstra, the side with the smaller list is expanded)
+# forward keys are distance+potential, backward keys distance-potential; every edge between the
+# two searches is a candidate path and the search stops once the smallest keys of both lists add up to
+# the best candidate, which makes the path optimal
+# self.path holds the forward parents, self.pathBack the backward ones (node -> next node towards the destination)
+class BidirectionalSearch(PathFindingAlgorithm):
+
+    optimal = True
+    frontiers = ("list","listBack")
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        self.diagonal = diagonal
+        self.list = PriorityQueue()
+        self.listBack = PriorityQueue()
+        self.distances = dict()
+        self.distancesBack = dict()
+        self.pathBack = dict()
+        self.best = inf # length of the best path found
+        self.meeting = None # (forward node, backward node) edge of the best path
+        self.distances[self.origin] = 0
+        self.distancesBack[self.destination] = 0
+        self.list.push(self.origin,self.potential(self.origin))
+        self.listBack.push(self.destination,-self.potential(self.destination))
+
+    # node potential, 0 for a plain bidirectional BFS/Dijkstra
+    def potential(self,node):
+        return 0
+
+    def isEmpty(self) -> bool:
+        if self.origin == self.destination or not self.list or not self.listBack:
+            return True
+        return self.list.peek() + self.listBack.peek() >= self.best
+
+    def step(self) -> bool:
+        self.visited += 1
+        super().step()
+        if len(self.list) <= len(self.listBack):
+            self.expand(self.list,self.distances,self.path,self.distancesBack,1)
+        else:
+            self.expand(self.listBack,self.distancesBack,self.pathBack,self.distances,-1)
+        return self.isEmpty()
+
+    # expands the first node of one side (sign: 1 forward, -1 backward)
+    def expand(self,list,distances,parents,otherDistances,sign):
+        node = list.pop()
+        self.mark(node,VISITED)
+        for n in self.getNeighbours(node):
+            distance = distances[node] + 1
+            if distance < distances.get(n,inf):
+                distances[n] = distance
+                parents[n] = node
+                if n not in list and self.marks[n] != VISITED:
+                    self.mark(n,DISCOVERED)
+                list.push(n,distance + sign*self.potential(n))
+            if n in otherDistances and distance + otherDistances[n] < self.best:
+                self.best = distance + otherDistances[n]
+                self.meeting = (node,n) if sign > 0 else (n,node)
+
+    # stitches the forward parents up to the meeting edge and the backward parents after it
+    def getPath(self) -> list:
+        if self.meeting is None:
+            return list()
+        parent, node = self.meeting
+        while node is not None:
+            self.path[node] = parent
+            parent, node = node, self.pathBack.get(node)
+        return super().getPath()
+
+class BidirectionalBFS(BidirectionalSearch):
+
+    name = "Bidirectional BFS"
+    info = """Two breadth first searches, one from A and one from B.
+    The path is complete when the two searches meet."""
+
+class BidirectionalA_Star(BidirectionalSearch):
+
+    name = "Bidirectional A*"
+    info = """Two A* searches (A to B and B to A) using the average of both heuristics,
+    manhattan distance (or chebyshev distance with diagonal search)."""
+
+    def heuristic(self,node,target):
+        x,y = self.grid.coords(node)
+        tx,ty = self.grid.coords(target)
+        if self.diagonal:
+            return max(abs(x-tx),abs(y-ty))
+        return abs(x-tx) + abs(y-ty)
+
+    # average potential, consistent for both directions
+    def potential(self,node):
+        return (self.heuristic(node,self.destination) - self.heuristic(node,self.origin))/2
+
+# Hierarchical A* (HPA*)
+# searches the abstract graph of cluster transitions (hpa.ClusterGraph, built once per grid and
+# neighbour mode, rebuilt per cluster after edits) and refines the chosen edges inside their clusters
+# paths are near optimal
+class HPA_Star(PathFindingAlgorithm):
+
+    name = "HPA*"
+    info = """Searches a precomputed graph of cluster entrances (visited cells),
+    then refines the chosen edges inside their clusters. Paths are near optimal."""
+    neighbourMethods = ("graph.neighbours",)
+
+    @classmethod
+    def prepare(cls,grid: GridModel,diagonal: bool):
+        super().prepare(grid,diagonal)
+        hpa.getGraph(grid,diagonal)
+
+    def __init__(self, control: SearchControl, app, grid: GridModel, speed, diagonal: bool, stepOnce: bool, origin=None, destination=None):
+        super().__init__(control, app, grid, speed, diagonal, stepOnce, origin, destination)
+        self.diagonal = diagonal
+        self.graph = hpa.getGraph(grid,diagonal)
+        self.list = PriorityQueue() # by distance+heuristic
+        self.distances = dict()
+        # connect the origin and the destination to the transitions of their clusters
+        cluster = self.graph.clusterOf(self.origin)
+        distances = self.graph.search(self.origin,cluster)[0]
+        targets = self.graph.nodes[cluster] | {self.destination}
+        self.startEdges = [(n,distances[n]) for n in targets if n in distances and n != self.origin]
+        self.startEdges += self.graph.inter.get(self.origin,dict()).items()
+        cluster = self.graph.clusterOf(self.destination)
+        distances = self.graph.search(self.destination,cluster)[0]
+        self.endEdges = {n: distances[n] for n in self.graph.nodes[cluster] if n in distances and n != self.destination}
+        self.list.push(self.origin,0)
+        self.distances[self.origin] = 0
+
+    def isEmpty(self) -> bool:
+        return not self.list
+
+    def heuristic(self,node):
+        x,y = self.grid.coords(node)
+        dx,dy = self.grid.coords(self.destination)
+        if self.diagonal:
+            return max(abs(x-dx),abs(y-dy))
+        return abs(x-dx) + abs(y-dy)
+
+    def step(self) -> bool:
+        self.visited += 1
+        super().step()
+        node = self.list.pop()
+        self.mark(node,VISITED)
+        if node == self.destination:
+            return True
+        edges = self.startEdges if node == self.origin else self.graph.neighbours(node)
+        if node in self.endEdges:
+            edges = edges + [(self.destination,self.endEdges[node])]
+        for n,cost in edges:
+            distance = self.distances[node] + cost
+            if distance < self.distances.get(n,inf):
+                self.distances[n] = distance
+                self.path[n] = node
+                if n not in self.list and self.marks[n] != VISITED:
+                    self.mark(n,DISCOVERED)
+                self.list.push(n,distance + self.heuristic(n))
+        return False
+
+    # refines the abstract path into cells
+    def getPath(self) -> list:
+        nodes = [self.destination]
+        while nodes[-1] in self.path:
+            nodes.append(self.path[nodes[-1]])
+        if len(nodes) == 1:
+            return list()
+        nodes.reverse()
+        cells = [self.origin]
+        for n in range(1,len(nodes)):
+            segment = self.graph.refine(nodes[n-1],nodes[n],self.graph.clusterOf(nodes[n-1]))
+            if segment is None:
+                return list()
+            # cut loops where a segment crosses an earlier one
+            for cell in segment[1:]:
+                if cell in cells:
+                    del cells[cells.index(cell)+1:]
+                else:
+                    cells.append(cell)
+        self.path = {cells[n]: cells[n-1] for n in range(1,len(cells))}
+        return super().getPath()
+
+# algorithms shown in the UI and used by the benchmark
+ALGORITHMS = [DepthFirstSearchStack,BreadthFirstSearch,Dijkstra,A_Star,ALT_Star,WeightedA_Star,ARA_Star,FocalSearch,LPA_Star,JumpPointSearch,BidirectionalBFS,BidirectionalA_Star,HPA_Star]
+
+# result of a synchronous search (see solve)
+class SearchResult:
+    def __init__(self,algorithm,path,iterations,visited,time,marks,profile=None,bound=None,complete=True):
+        self.algorithm = algorithm # algorithm class
+        self.path = path # list of cell ids from origin to destination, empty if not found
+        self.iterations = iterations
+        self.visited = visited
+        self.time = time # wall time in seconds
+        self.marks = marks # search state per cell (DISCOVERED/VISITED/PATH)
+        self.profile = profile # SearchProfile if requested
+        self.bound = bound # proven suboptimality bound of the path (see PathFindingAlgorithm.bound), None if unknown
+        self.complete = complete # False if the budget ran out first (path is the best one so far)
+
+    def __repr__(self) -> str:
+        bound = "" if self.bound is None else ", bound=%.3f" % self.bound
+        return "SearchResult(%s, distance=%d, iterations=%d, visited=%d, time=%.6fs%s%s)" % (self.algorithm.name or self.algorithm.__name__,len(self.path),self.iterations,self.visited,self.time,bound,"" if self.complete else ", incomplete")
+
+# runs an algorithm to completion in the calling thread
+# same step() logic as the threaded run, but no control channel waits and no UI callbacks (unless observed)
+# start/end are cell ids, None for the grid's start/end
+# queries between different components return right away (no path, empty marks)
+# profile: SearchProfile to instrument the search with (see profiling.py)
+# heuristic/tieBreaking: see PathFindingAlgorithm.setHeuristic (informed searches only)
+# epsilon: suboptimality bound of the bounded searches (see PathFindingAlgorithm.setEpsilon)
+# timeLimit (seconds)/maxExpansions: budget, once it runs out the search stops with the best path so far
+# observer: receives the search's view and app callbacks (onCellChanged, onStep, onSolution), e.g. to stream its progress
+def solve(grid: GridModel, start=None, end=None, algorithm=None, diagonal: bool = False, profile: SearchProfile = None, heuristic=None, tieBreaking=TIE_FIFO, epsilon=None, timeLimit=None, maxExpansions=None, observer=None) -> SearchResult:
+    algorithm = algorithm or A_Star
+    startTime = time.perf_counter()
+    if components.unreachable(grid,grid.start if start is None else start,grid.end if end is None else end,diagonal):
+        return SearchResult(algorithm,[],0,0,time.perf_counter()-startTime,bytearray(),profile)
+    alg = algorithm(None,observer,grid,0,diagonal,False,start,end)
+    alg.view = observer
+    if heuristic is not None or tieBreaking != TIE_FIFO:
+        alg.setHeuristic(heuristic,tieBreaking)
+    if epsilon is not None:
+        alg.setEpsilon(epsilon)
+    if profile is not None:
+        alg.instrument(profile)
+    deadline = None if timeLimit is None else startTime+timeLimit
+    while True:
+        if alg.isEmpty() or alg.step():
+            alg.finished = True
+            break
+        if (maxExpansions is not None and alg.visited >= maxExpansions) or (deadline is not None and time.perf_counter() >= deadline):
+            break
+    path = alg.getPath()
+    bound = alg.bound() if path else None
+    alg.finish()
+    if profile is not None:
+        profile.detach()
+    return SearchResult(algorithm,path,alg.iterations,alg.visited,time.perf_counter()-startTime,alg.marks,profile,bound,alg.finished)
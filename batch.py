@@ -0,0 +1,56 @@
+# batch queries: many (start, end) searches on the same grid, spread over worker processes
+# the grid's cells (followed by its terrain costs) are placed once in shared memory, workers attach to it instead of receiving a copy per task
+from algorithms import *
+from model import *
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+CHUNK_SIZE = 16 # queries per task
+
+# worker process state (see _attach)
+_shm = None
+_grid = None
+_algorithm = None
+_diagonal = False
+
+def _attach(name,size,start,end,algorithm,diagonal):
+    global _shm, _grid, _algorithm, _diagonal
+    _shm = shared_memory.SharedMemory(name=name) # the parent owns (and unlinks) the block
+    cells = size[0]*size[1]
+    _grid = GridModel(size=size,cells=_shm.buf[:cells],start=start,end=end,costs=_shm.buf[cells:cells*2])
+    _algorithm = algorithm
+    _diagonal = diagonal
+
+# solves a chunk of (index, start, end) queries, returns [(index, path, iterations, visited, time)]
+def _solveChunk(chunk):
+    results = list()
+    for index, start, end in chunk:
+        result = solve(_grid,start,end,_algorithm,_diagonal)
+        results.append((index,result.path,result.iterations,result.visited,result.time))
+    return results
+
+# solves a list of (start, end) cell id queries on a grid with a process pool
+# yields (index, SearchResult) in completion order, index being the query's position in queries
+# SearchResult.marks is None (the per-cell search state stays in the worker)
+def solveBatch(grid: GridModel, queries, algorithm=None, diagonal: bool = False, workers=None, chunkSize=CHUNK_SIZE):
+    algorithm = algorithm or A_Star
+    queries = list(queries)
+    if not queries:
+        return
+    shm = shared_memory.SharedMemory(create=True,size=grid.size*2)
+    try:
+        shm.buf[:grid.size] = grid.cells
+        shm.buf[grid.size:grid.size*2] = grid.costs
+        chunks = [[(i,) + tuple(queries[i]) for i in range(n,min(n+chunkSize,len(queries)))] for n in range(0,len(queries),chunkSize)]
+        with ProcessPoolExecutor(max_workers=workers,initializer=_attach,initargs=(shm.name,grid.dimensions,grid.start,grid.end,algorithm,diagonal)) as executor:
+            futures = [executor.submit(_solveChunk,chunk) for chunk in chunks]
+            try:
+                for future in as_completed(futures):
+                    for index, path, iterations, visited, time in future.result():
+                        yield index, SearchResult(algorithm,path,iterations,visited,time,None)
+            finally:
+                for future in futures:
+                    future.cancel()
+    finally:
+        shm.close()
+        shm.unlink()
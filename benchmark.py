@@ -0,0 +1,178 @@
+# headless benchmark of every algorithm in ALGORITHMS
+# py benchmark.py                          -> table
+# py benchmark.py --json results.json      -> table + machine-readable results
+# py benchmark.py --compare results.json   -> flags regressions against a stored run (exit code 1 if any)
+# py benchmark.py --terrain 9              -> random terrain costs 1..9 on every free cell
+# py benchmark.py --heuristic euclidean --tie-breaking high-g -> heuristic/tie-breaking of the informed searches
+from algorithms import *
+from model import *
+import components
+from adjacency import getAdjacency
+import heuristics
+import argparse
+import json
+import platform
+import random
+import sys
+import tracemalloc
+
+SIZES = [32,64,128]
+DENSITIES = [0.0,0.2,0.35]
+SEED = 1
+REPEAT = 3
+TOLERANCE = 0.25 # allowed nodes/sec drop before flagging a regression
+MAX_ATTEMPTS = 100 # grid re-rolls when looking for a reachable goal
+
+def algorithmName(algorithm) -> str:
+    return algorithm.name or algorithm.__name__
+
+# heuristic name shown for an algorithm ("-" if it doesn't use one)
+def heuristicName(algorithm,diagonal,heuristic=None) -> str:
+    return heuristics.resolve(heuristic,diagonal)[0] if algorithm.informed else "-"
+
+# heuristic of a result entry, entries saved before it was recorded used the default one
+def entryHeuristic(entry) -> str:
+    if "heuristic" in entry:
+        return entry["heuristic"]
+    algorithm = next((a for a in ALGORITHMS if algorithmName(a) == entry["algorithm"]),None)
+    return heuristicName(algorithm,entry["diagonal"]) if algorithm else "-"
+
+# seeded grid generation, start at the top left and end at the bottom right
+# reachable grids are re-rolled (deterministically) until the goal can be reached,
+# unreachable grids have the goal walled off (also for diagonal moves)
+# terrain: highest random terrain cost (DEFAULT_COST everywhere if 1, same obstacles for every terrain)
+def randomGrid(size,density,seed,reachable=True,terrain=DEFAULT_COST) -> GridModel:
+    for attempt in range(MAX_ATTEMPTS):
+        rnd = random.Random("%d-%d-%f-%d" % (seed,size,density,attempt))
+        grid = GridModel(size=(size,size))
+        for id in range(grid.size):
+            if id != grid.start and id != grid.end and rnd.random() < density:
+                grid.cells[id] = BLOCKED
+        if terrain > DEFAULT_COST:
+            for id in range(grid.size):
+                grid.costs[id] = rnd.randint(DEFAULT_COST,terrain)
+        if not reachable:
+            x,y = grid.coords(grid.end)
+            for dir in NEIGHBOURS_ORDER_DIAGONAL:
+                n = grid.get(x+dir[0],y+dir[1])
+                if n is not None and n != grid.start:
+                    grid.cells[n] = BLOCKED
+            return grid
+        if solve(grid,algorithm=BreadthFirstSearch).path:
+            return grid
+    raise RuntimeError("no reachable grid found for size %d, density %.2f" % (size,density))
+
+# every run starts from scratch (incremental algorithms forget their previous search)
+def benchmark(algorithm,grid,diagonal,repeat=REPEAT,memory=True,heuristic=None,tieBreaking=TIE_FIFO) -> dict:
+    forget = getattr(algorithm,"forget",None)
+    best = None
+    for n in range(repeat):
+        if forget:
+            forget(grid)
+        result = solve(grid,algorithm=algorithm,diagonal=diagonal,heuristic=heuristic,tieBreaking=tieBreaking)
+        if best is None or result.time < best.time:
+            best = result
+    peak = None
+    if memory:
+        if forget:
+            forget(grid)
+        tracemalloc.start()
+        solve(grid,algorithm=algorithm,diagonal=diagonal,heuristic=heuristic,tieBreaking=tieBreaking)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if forget:
+            forget(grid)
+    return {
+        "expansions": best.visited,
+        "iterations": best.iterations,
+        "time": best.time,
+        "nodesPerSec": best.visited/best.time if best.time > 0 else 0,
+        "peakMemory": peak,
+        "pathLength": len(best.path),
+        "pathCost": grid.pathCost(best.path)}
+
+def run(algorithms=ALGORITHMS,sizes=SIZES,densities=DENSITIES,seed=SEED,repeat=REPEAT,memory=True,out=sys.stdout,terrain=DEFAULT_COST,heuristic=None,tieBreaking=TIE_FIFO) -> list:
+    results = list()
+    for size in sizes:
+        for density in densities:
+            for reachable in (True,False):
+                grid = randomGrid(size,density,seed,reachable,terrain)
+                for diagonal in (False,True):
+                    components.getIndex(grid,diagonal) # built once per grid, not part of the timings
+                    getAdjacency(grid,diagonal)
+                    for algorithm in algorithms:
+                        entry = {"algorithm": algorithmName(algorithm),"size": size,"density": density,"terrain": terrain,"diagonal": diagonal,"reachable": reachable,
+                            "heuristic": heuristicName(algorithm,diagonal,heuristic),"tieBreaking": tieBreaking if algorithm.informed else "-"}
+                        entry.update(benchmark(algorithm,grid,diagonal,repeat,memory,heuristic,tieBreaking))
+                        results.append(entry)
+                        if out:
+                            printRow(entry,out)
+    return results
+
+COLUMNS = [("algorithm",24,"%s"),("size",6,"%d"),("density",8,"%.2f"),("terrain",8,"%d"),("diagonal",9,"%s"),("reachable",10,"%s"),
+    ("heuristic",11,"%s"),("tieBreaking",12,"%s"),("expansions",11,"%d"),("nodesPerSec",12,"%.0f"),("peakMemory",11,"%s"),("pathLength",11,"%d"),("pathCost",9,"%.1f")]
+
+def printHeader(out=sys.stdout):
+    out.write("".join(name.ljust(width) for name,width,fmt in COLUMNS) + "\n")
+
+def printRow(entry,out=sys.stdout):
+    out.write("".join((fmt % entry[name]).ljust(width) for name,width,fmt in COLUMNS) + "\n")
+    out.flush()
+
+def key(entry) -> tuple:
+    tieBreaking = entry.get("tieBreaking",TIE_FIFO if entryHeuristic(entry) != "-" else "-")
+    return (entry["algorithm"],entry["size"],entry["density"],entry.get("terrain",DEFAULT_COST),entry["diagonal"],entry["reachable"],entryHeuristic(entry),tieBreaking)
+
+# returns a list of (entry, reason) for results that got worse than the baseline
+def compare(results,baseline,tolerance=TOLERANCE) -> list:
+    base = {key(e):e for e in baseline}
+    regressions = list()
+    for entry in results:
+        old = base.get(key(entry))
+        if old is None:
+            continue
+        if entry["pathLength"] != old["pathLength"]:
+            regressions.append((entry,"path length %d -> %d" % (old["pathLength"],entry["pathLength"])))
+        if entry["expansions"] > old["expansions"]:
+            regressions.append((entry,"expansions %d -> %d" % (old["expansions"],entry["expansions"])))
+        if entry["nodesPerSec"] < old["nodesPerSec"]*(1-tolerance):
+            regressions.append((entry,"nodes/sec %.0f -> %.0f" % (old["nodesPerSec"],entry["nodesPerSec"])))
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the path-finding algorithms on seeded random grids.")
+    parser.add_argument("--sizes",type=lambda v: [int(x) for x in v.split(",")],default=SIZES,help="comma separated grid sizes")
+    parser.add_argument("--densities",type=lambda v: [float(x) for x in v.split(",")],default=DENSITIES,help="comma separated obstacle densities")
+    parser.add_argument("--algorithms",type=lambda v: v.split(","),default=None,help="comma separated algorithm names (default: all)")
+    parser.add_argument("--terrain",type=int,default=DEFAULT_COST,help="highest random terrain cost (1: no terrain)")
+    parser.add_argument("--heuristic",choices=[heuristics.AUTO]+list(heuristics.HEURISTICS),default=heuristics.AUTO,help="heuristic of the informed searches (auto: manhattan/octile)")
+    parser.add_argument("--tie-breaking",choices=heuristics.TIE_BREAKING,default=TIE_FIFO,help="tie-breaking of the informed searches")
+    parser.add_argument("--seed",type=int,default=SEED)
+    parser.add_argument("--repeat",type=int,default=REPEAT,help="runs per case, the fastest is kept")
+    parser.add_argument("--no-memory",action="store_true",help="skip the tracemalloc peak memory run")
+    parser.add_argument("--json",metavar="FILE",help="write the results to FILE")
+    parser.add_argument("--compare",metavar="FILE",help="compare against the results stored in FILE")
+    parser.add_argument("--tolerance",type=float,default=TOLERANCE,help="allowed relative nodes/sec drop")
+    args = parser.parse_args(argv)
+
+    algorithms = ALGORITHMS
+    if args.algorithms:
+        algorithms = [a for a in ALGORITHMS if algorithmName(a) in args.algorithms or a.__name__ in args.algorithms]
+    printHeader()
+    results = run(algorithms,args.sizes,args.densities,args.seed,args.repeat,not args.no_memory,terrain=args.terrain,heuristic=args.heuristic,tieBreaking=args.tie_breaking)
+    if args.json:
+        with open(args.json,"w") as f:
+            json.dump({"meta": {"seed": args.seed,"repeat": args.repeat,"python": platform.python_version(),"platform": platform.platform()},"results": results},f,indent=1)
+        print("Saved results to:",args.json)
+    if args.compare:
+        with open(args.compare,"r") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results,baseline,args.tolerance)
+        for entry,reason in regressions:
+            print("REGRESSION: %s size=%d density=%.2f terrain=%d diagonal=%s reachable=%s heuristic=%s/%s: %s" % (entry["algorithm"],entry["size"],entry["density"],entry["terrain"],entry["diagonal"],entry["reachable"],entry["heuristic"],entry["tieBreaking"],reason))
+        print("%d regression(s) against %s" % (len(regressions),args.compare))
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
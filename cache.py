@@ -0,0 +1,100 @@
+# LRU cache of search results
+# entries are keyed by (grid content hash, start, end, algorithm, diagonal), so an edited grid
+# (new content hash) can never be served a stale result
+# grids attached to the cache report their edits, entries that the edit can't affect are carried
+# over to the new content hash instead of being recomputed:
+# - "no path" results stay valid when a cell is blocked
+# - shortest paths (algorithm.optimal) stay valid when a cell that isn't on them is blocked
+# - edits that don't block/unblock anything (moving the start/end markers) keep every entry
+# - terrain cost edits (GridModel.setCost) don't carry anything over
+from algorithms import *
+from model import *
+from collections import OrderedDict
+
+CACHE_SIZE = 1024 # max entries
+
+class PathCache:
+    def __init__(self,capacity=CACHE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict() # key -> SearchResult, least recently used first
+        self.hashes = dict() # content hash -> set of keys
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.carried = 0 # entries carried over to an edited grid
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # grid edits are reported to the cache (see onGridEdited)
+    def attach(self,grid: GridModel):
+        if self not in grid.listeners:
+            grid.listeners.append(self)
+
+    def detach(self,grid: GridModel):
+        if self in grid.listeners:
+            grid.listeners.remove(self)
+
+    def key(self,grid: GridModel,start,end,algorithm,diagonal) -> tuple:
+        return (grid.contentHash(),grid.start if start is None else start,grid.end if end is None else end,algorithm or A_Star,bool(diagonal))
+
+    def get(self,key):
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return result
+
+    def put(self,key,result: SearchResult):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        else:
+            self.hashes.setdefault(key[0],set()).add(key)
+        self.entries[key] = result
+        while len(self.entries) > self.capacity:
+            old, _ = self.entries.popitem(last=False)
+            self.__forget(old)
+            self.evictions += 1
+
+    # cached solve(), the per-cell search state (marks) isn't kept
+    def solve(self,grid: GridModel,start=None,end=None,algorithm=None,diagonal: bool = False) -> SearchResult:
+        key = self.key(grid,start,end,algorithm,diagonal)
+        result = self.get(key)
+        if result is None:
+            result = solve(grid,key[1],key[2],key[3],key[4])
+            result.marks = None
+            self.put(key,result)
+        return result
+
+    def clear(self):
+        self.entries.clear()
+        self.hashes.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self.entries),"capacity": self.capacity,"hits": self.hits,"misses": self.misses,"evictions": self.evictions,"carried": self.carried}
+
+    # GridModel listener
+    def onGridEdited(self,grid: GridModel,id,previous,previousHash):
+        if previous == BLOCKED or previous == grid.cells[id] or previousHash not in self.hashes:
+            return # unblocked cells and terrain cost edits (same state) can change shortest paths, nothing is carried over
+        blocked = grid.cells[id] == BLOCKED
+        newHash = grid.contentHash()
+        for key in list(self.hashes[previousHash]):
+            result = self.entries.get(key)
+            if result is None: # evicted while carrying over
+                continue
+            if blocked and result.path and (id in result.path or not key[3].optimal):
+                continue
+            newKey = (newHash,) + key[1:]
+            if newKey not in self.entries:
+                self.put(newKey,result)
+                self.carried += 1
+
+    def __forget(self,key):
+        keys = self.hashes.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.hashes[key[0]]
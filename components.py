@@ -0,0 +1,151 @@
+# connected components of the non-blocked cells, for O(1) "no path" answers
+# every free cell has a label, labels of the same component are joined with union-find
+# - unblocking a cell gives it a new label joined with its neighbours' labels
+# - blocking a cell can split its component: breadth first waves grow from its free neighbours one cell
+#   at a time each; waves that meet are merged and every group of waves that runs out of cells while
+#   others are still growing is a separated piece that gets a new label (the cost follows the smaller pieces)
+from model import *
+from collections import deque
+
+class ComponentIndex:
+    def __init__(self,grid: GridModel,diagonal: bool = False):
+        self.grid = grid
+        self.diagonal = diagonal
+        self.neighboursOrder = NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER
+        self.labels = [-1]*grid.size # label per cell, -1 if blocked
+        self.parent = list() # union-find parent per label
+        self.build()
+        grid.listeners.append(self)
+
+    def detach(self):
+        if self in self.grid.listeners:
+            self.grid.listeners.remove(self)
+
+    def build(self):
+        cells = self.grid.cells
+        for cell in range(self.grid.size):
+            if self.labels[cell] == -1 and cells[cell] != BLOCKED:
+                label = self.newLabel()
+                self.labels[cell] = label
+                queue = deque([cell])
+                while queue:
+                    for n in self.freeNeighbours(queue.popleft()):
+                        if self.labels[n] == -1:
+                            self.labels[n] = label
+                            queue.append(n)
+
+    def newLabel(self) -> int:
+        self.parent.append(len(self.parent))
+        return len(self.parent)-1
+
+    def find(self,label) -> int:
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def union(self,a,b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a,b)] = min(a,b)
+
+    # component of a cell, -1 if blocked
+    def component(self,cell) -> int:
+        label = self.labels[cell]
+        return self.find(label) if label != -1 else -1
+
+    def freeNeighbours(self,cell) -> list:
+        neighbours = list()
+        x,y = self.grid.coords(cell)
+        for dir in self.neighboursOrder:
+            n = self.grid.get(x+dir[0],y+dir[1])
+            if n is not None and self.grid.cells[n] != BLOCKED:
+                neighbours.append(n)
+        return neighbours
+
+    # False if there's certainly no path from origin to destination
+    # (a blocked origin can still be left, its free neighbours are checked instead)
+    def connected(self,origin,destination) -> bool:
+        if origin == destination:
+            return True
+        target = self.component(destination)
+        if target == -1:
+            return False
+        if self.labels[origin] == -1:
+            return any(self.component(n) == target for n in self.freeNeighbours(origin))
+        return self.component(origin) == target
+
+    # GridModel listener
+    def onGridEdited(self,grid: GridModel,id,previous,previousHash):
+        if previous == BLOCKED and grid.cells[id] != BLOCKED:
+            self.add(id)
+        elif previous != BLOCKED and grid.cells[id] == BLOCKED:
+            self.remove(id)
+
+    def add(self,cell):
+        label = self.newLabel()
+        self.labels[cell] = label
+        for n in self.freeNeighbours(cell):
+            self.union(label,self.labels[n])
+
+    def remove(self,cell):
+        self.labels[cell] = -1
+        starts = self.freeNeighbours(cell)
+        if len(starts) < 2:
+            return
+        waves = len(starts)
+        groups = list(range(waves)) # union-find of waves that met
+        def group(wave):
+            while groups[wave] != wave:
+                wave = groups[wave]
+            return wave
+        owner = {start: wave for wave,start in enumerate(starts)}
+        members = [[start] for start in starts]
+        queues = [deque([start]) for start in starts]
+        active = set(range(waves))
+        while len({group(wave) for wave in active}) > 1:
+            for wave in list(active):
+                if not queues[wave]:
+                    active.discard(wave)
+                    continue
+                for n in self.freeNeighbours(queues[wave].popleft()):
+                    other = owner.get(n)
+                    if other is None:
+                        owner[n] = wave
+                        members[wave].append(n)
+                        queues[wave].append(n)
+                    elif group(other) != group(wave):
+                        groups[group(other)] = group(wave)
+        # the still growing group (or the largest one) keeps its labels, the others are relabelled
+        pieces = dict()
+        for wave in range(waves):
+            pieces.setdefault(group(wave),list()).append(wave)
+        if len(pieces) == 1:
+            return
+        if active:
+            keep = group(next(iter(active)))
+        else:
+            keep = max(pieces,key=lambda g: sum(len(members[wave]) for wave in pieces[g]))
+        for g, piece in pieces.items():
+            if g == keep:
+                continue
+            label = self.newLabel()
+            for wave in piece:
+                for n in members[wave]:
+                    self.labels[n] = label
+
+CACHE = "components" # GridModel.caches key of the grid's indexes: {diagonal: ComponentIndex}
+
+# returns the component index of a grid, building it if necessary
+def getIndex(grid: GridModel,diagonal: bool) -> ComponentIndex:
+    indexes = grid.caches.setdefault(CACHE,dict())
+    index = indexes.get(diagonal)
+    if index is None:
+        index = ComponentIndex(grid,diagonal)
+        indexes[diagonal] = index
+    return index
+
+# True when the destination certainly can't be reached from the origin
+def unreachable(grid: GridModel,origin,destination,diagonal: bool) -> bool:
+    return not getIndex(grid,diagonal).connected(origin,destination)
@@ -0,0 +1,83 @@
+# per-run control channel between the UI and a search thread (see PathFindingAlgorithm.run)
+# the UI calls pause/resume/step/setSpeed/cancel, the search thread blocks in wait() until its next step is due:
+# no polling and no CPU while paused, every command wakes the thread up right away (Condition.notify)
+# while running, steps are scheduled on deadlines (previous step + interval) rather than fixed sleeps
+# every run gets its own channel, so nothing sent to a stopped run can reach the next one
+import threading
+import time
+
+# seconds between two steps for a speed of the UI scale (0.5..2)
+def stepInterval(speed) -> float:
+    speed = float(speed)
+    if speed <= 0.5:
+        return 0.75
+    elif speed <= 1:
+        return 0.25
+    elif speed <= 1.5:
+        return 0.05
+    return 0.025
+
+class SearchControl:
+    # speed: UI scale value (see stepInterval), paused: wait for step()/resume() before the first step
+    def __init__(self,speed=2,paused=False):
+        self.condition = threading.Condition()
+        self.interval = stepInterval(speed)
+        self.paused = paused
+        self.steps = 1 if paused else 0 # single steps requested while paused (a paused run starts with one)
+        self.cancelled = False
+        self.previous = -self.interval # perf_counter time the last step was due, the first one is due right away
+
+    # UI side
+    def pause(self):
+        with self.condition:
+            self.paused = True
+            self.steps = 0
+            self.condition.notify_all()
+
+    def resume(self):
+        with self.condition:
+            self.paused = False
+            self.previous = time.perf_counter()-self.interval # next step right away
+            self.condition.notify_all()
+
+    def toggle(self):
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    # one more step, the run stays (or becomes) paused
+    def step(self):
+        with self.condition:
+            self.paused = True
+            self.steps += 1
+            self.condition.notify_all()
+
+    # the next step is rescheduled from the previous one with the new interval
+    def setSpeed(self,speed):
+        with self.condition:
+            self.interval = stepInterval(speed)
+            self.condition.notify_all()
+
+    def cancel(self):
+        with self.condition:
+            self.cancelled = True
+            self.condition.notify_all()
+
+    # search thread side: blocks until the next step is due, False once cancelled
+    def wait(self) -> bool:
+        with self.condition:
+            while not self.cancelled:
+                if self.paused:
+                    if self.steps:
+                        self.steps -= 1
+                        return True
+                    self.condition.wait()
+                else:
+                    due = self.previous+self.interval
+                    now = time.perf_counter()
+                    if now >= due:
+                        self.previous = due if now-due < self.interval else now # catches up on jitter, not on long stalls
+                        return True
+                    self.condition.wait(due-now)
+            return False
@@ -0,0 +1,149 @@
+# flow fields: one reverse search from a target cell, then every agent follows its cell's next-step direction
+# the field is a GridModel listener and only repairs the area an edit affects:
+# - blocking a cell resets the cells whose next steps led through it and searches them again from their
+#   untouched neighbours
+# - unblocking a cell propagates the shorter distances it opens up
+from model import *
+from adjacency import getAdjacency
+from math import inf
+import heapq
+
+NO_DIRECTION = 255 # target, blocked and unreachable cells
+
+class FlowField:
+    # target: cell id the agents move to (None for the grid's end)
+    def __init__(self,grid: GridModel,target=None,diagonal: bool = False):
+        self.grid = grid
+        self.target = grid.end if target is None else target
+        self.diagonal = diagonal
+        self.neighboursOrder = NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER
+        self.offsets = [dx*grid.columns+dy for dx,dy in self.neighboursOrder]
+        self.directionOf = {dir: k for k,dir in enumerate(self.neighboursOrder)}
+        self.adjacency = getAdjacency(grid,diagonal).neighbours # listener registered before this one, so already patched on edits
+        self.build()
+        grid.listeners.append(self)
+
+    def detach(self):
+        if self in self.grid.listeners:
+            self.grid.listeners.remove(self)
+
+    def build(self):
+        self.distances = [inf]*self.grid.size
+        self.directions = bytearray([NO_DIRECTION])*self.grid.size # neighboursOrder index of the next step
+        if self.grid.cells[self.target] != BLOCKED:
+            self.distances[self.target] = 0
+            self.propagate([(0,self.target)])
+
+    def cost(self,a,b) -> int:
+        return 1
+
+    # neighboursOrder index of the move from a to its neighbour b
+    def direction(self,a,b) -> int:
+        (ax,ay), (bx,by) = self.grid.coords(a), self.grid.coords(b)
+        return self.directionOf[(bx-ax,by-ay)]
+
+    # reverse Dijkstra from the cells in the heap, only lowers distances
+    def propagate(self,heap):
+        distances = self.distances
+        cells = self.grid.cells
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            for n in self.adjacency[node]:
+                if cells[n] == BLOCKED:
+                    continue
+                d = distance + self.cost(n,node)
+                if d < distances[n]:
+                    distances[n] = d
+                    self.directions[n] = self.direction(n,node)
+                    heapq.heappush(heap,(d,n))
+
+    # next cell on the way to the target, None at the target or if it can't be reached (O(1))
+    def nextStep(self,cell):
+        k = self.directions[cell]
+        return None if k == NO_DIRECTION else cell+self.offsets[k]
+
+    # (row, column) offset of the next step, None at the target or if it can't be reached
+    def arrow(self,cell):
+        k = self.directions[cell]
+        return None if k == NO_DIRECTION else self.neighboursOrder[k]
+
+    # cells from a cell to the target, empty if it can't be reached
+    def path(self,cell) -> list:
+        if self.distances[cell] == inf:
+            return list()
+        path = [cell]
+        while path[-1] != self.target:
+            path.append(self.nextStep(path[-1]))
+        return path
+
+    # GridModel listener
+    def onGridEdited(self,grid: GridModel,id,previous,previousHash):
+        if (previous == BLOCKED) == (grid.cells[id] == BLOCKED):
+            return
+        if id == self.target:
+            self.build()
+        elif grid.cells[id] == BLOCKED:
+            self.onBlocked(id)
+        else:
+            self.onUnblocked(id)
+
+    def onBlocked(self,cell):
+        if self.distances[cell] == inf:
+            return
+        # cells whose next steps lead through the blocked cell
+        affected = {cell}
+        stack = [cell]
+        while stack:
+            node = stack.pop()
+            for n in self.adjacency[node]:
+                if n not in affected and self.nextStep(n) == node:
+                    affected.add(n)
+                    stack.append(n)
+        for n in affected:
+            self.distances[n] = inf
+            self.directions[n] = NO_DIRECTION
+        # search them again from their untouched neighbours
+        heap = list()
+        cells = self.grid.cells
+        for node in affected:
+            if node == cell:
+                continue
+            for n in self.adjacency[node]:
+                if n not in affected and cells[n] != BLOCKED:
+                    d = self.distances[n] + self.cost(node,n)
+                    if d < self.distances[node]:
+                        self.distances[node] = d
+                        self.directions[node] = self.direction(node,n)
+            if self.distances[node] < inf:
+                heapq.heappush(heap,(self.distances[node],node))
+        self.propagate(heap)
+
+    def onUnblocked(self,cell):
+        for n in self.adjacency[cell]:
+            d = self.distances[n] + self.cost(cell,n)
+            if d < self.distances[cell]:
+                self.distances[cell] = d
+                self.directions[cell] = self.direction(cell,n)
+        if self.distances[cell] < inf:
+            self.propagate([(self.distances[cell],cell)])
+
+CACHE = "flowfields" # GridModel.caches key of the grid's flow fields: {(target, diagonal): FlowField}
+
+# returns the flow field of a grid towards a target (None for the grid's end), building it if necessary
+def getFlowField(grid: GridModel,target=None,diagonal: bool = False) -> FlowField:
+    target = grid.end if target is None else target
+    fields = grid.caches.setdefault(CACHE,dict())
+    field = fields.get((target,diagonal))
+    if field is None:
+        field = FlowField(grid,target,diagonal)
+        fields[(target,diagonal)] = field
+    return field
+
+# drops a grid's flow field towards a target (None for the grid's end), it stops following the edits
+def forgetFlowField(grid: GridModel,target=None,diagonal: bool = False):
+    target = grid.end if target is None else target
+    field = grid.caches.get(CACHE,dict()).pop((target,diagonal),None)
+    if field is not None:
+        field.detach()
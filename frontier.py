@@ -0,0 +1,107 @@
+import heapq
+from collections import deque
+
+REMOVED = object() # placeholder for a lazily deleted heap entry
+
+# binary heap priority queue (open list) with lazy deletion and O(1) membership
+# push() inserts a node or changes its priority (decrease-key by re-insertion, the old entry is marked REMOVED)
+# ties are broken by insertion order (FIFO); a node keeps its insertion order when its priority changes,
+# which is the same order a stable list.sort() over an appended list produces
+class PriorityQueue:
+    def __init__(self):
+        self.heap = list() # [priority, order, sequence, node]
+        self.entries = dict() # node -> heap entry
+        self.counter = 0 # insertion order
+        self.sequence = 0 # unique per heap entry, a re-prioritised node can't tie with its removed entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self,node) -> bool:
+        return node in self.entries
+
+    # inserts a node or updates its priority
+    def push(self,node,priority):
+        entry = self.entries.get(node)
+        if entry is not None:
+            if entry[0] == priority:
+                return
+            order = entry[1]
+            entry[3] = REMOVED
+        else:
+            order = self.counter
+            self.counter += 1
+        entry = [priority,order,self.sequence,node]
+        self.sequence += 1
+        self.entries[node] = entry
+        heapq.heappush(self.heap,entry)
+
+    # removes and returns the node with the lowest priority
+    def pop(self):
+        while self.heap:
+            priority, order, sequence, node = heapq.heappop(self.heap)
+            if node is not REMOVED:
+                del self.entries[node]
+                return node
+        raise KeyError("pop from an empty priority queue")
+
+    # returns the lowest priority without removing it (None if empty)
+    def peek(self):
+        while self.heap and self.heap[0][3] is REMOVED:
+            heapq.heappop(self.heap)
+        return self.heap[0][0] if self.heap else None
+
+    def priority(self,node):
+        return self.entries[node][0]
+
+    def remove(self,node):
+        self.entries.pop(node)[3] = REMOVED
+
+# bucket queue (Dial) for monotone searches with edge costs between 1 and maxCost: O(1) push and pop
+# bucket k holds the priorities in [k, k+1), a circular array of int(maxCost)+2 buckets covers every priority
+# between the last popped one and the last popped one + maxCost
+# nodes in the same bucket are popped in insertion order (not by priority), which is fine for Dijkstra:
+# with edges costing at least 1 a node can't lower the priority of another node in its own bucket,
+# so every node is final when its bucket is reached
+# push() only has to be called with priorities >= the last popped one, changing a priority leaves a stale
+# entry in the old bucket that pop() skips
+class BucketQueue:
+    def __init__(self,maxCost):
+        self.buckets = [deque() for n in range(int(maxCost)+2)] # (priority, node)
+        self.entries = dict() # node -> current priority
+        self.current = 0 # lowest bucket that can hold a node
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self,node) -> bool:
+        return node in self.entries
+
+    # inserts a node or updates its priority
+    def push(self,node,priority):
+        if self.entries.get(node) == priority:
+            return
+        if not self.entries or int(priority) < self.current:
+            self.current = int(priority)
+        self.entries[node] = priority
+        self.buckets[int(priority) % len(self.buckets)].append((priority,node))
+
+    # removes and returns a node of the lowest bucket
+    def pop(self):
+        if not self.entries:
+            raise KeyError("pop from an empty bucket queue")
+        buckets = self.buckets
+        while True:
+            bucket = buckets[self.current % len(buckets)]
+            while bucket:
+                priority, node = bucket.popleft()
+                if self.entries.get(node) == priority:
+                    del self.entries[node]
+                    return node
+            self.current += 1
+
+    def priority(self,node):
+        return self.entries[node]
+
+    def remove(self,node):
+        del self.entries[node]
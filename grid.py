@@ -1,12 +1,5 @@
 from tkinter import *
-
-EMPTY = 0
-START = 1
-END = 2
-BLOCKED = 3
-DISCOVERED = 4
-VISITED = 5
-PATH = 6
+from model import *
 
 COLOR_EMPTY = "#cccccc"
 COLOR_BLOCKED = "#666666"
@@ -15,198 +8,332 @@ COLOR_END = "#cf6a87"
 COLOR_DISCOVERED = "#f7d794"
 COLOR_VISITED = "#f3a683"
 COLOR_PATH = "#e15f41"
+COLOR_LINES = "#666666"
+COLOR_ARROWS = "#222222"
+COLOR_TERRAIN = "#8d6e3f" # empty cells with the highest terrain cost, lower costs are blended with COLOR_EMPTY
+
+STATE_COLORS = [COLOR_EMPTY,COLOR_START,COLOR_END,COLOR_BLOCKED,COLOR_DISCOVERED,COLOR_VISITED,COLOR_PATH] # indexed by cell state
+
+LABEL_GRID_MAX = 16 # bigger grids are drawn on a canvas (see createGrid)
+VIEW_SIZE = 640 # max canvas width/height in pixels
+MAX_ZOOM = 40 # max canvas cell size in pixels
+GRID_LINES_ZOOM = 4 # canvas cells at least this big are separated by grid lines
+ARROWS_ZOOM = 10 # flow field arrows are only drawn on canvas cells at least this big
+
+TERRAIN_LEVELS = 9 # terrain costs set with shift+click (1..TERRAIN_LEVELS), higher costs are drawn like the highest
+
+# blend of two "#rrggbb" colors, t in [0, 1]
+def blend(a,b,t) -> str:
+    return "#" + "".join("%02x" % round(int(a[n:n+2],16)*(1-t) + int(b[n:n+2],16)*t) for n in (1,3,5))
+
+TERRAIN_COLORS = [COLOR_EMPTY] + [blend(COLOR_EMPTY,COLOR_TERRAIN,(cost-1)/(TERRAIN_LEVELS-1)) for cost in range(1,TERRAIN_LEVELS+1)] # indexed by cost
+
+# color of an empty cell with a terrain cost
+def terrainColor(cost) -> str:
+    return TERRAIN_COLORS[min(cost,TERRAIN_LEVELS)]
 
+ARROWS = {(0,1): "→",(1,1): "↘",(1,0): "↓",(1,-1): "↙",(0,-1): "←",(-1,-1): "↖",(-1,0): "↑",(-1,1): "↗"} # (row, column) step -> text
+
+# tkinter view of a single GridModel cell
 class Cell:
-    def __init__(self,id,parent,x,y,dummyImage,state = EMPTY,cellSize = 50):
-        self.label = Label(parent,text=id,image=dummyImage,width=cellSize,height=cellSize,compound=CENTER,background=COLOR_EMPTY,relief=FLAT)
-        self.label.grid(row=x,column=y,padx=1,pady=1)
-        self.state = state
-        self.rawState = 0
-        self.x = x
-        self.y = y
+    def __init__(self,id,parent,model: GridModel,dummyImage,cellSize = 50):
+        self.model = model
         self.id = id
-        if state != EMPTY:
-            if state == START: self.label.configure(text="A")
-            elif state == END: self.label.configure(text="B")
+        self.x, self.y = model.coords(id)
+        self.state = model.cells[id] # displayed state (layout or search state)
+        self.arrow = None # flow field step shown instead of the id
+        self.label = Label(parent,text=self.getLabelText(),image=dummyImage,width=cellSize,height=cellSize,compound=CENTER,background=COLOR_EMPTY,relief=FLAT)
+        self.label.grid(row=self.x,column=self.y,padx=1,pady=1)
+        if self.state != EMPTY or model.costs[id] != DEFAULT_COST:
             self.update()
 
     def __str__(self) -> str:
-        return str(self.label.cget("text")) 
+        return self.getText()
 
     def __repr__(self) -> str:
-        return str(self.label.cget("text")) #str(self.id)
+        return self.getText()
+
+    def getText(self) -> str:
+        if self.id == self.model.start:
+            return "A"
+        elif self.id == self.model.end:
+            return "B"
+        return str(self.id)
+
+    def getLabelText(self) -> str:
+        if self.arrow and self.state != BLOCKED:
+            return ARROWS[self.arrow]
+        return self.getText()
 
     # blocks or unblocks the cell depending on its current state
     # doesn't do anything if START/END
     def block(self):
-        if self.state == START or self.state == END:
-            return
-        if self.state == BLOCKED:
-            self.state = EMPTY
-        else:
-            self.state = BLOCKED
-        self.update()
-
-    def discovered(self):
-        self.state = DISCOVERED
-        self.update()
-
-    def visited(self):
-        self.state = VISITED
-        self.update()
-
-    def path(self):
-        self.state = PATH
-        self.update()
-
-    def saveState(self):
-        self.rawState = self.state
+        self.model.block(self.id)
 
     # cleans algorithm search data
     def clean(self):
-        if self.state == DISCOVERED or self.state == VISITED or self.state == PATH:
-            self.state = self.rawState
-            self.rawState = EMPTY # not necessary
+        if self.state != self.model.cells[self.id]:
+            self.state = self.model.cells[self.id]
             self.update()
 
-    def clear(self):
-        if self.state == START or self.state == END:
-            return
-        if (self.state == DISCOVERED or self.state == VISITED or self.state == PATH) and (self.rawState == START or self.rawState == END):
-            self.state = self.rawState
-        else:
-            self.state = EMPTY
-        self.update()
-
     # updates the label graphic for the cell's state
     def update(self):
-        if (self.state == EMPTY): # none
-            self.label.configure(relief=FLAT,background=COLOR_EMPTY)
+        relief = RAISED if (self.id == self.model.start or self.id == self.model.end) else FLAT
+        if (self.state == EMPTY): # none (shaded by terrain cost)
+            self.label.configure(text=self.getLabelText(),relief=relief,background=terrainColor(self.model.costs[self.id]))
         elif (self.state == START): # start
-            self.label.configure(relief=RAISED,background=COLOR_START)
+            self.label.configure(text=self.getLabelText(),relief=relief,background=COLOR_START)
         elif (self.state == END): # end
-            self.label.configure(relief=RAISED,background=COLOR_END)
+            self.label.configure(text=self.getLabelText(),relief=relief,background=COLOR_END)
         elif (self.state == BLOCKED): # blocked
-            self.label.configure(relief=FLAT,background=COLOR_BLOCKED)
+            self.label.configure(text=self.getLabelText(),relief=relief,background=COLOR_BLOCKED)
         elif (self.state == DISCOVERED): # discovered
-            self.label.configure(relief=FLAT if (self.rawState != START and self.rawState != END) else RAISED,background=COLOR_DISCOVERED)
+            self.label.configure(relief=relief,background=COLOR_DISCOVERED)
         elif (self.state == VISITED): # visited
-            self.label.configure(relief=FLAT if (self.rawState != START and self.rawState != END) else RAISED,background=COLOR_VISITED)
+            self.label.configure(relief=relief,background=COLOR_VISITED)
         elif (self.state == PATH): # path
-            self.label.configure(relief=FLAT if (self.rawState != START and self.rawState != END) else RAISED,background=COLOR_PATH)
+            self.label.configure(relief=relief,background=COLOR_PATH)
 
     def getSaveState(self):
-        if self.state == EMPTY or self.state == START or self.state == END or self.state == BLOCKED:
-            return self.state
-        elif self.rawState == EMPTY or self.rawState == START or self.rawState == END or self.rawState == BLOCKED:
-            return self.rawState
-        else:
-            return EMPTY
+        return self.model.cells[self.id]
 
+# tkinter view of a GridModel, one Label per cell
 class Grid:
-    def __init__(self,parent,dummyImage,onCellClick,grid=None,cellSize=30,size=(8,8)):
-        x,y = size
-        self.dimensions = size
-        self.state = {k:dict() for k in range(y)}
-        if grid is None:
-            grid = {str(k):dict() for k in range(y)} # [row][col]: cell.state
-            grid['0']['0'] = START
-            grid[str(y-1)][str(x-1)] = END
-        for row in range(y): # rows
-            for col in range(x): # columns
-                id = row*x+col
-                state = grid[str(row)].get(str(col)) or EMPTY # row and col need to be converted to str because of the JSON parser
-                if state == START:
-                    self.state[row][col] = Cell(id,parent,row,col,dummyImage,START,cellSize)
-                    self.start = self.state[row][col]
-                elif state == END:
-                    self.state[row][col] = Cell(id,parent,row,col,dummyImage,END,cellSize)
-                    self.end = self.state[row][col]
-                else:
-                    self.state[row][col] = Cell(id,parent,row,col,dummyImage,state,cellSize=cellSize)
-                self.state[row][col].label.bind("<Button-1>",lambda f,cell=self.state[row][col]: onCellClick(cell,True))
-                self.state[row][col].label.bind("<Button-3>",lambda f,cell=self.state[row][col]: onCellClick(cell))
+    # model: existing GridModel to show (e.g. loaded from a file), otherwise one is created from grid/size
+    def __init__(self,parent,dummyImage,onCellClick,grid=None,cellSize=30,size=(8,8),model: GridModel = None):
+        self.model = model or GridModel(grid,size)
+        self.dimensions = self.model.dimensions
+        self.cells = list()
+        for id in range(self.model.size):
+            cell = Cell(id,parent,self.model,dummyImage,cellSize)
+            cell.label.bind("<Button-1>",lambda f,id=id: onCellClick(id,True))
+            cell.label.bind("<Shift-Button-1>",lambda f,id=id: onCellClick(id,True,True))
+            cell.label.bind("<Button-3>",lambda f,id=id: onCellClick(id))
+            self.cells.append(cell)
+        self.model.view = self
+
+    @property
+    def start(self) -> Cell:
+        return self.cells[self.model.start]
+
+    @property
+    def end(self) -> Cell:
+        return self.cells[self.model.end]
 
     def get(self,x,y):
-        return self.state[x][y] if self.state.get(x) and self.state[x].get(y) else None
+        id = self.model.get(x,y)
+        return self.cells[id] if id is not None else None
+
+    # GridModel listener
+    def onCellChanged(self,id,state):
+        cell = self.cells[id]
+        cell.state = state
+        cell.update()
+
+    # {id: state}
+    def onCellsChanged(self,cells):
+        for id, state in cells.items():
+            self.onCellChanged(id,state)
+
+    def cellText(self,id) -> str:
+        return self.cells[id].getText()
+
+    # flow field arrows (anything with arrow(cell) -> (row, column) step or None), None to hide them
+    def showArrows(self,field):
+        for cell in self.cells:
+            cell.arrow = field.arrow(cell.id) if field else None
+            cell.label.configure(text=cell.getLabelText())
 
     def clean(self):
-        for v in self.state.values():
-            for vv in v.values():
-                vv.clean()
+        for cell in self.cells:
+            cell.clean()
 
     def clear(self):
-        for v in self.state.values():
-            for vv in v.values():
-                vv.clear() 
+        self.model.clear()
+        self.clean()
 
     def replaceStart(self,cell):
-        if cell is self.end or cell is self.start:
-            self.reverseStart()
-        else:
-            self.start.state = EMPTY
-            self.start.label.configure(text=str(self.start.id))
-            self.start.update()
-            self.start = cell
-            self.start.label.configure(text="A")
-            cell.state = START
-            self.start.update()
+        self.model.replaceStart(cell.id)
 
     def replaceEnd(self,cell):
-        if cell is self.end or cell is self.start:
-            self.reverseStart()
-        else:
-            self.end.state = EMPTY
-            self.end.label.configure(text=str(self.end.id))
-            self.end.update()
-            self.end = cell
-            self.end.label.configure(text="B")
-            cell.state = END
-            self.end.update()
+        self.model.replaceEnd(cell.id)
 
     def reverseStart(self):
-        end = self.end
-        self.end = self.start
-        self.start = end
-        self.start.state = START
-        self.end.state = END
-        self.start.update()
-        self.end.update()
-        self.start.label.configure(text="A")
-        self.end.label.configure(text="B")
+        self.model.reverseStart()
 
     def resizeCells(self,size):
-        for v in self.state.values():
-            for vv in v.values():
-                vv.label.configure(width=size,height=size)
-
-    # used before running an algorithm
-    # saves cells' state
-    def saveState(self):
-        for v in self.state.values():
-            for vv in v.values():
-                vv.saveState() 
-
-    # grid start/end integrity check
-    def integrityCheck(self):
-        if not self.start:
-            if self.state[0][0].state == END:
-                self.state[self.dimensions[0]-1][self.dimensions[1]-1].state = START
-                self.state[self.dimensions[0]-1][self.dimensions[1]-1].update()
-            else:
-                self.state[0][0].state = START
-                self.state[0][0].update()
-        if not self.end:
-            if self.state[self.dimensions[0]-1][self.dimensions[1]-1].state == START:
-                self.state[0][0].state = END
-                self.state[0][0].update()
-            else:
-                self.state[self.dimensions[0]-1][self.dimensions[1]-1].state = END
-                self.state[self.dimensions[0]-1][self.dimensions[1]-1].update()
+        for cell in self.cells:
+            cell.label.configure(width=size,height=size)
 
     def getSaveDict(self):
-        save = {k:dict() for k in range(self.dimensions[1])}
-        for row in save.keys():
-            for column in self.state[row].keys():
-                save[row][column] = self.state[row][column].getSaveState()
-        return save
\ No newline at end of file
+        return self.model.getSaveDict()
+
+# tkinter view of a GridModel drawn as a single bitmap on a Canvas, for grids too big for a Label per cell
+# only the visible part of the grid is drawn; the mouse wheel zooms and dragging with the middle button pans
+class CanvasGrid:
+    # model: existing GridModel to show (e.g. loaded from a file), otherwise one is created from grid/size
+    # viewSize: max canvas width/height in pixels
+    def __init__(self,parent,dummyImage,onCellClick,grid=None,cellSize=30,size=(8,8),model: GridModel = None,viewSize=VIEW_SIZE):
+        self.model = model or GridModel(grid,size)
+        self.dimensions = self.model.dimensions
+        self.onCellClick = onCellClick
+        self.viewSize = viewSize
+        self.states = bytearray(self.model.cells) # displayed state per cell (layout or search state)
+        self.field = None # flow field shown as arrows (see showArrows)
+        self.canvas = Canvas(parent,highlightthickness=0,background=COLOR_LINES)
+        self.canvas.pack()
+        self.image = None
+        self.resizeCells(cellSize)
+        self.canvas.bind("<Button-1>",lambda e: self.onClick(e,True))
+        self.canvas.bind("<Shift-Button-1>",lambda e: self.onClick(e,True,True))
+        self.canvas.bind("<Button-3>",lambda e: self.onClick(e))
+        self.canvas.bind("<Button-2>",self.onPanStart)
+        self.canvas.bind("<B2-Motion>",self.onPan)
+        self.canvas.bind("<MouseWheel>",lambda e: self.onZoom(e,e.delta > 0)) # Windows/macOS
+        self.canvas.bind("<Button-4>",lambda e: self.onZoom(e,True)) # X11
+        self.canvas.bind("<Button-5>",lambda e: self.onZoom(e,False))
+        self.model.view = self
+
+    # sets the canvas size for cellSize (shrunk so that the whole grid fits in viewSize) and redraws at that zoom
+    def resizeCells(self,size):
+        self.minZoom = max(1,min(size,self.viewSize//max(self.model.rows,self.model.columns)))
+        self.cellSize = self.minZoom
+        self.width = self.model.columns*self.cellSize
+        self.height = self.model.rows*self.cellSize
+        self.firstRow = 0
+        self.firstColumn = 0
+        self.canvas.delete("all")
+        self.canvas.configure(width=self.width,height=self.height)
+        self.image = PhotoImage(width=self.width,height=self.height)
+        self.canvas.create_image(0,0,image=self.image,anchor=NW)
+        self.redraw()
+
+    # redraws the visible cells, one image row of cells at a time
+    def redraw(self):
+        size = self.cellSize
+        lines = size >= GRID_LINES_ZOOM
+        pixels = [[color]*(size-1)+[COLOR_LINES] if lines else [color]*size for color in STATE_COLORS]
+        terrain = [[color]*(size-1)+[COLOR_LINES] if lines else [color]*size for color in TERRAIN_COLORS]
+        costs = self.model.costs
+        rows = min(self.model.rows-self.firstRow,-(-self.height//size))
+        columns = min(self.model.columns-self.firstColumn,-(-self.width//size))
+        blank = "{" + " ".join([COLOR_LINES]*self.width) + "} "
+        for row in range(rows):
+            first = (self.firstRow+row)*self.model.columns+self.firstColumn
+            line = list()
+            for id in range(first,first+columns):
+                state = self.states[id]
+                line += pixels[state] if state != EMPTY else terrain[min(costs[id],TERRAIN_LEVELS)]
+            line = line[:self.width] + [COLOR_LINES]*(self.width-len(line))
+            line = "{" + " ".join(line) + "} "
+            height = self.height-row*size
+            self.image.put(line*(size-1) + blank if lines and height >= size else line*min(size,height),to=(0,row*size))
+        if rows*size < self.height:
+            self.image.put(blank*(self.height-rows*size),to=(0,rows*size))
+        self.drawArrows()
+
+    # flow field arrows (anything with arrow(cell) -> (row, column) step or None), None to hide them
+    def showArrows(self,field):
+        self.field = field
+        self.drawArrows()
+
+    # one line item per visible cell, only when zoomed in enough
+    def drawArrows(self):
+        self.canvas.delete("arrows")
+        size = self.cellSize
+        if self.field is None or size < ARROWS_ZOOM:
+            return
+        rows = min(self.model.rows-self.firstRow,-(-self.height//size))
+        columns = min(self.model.columns-self.firstColumn,-(-self.width//size))
+        length = size*0.3
+        for row in range(rows):
+            for column in range(columns):
+                id = (self.firstRow+row)*self.model.columns+self.firstColumn+column
+                arrow = self.field.arrow(id)
+                if arrow and self.model.cells[id] != BLOCKED:
+                    x, y = column*size+size/2, row*size+size/2
+                    self.canvas.create_line(x-arrow[1]*length,y-arrow[0]*length,x+arrow[1]*length,y+arrow[0]*length,arrow=LAST,fill=COLOR_ARROWS,tags="arrows")
+
+    def drawCell(self,id):
+        row,column = self.model.coords(id)
+        x, y = (column-self.firstColumn)*self.cellSize, (row-self.firstRow)*self.cellSize
+        if 0 <= x < self.width and 0 <= y < self.height:
+            size = self.cellSize-1 if self.cellSize >= GRID_LINES_ZOOM else self.cellSize
+            state = self.states[id]
+            self.image.put(STATE_COLORS[state] if state != EMPTY else terrainColor(self.model.costs[id]),to=(x,y,min(x+size,self.width),min(y+size,self.height)))
+
+    # GridModel listener
+    def onCellChanged(self,id,state):
+        self.states[id] = state
+        self.drawCell(id)
+
+    # {id: state}, many changes are drawn with a single redraw
+    def onCellsChanged(self,cells):
+        for id, state in cells.items():
+            self.states[id] = state
+        if len(cells) > (self.width//self.cellSize+1)*(self.height//self.cellSize+1)//8:
+            self.redraw()
+        else:
+            for id in cells:
+                self.drawCell(id)
+
+    def cellText(self,id) -> str:
+        if id == self.model.start:
+            return "A"
+        elif id == self.model.end:
+            return "B"
+        return str(id)
+
+    # cell id under a canvas position, None if outside the grid
+    def cellAt(self,x,y):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return self.model.get(self.firstRow+y//self.cellSize,self.firstColumn+x//self.cellSize)
+
+    def onClick(self,event,left=False,terrain=False):
+        id = self.cellAt(event.x,event.y)
+        if id is not None:
+            self.onCellClick(id,left,terrain)
+
+    # scrolls so that the given cell is the first visible one (clamped to the grid)
+    def scrollTo(self,row,column):
+        self.firstRow = max(0,min(row,self.model.rows-self.height//self.cellSize))
+        self.firstColumn = max(0,min(column,self.model.columns-self.width//self.cellSize))
+
+    def onPanStart(self,event):
+        self.panStart = (event.x,event.y,self.firstRow,self.firstColumn)
+
+    def onPan(self,event):
+        x, y, row, column = self.panStart
+        previous = (self.firstRow,self.firstColumn)
+        self.scrollTo(row-(event.y-y)//self.cellSize,column-(event.x-x)//self.cellSize)
+        if (self.firstRow,self.firstColumn) != previous:
+            self.redraw()
+
+    # zooms in/out keeping the cell under the mouse in place
+    def onZoom(self,event,zoomIn):
+        size = min(MAX_ZOOM,self.cellSize*2) if zoomIn else max(self.minZoom,self.cellSize//2)
+        if size == self.cellSize:
+            return
+        row = self.firstRow+event.y/self.cellSize
+        column = self.firstColumn+event.x/self.cellSize
+        self.cellSize = size
+        self.scrollTo(int(row-event.y/size),int(column-event.x/size))
+        self.redraw()
+
+    def clean(self):
+        self.states[:] = self.model.cells
+        self.redraw()
+
+    def clear(self):
+        self.model.clear()
+        self.clean()
+
+    def getSaveDict(self):
+        return self.model.getSaveDict()
+
+# Label grid for small grids, canvas for the rest
+def createGrid(parent,dummyImage,onCellClick,grid=None,cellSize=30,size=(8,8),model: GridModel = None):
+    columns, rows = model.dimensions if model else size
+    gridClass = Grid if columns <= LABEL_GRID_MAX and rows <= LABEL_GRID_MAX else CanvasGrid
+    return gridClass(parent,dummyImage,onCellClick,grid,cellSize,size,model)
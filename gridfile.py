@@ -0,0 +1,130 @@
+# .grd grid files
+# binary format (little endian):
+#   header: magic "PFGR", version (u8), compression (u8), cell size (u16), columns (u32), rows (u32), start (u32), end (u32)
+#   cells:  one state byte per cell (EMPTY/START/END/BLOCKED, row*columns+column),
+#           followed by one terrain cost byte per cell (version 2, version 1 files have DEFAULT_COST everywhere)
+#           possibly compressed:
+#           RAW:  packed as is, loaded with mmap (no copy, edits stay in memory) unless the grid is loaded unmapped
+#           RLE:  (run length-1, byte) pairs, runs of up to 256 bytes
+#           ZLIB: zlib stream of the packed bytes
+# the old JSON files ({"cellSize","dimensions","grid": {row: {col: state}}}) still load,
+# with an optional "costs": {row: {col: cost}} for the cells that don't have DEFAULT_COST
+# py gridfile.py old.grd new.grd [--compression raw|rle|zlib|json] -> converts between formats
+from model import *
+import argparse
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+MAGIC = b"PFGR"
+FILE_VERSION = 2
+VERSIONS = (1,2) # loadable
+HEADER = struct.Struct("<4sBBHIIII")
+
+RAW = 0
+RLE = 1
+ZLIB = 2
+COMPRESSIONS = {"raw": RAW,"rle": RLE,"zlib": ZLIB}
+
+def encodeRLE(cells) -> bytes:
+    data = bytearray()
+    for state, run in itertools.groupby(cells):
+        count = sum(1 for n in run)
+        while count > 0:
+            data += bytes((min(count,256)-1,state))
+            count -= 256
+    return bytes(data)
+
+def decodeRLE(data,size) -> bytearray:
+    cells = bytearray()
+    for n in range(0,len(data)-1,2):
+        cells += bytes((data[n+1],))*(data[n]+1)
+    if len(cells) != size:
+        raise ValueError("RLE data has %d bytes, expected %d" % (len(cells),size))
+    return cells
+
+# writes a file through a temporary one replacing it at the end: a grid mapped from the old file keeps its pages
+# (writing it in place would truncate a live mapping) and a failed save leaves the old file as it was
+def replaceFile(path,data: bytes):
+    temporary = path+".tmp"
+    with open(temporary,"wb") as f:
+        f.write(data)
+    os.replace(temporary,path)
+
+def save(path,grid: GridModel,cellSize,compression=RAW):
+    cells = bytes(grid.cells) + bytes(grid.costs)
+    if compression == RLE:
+        cells = encodeRLE(cells)
+    elif compression == ZLIB:
+        cells = zlib.compress(cells)
+    replaceFile(path,HEADER.pack(MAGIC,FILE_VERSION,compression,cellSize,grid.columns,grid.rows,grid.start,grid.end) + cells)
+
+def saveJSON(path,grid: GridModel,cellSize):
+    replaceFile(path,json.dumps({"cellSize": cellSize, "dimensions": list(grid.dimensions), "grid": grid.getSaveDict(), "costs": grid.getCostsDict()}).encode())
+
+# returns (GridModel, cell size) from a binary or JSON file
+# mapped: RAW files are memory-mapped, False to read them into memory instead, for grids saved back to the file they
+# were loaded from (Windows can't replace a file while it is mapped)
+def load(path,mapped: bool = True) -> tuple:
+    with open(path,"rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            f.seek(0)
+            data = json.loads(f.read())
+            grid = GridModel(data["grid"],tuple(data["dimensions"]))
+            grid.loadCosts(data.get("costs",dict()))
+            return grid, data["cellSize"]
+        f.seek(0)
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError("truncated header")
+        magic, version, compression, cellSize, columns, rows, start, end = HEADER.unpack(header)
+        if version not in VERSIONS:
+            raise ValueError("unsupported grid file version %d" % version)
+        size = columns*rows
+        length = size*2 if version >= 2 else size # cells (+ costs)
+        if compression == RAW and not mapped:
+            data = bytearray(f.read(length))
+            if len(data) < length:
+                raise ValueError("truncated cells")
+        elif compression == RAW:
+            # private mapping: pages are only copied if the grid is edited, the file is never written
+            data = mmap.mmap(f.fileno(),0,access=mmap.ACCESS_COPY)
+            if len(data) < HEADER.size+length:
+                raise ValueError("truncated cells")
+            data = memoryview(data)[HEADER.size:HEADER.size+length]
+        elif compression == RLE:
+            data = decodeRLE(f.read(),length)
+        elif compression == ZLIB:
+            data = bytearray(zlib.decompress(f.read()))
+            if len(data) != length:
+                raise ValueError("zlib data has %d bytes, expected %d" % (len(data),length))
+        else:
+            raise ValueError("unknown compression %d" % compression)
+    if version < 2:
+        return GridModel(size=(columns,rows),cells=data,start=start,end=end), cellSize
+    return GridModel(size=(columns,rows),cells=data[:size],start=start,end=end,costs=data[size:]), cellSize
+
+# converts a grid file to another format ("raw", "rle", "zlib" or "json")
+def convert(source,destination,compression="raw"):
+    grid, cellSize = load(source)
+    if compression == "json":
+        saveJSON(destination,grid,cellSize)
+    else:
+        save(destination,grid,cellSize,COMPRESSIONS[compression])
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Convert .grd grid files between the JSON and binary formats.")
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    parser.add_argument("--compression",choices=list(COMPRESSIONS)+["json"],default="raw")
+    args = parser.parse_args(argv)
+    convert(args.source,args.destination,args.compression)
+    print("Converted %s -> %s (%s)" % (args.source,args.destination,args.compression))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# heuristics for the informed searches (A_Star and the algorithms built on it), by name
+# a heuristic gets the absolute row and column differences between two cells and returns an estimate of the cost
+# between them; with every move costing at least 1 (sqrt(2) diagonally, see PathFindingAlgorithm.moveCost):
+# - manhattan: admissible with 4 neighbours only
+# - octile: exact cost without obstacles and terrain with 8 neighbours, admissible in both modes
+# - chebyshev, euclidean: admissible in both modes, but weaker
+from model import SQRT2
+from math import sqrt
+
+def manhattan(dx,dy):
+    return dx + dy
+
+def octile(dx,dy):
+    return max(dx,dy) + (SQRT2-1)*min(dx,dy)
+
+def chebyshev(dx,dy):
+    return max(dx,dy)
+
+def euclidean(dx,dy):
+    return sqrt(dx*dx + dy*dy)
+
+HEURISTICS = {"manhattan": manhattan,"octile": octile,"chebyshev": chebyshev,"euclidean": euclidean} # name -> function(dx,dy)
+AUTO = "auto" # the heuristic that fits the neighbour mode (see resolve)
+ADMISSIBLE = {"octile","chebyshev","euclidean"} # never overestimate in either neighbour mode (manhattan: 4 neighbours only)
+
+# tie-breaking between nodes with the same f = g+h
+TIE_FIFO = "fifo" # first pushed first (frontier insertion order)
+TIE_HIGH_G = "high-g" # deepest node first, cuts the plateaus of equal f on open grids short
+TIE_LOW_H = "low-h" # node closest to the target first (same as high-g up to rounding)
+TIE_BREAKING = (TIE_FIFO,TIE_HIGH_G,TIE_LOW_H)
+
+# adds a heuristic function(dx,dy) that can be selected by name (e.g. a scaled one for weighted maps)
+# admissible: never overestimates the cost in both neighbour modes, the bounded searches can only prove
+# their suboptimality bound with an admissible heuristic
+def register(name,function,admissible=False):
+    if name == AUTO:
+        raise ValueError("'%s' is reserved" % AUTO)
+    HEURISTICS[name] = function
+    if admissible:
+        ADMISSIBLE.add(name)
+    else:
+        ADMISSIBLE.discard(name)
+
+# True if the heuristic never overestimates the cost in the neighbour mode
+def admissible(name,diagonal: bool) -> bool:
+    name = resolve(name,diagonal)[0]
+    return name in ADMISSIBLE or (name == "manhattan" and not diagonal)
+
+# (name, function) of a heuristic, AUTO/None for manhattan (4 neighbours) or octile (8 neighbours)
+def resolve(name,diagonal: bool) -> tuple:
+    if name is None or name == AUTO:
+        name = "octile" if diagonal else "manhattan"
+    if name not in HEURISTICS:
+        raise ValueError("unknown heuristic '%s' (%s)" % (name,", ".join(HEURISTICS)))
+    return name, HEURISTICS[name]
@@ -0,0 +1,252 @@
+# hierarchical path-finding (HPA*) preprocessing
+# the grid is split in clusterSize x clusterSize clusters, adjacent clusters are connected by transitions
+# (pairs of free cells on both sides of their border, one per entrance or one at each end of long entrances)
+# the transition cells are the nodes of an abstract graph, with inter-cluster edges (cost 1) and
+# intra-cluster edges (distances inside the cluster)
+# queries search the abstract graph and only refine the chosen edges (see algorithms.HPA_Star)
+from model import *
+from collections import deque
+import json
+
+CLUSTER_SIZE = 10
+LONG_ENTRANCE = 6 # entrances this long get a transition at each end instead of one in the middle
+FILE_VERSION = 1
+
+class ClusterGraph:
+    def __init__(self,grid: GridModel,diagonal: bool = False,clusterSize=CLUSTER_SIZE,build=True):
+        self.grid = grid
+        self.diagonal = diagonal
+        self.neighboursOrder = NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER
+        self.clusterSize = clusterSize
+        self.clusterRows = -(-grid.rows//clusterSize)
+        self.clusterColumns = -(-grid.columns//clusterSize)
+        self.clusters = self.clusterRows*self.clusterColumns
+        self.borders = dict() # (k,l) with k < l -> [(a,b)] transitions, a in cluster k and b in cluster l
+        self.inter = dict() # node -> {node: 1} inter-cluster edges
+        self.nodes = [set() for k in range(self.clusters)] # transition cells per cluster
+        self.intra = [dict() for k in range(self.clusters)] # per cluster: node -> {node: distance}
+        self.dirty = set() # clusters with blocked/unblocked cells since the last update
+        grid.listeners.append(self)
+        if build:
+            for k in range(self.clusters):
+                for l in self.adjacentClusters(k):
+                    if k < l:
+                        self.buildBorder(k,l)
+            for k in range(self.clusters):
+                self.buildIntra(k)
+
+    def detach(self):
+        if self in self.grid.listeners:
+            self.grid.listeners.remove(self)
+
+    def clusterOf(self,cell) -> int:
+        x,y = self.grid.coords(cell)
+        return (x//self.clusterSize)*self.clusterColumns + y//self.clusterSize
+
+    # (first row, first column, last row + 1, last column + 1) of a cluster
+    def bounds(self,k) -> tuple:
+        cx,cy = divmod(k,self.clusterColumns)
+        x0,y0 = cx*self.clusterSize, cy*self.clusterSize
+        return (x0,y0,min(x0+self.clusterSize,self.grid.rows),min(y0+self.clusterSize,self.grid.columns))
+
+    def adjacentClusters(self,k) -> list:
+        cx,cy = divmod(k,self.clusterColumns)
+        clusters = list()
+        for dir in self.neighboursOrder:
+            x,y = cx+dir[0], cy+dir[1]
+            if 0 <= x < self.clusterRows and 0 <= y < self.clusterColumns:
+                clusters.append(x*self.clusterColumns+y)
+        return clusters
+
+    def free(self,x,y) -> bool:
+        cell = self.grid.get(x,y)
+        return cell is not None and self.grid.cells[cell] != BLOCKED
+
+    # abstract graph neighbours of a node: [(node, distance)]
+    def neighbours(self,node) -> list:
+        edges = list(self.intra[self.clusterOf(node)].get(node,dict()).items())
+        edges += self.inter.get(node,dict()).items()
+        return edges
+
+    # GridModel listener
+    def onGridEdited(self,grid: GridModel,id,previous,previousHash):
+        if previous == BLOCKED or grid.cells[id] == BLOCKED:
+            self.dirty.add(self.clusterOf(id))
+
+    # rebuilds the borders of the edited clusters and the intra-cluster edges of every cluster whose transitions changed
+    def update(self):
+        if not self.dirty:
+            return
+        dirty = self.dirty
+        self.dirty = set()
+        changed = set(dirty)
+        for k in dirty:
+            for l in self.adjacentClusters(k):
+                before = set(self.nodes[l])
+                self.buildBorder(min(k,l),max(k,l))
+                if self.nodes[l] != before:
+                    changed.add(l)
+        for k in changed:
+            self.buildIntra(k)
+
+    # finds the transitions between two adjacent clusters (k < l)
+    def buildBorder(self,k,l):
+        for a,b in self.borders.pop((k,l),list()):
+            for u,v in ((a,b),(b,a)):
+                edges = self.inter[u]
+                edges.pop(v,None)
+                if not edges: # no transition left at u (it can have some on other borders)
+                    del self.inter[u]
+        kx0,ky0,kx1,ky1 = self.bounds(k)
+        lx0,ly0,lx1,ly1 = self.bounds(l)
+        transitions = list()
+        if lx0 == kx0 or ly0 == ky0: # side by side (l right of k) or on top of each other (l below k)
+            if lx0 == kx0:
+                cells = [((x,ky1-1),(x,ly0)) for x in range(kx0,kx1)]
+            else:
+                cells = [((kx1-1,y),(lx0,y)) for y in range(ky0,ky1)]
+            pairs = [self.free(*a) and self.free(*b) for a,b in cells]
+            # one or two transitions per entrance (run of free pairs)
+            n = 0
+            while n < len(cells):
+                if not pairs[n]:
+                    n += 1
+                    continue
+                end = n
+                while end+1 < len(cells) and pairs[end+1]:
+                    end += 1
+                if end-n+1 < LONG_ENTRANCE:
+                    transitions.append(cells[(n+end)//2])
+                else:
+                    transitions.append(cells[n])
+                    transitions.append(cells[end])
+                n = end+1
+            # diagonal crossings that aren't part of an entrance
+            if self.diagonal:
+                for n in range(len(cells)):
+                    for m in (n-1,n+1):
+                        if 0 <= m < len(cells) and not (pairs[n] and pairs[m]) and self.free(*cells[n][0]) and self.free(*cells[m][1]):
+                            transitions.append((cells[n][0],cells[m][1]))
+        elif ly0 > ky0: # l is down-right of k
+            transitions.append(((kx1-1,ky1-1),(lx0,ly0)))
+        else: # l is down-left of k
+            transitions.append(((kx1-1,ky0),(lx0,ly1-1)))
+        border = list()
+        for a,b in transitions:
+            if self.free(*a) and self.free(*b):
+                a, b = self.grid.get(*a), self.grid.get(*b)
+                border.append((a,b))
+                self.inter.setdefault(a,dict())[b] = 1
+                self.inter.setdefault(b,dict())[a] = 1
+        if border:
+            self.borders[(k,l)] = border
+        self.nodes[k] = self.clusterNodes(k)
+        self.nodes[l] = self.clusterNodes(l)
+
+    def clusterNodes(self,k) -> set:
+        nodes = set()
+        for l in self.adjacentClusters(k):
+            for a,b in self.borders.get((min(k,l),max(k,l)),list()):
+                nodes.add(a if k < l else b)
+        return nodes
+
+    # distances between the transition cells of a cluster
+    def buildIntra(self,k):
+        intra = dict()
+        nodes = self.nodes[k]
+        for node in nodes:
+            distances = self.search(node,k)[0]
+            intra[node] = {n: distances[n] for n in nodes if n != node and n in distances}
+        self.intra[k] = intra
+
+    # breadth first search restricted to a cluster, returns (distances, parents)
+    def search(self,source,k,target=None) -> tuple:
+        x0,y0,x1,y1 = self.bounds(k)
+        distances = {source: 0}
+        parents = dict()
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                break
+            x,y = self.grid.coords(node)
+            for dir in self.neighboursOrder:
+                nx,ny = x+dir[0], y+dir[1]
+                if x0 <= nx < x1 and y0 <= ny < y1:
+                    n = nx*self.grid.columns+ny
+                    if n not in distances and self.grid.cells[n] != BLOCKED:
+                        distances[n] = distances[node]+1
+                        parents[n] = node
+                        queue.append(n)
+        return distances, parents
+
+    # cells from a to b (inclusive) inside cluster k, None if b can't be reached
+    def refine(self,a,b,k) -> list:
+        if b in self.inter.get(a,dict()):
+            return [a,b]
+        parents = self.search(a,k,b)[1]
+        if b != a and b not in parents:
+            return None
+        cells = [b]
+        while cells[-1] != a:
+            cells.append(parents[cells[-1]])
+        cells.reverse()
+        return cells
+
+    def save(self,path):
+        self.update()
+        with open(path,"w") as f:
+            json.dump({
+                "version": FILE_VERSION,
+                "dimensions": list(self.grid.dimensions),
+                "diagonal": self.diagonal,
+                "clusterSize": self.clusterSize,
+                "obstacles": self.grid.obstacleHash(),
+                "borders": [[k,l,[list(t) for t in border]] for (k,l),border in self.borders.items()],
+                "intra": [[u,v,d] for k in range(self.clusters) for u,edges in self.intra[k].items() for v,d in edges.items()]},f)
+
+# loads a graph saved next to a grid, None if missing or saved for different obstacles/settings
+def loadGraph(path,grid: GridModel,diagonal: bool):
+    try:
+        with open(path,"r") as f:
+            data = json.load(f)
+    except (OSError,ValueError):
+        return None
+    if data.get("version") != FILE_VERSION or data["diagonal"] != diagonal or list(data["dimensions"]) != list(grid.dimensions) or data["obstacles"] != grid.obstacleHash():
+        return None
+    graph = ClusterGraph(grid,diagonal,data["clusterSize"],build=False)
+    for k,l,border in data["borders"]:
+        graph.borders[(k,l)] = [tuple(t) for t in border]
+        for a,b in border:
+            graph.inter.setdefault(a,dict())[b] = 1
+            graph.inter.setdefault(b,dict())[a] = 1
+    for k in range(graph.clusters):
+        graph.nodes[k] = graph.clusterNodes(k)
+        graph.intra[k] = {node: dict() for node in graph.nodes[k]}
+    for u,v,d in data["intra"]:
+        graph.intra[graph.clusterOf(u)][u][v] = d
+    return graph
+
+# path of the graph file saved next to a .grd file
+def graphPath(gridPath,diagonal: bool) -> str:
+    base = gridPath[:-4] if gridPath.endswith(".grd") else gridPath
+    return base + (".diagonal.hpa" if diagonal else ".hpa")
+
+CACHE = "hpa" # GridModel.caches key of the grid's graphs: {diagonal: ClusterGraph}
+
+# returns the graph of a grid, building it if necessary
+def getGraph(grid: GridModel,diagonal: bool) -> ClusterGraph:
+    graphs = grid.caches.setdefault(CACHE,dict())
+    graph = graphs.get(diagonal)
+    if graph is None:
+        graph = ClusterGraph(grid,diagonal)
+        graphs[diagonal] = graph
+    graph.update()
+    return graph
+
+def setGraph(grid: GridModel,graph: ClusterGraph):
+    graphs = grid.caches.setdefault(CACHE,dict())
+    old = graphs.get(graph.diagonal)
+    if old is not None and old is not graph:
+        old.detach()
+    graphs[graph.diagonal] = graph
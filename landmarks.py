@@ -0,0 +1,137 @@
+# landmark (ALT) lower bounds for A*
+# a few landmark cells, spread out by farthest-point selection, with their exact distance to every cell;
+# by the triangle inequality |d(L,target) - d(L,n)| <= d(n,target) for every landmark L
+# the tables only hold for the obstacles they were built for: edits mark them stale and getTables rebuilds them
+# they can be saved next to a grid file (.alt/.diagonal.alt, binary: header, landmark ids, int32 tables)
+from model import *
+from adjacency import getAdjacency
+from array import array
+from collections import deque
+import struct
+
+LANDMARKS = 4
+UNREACHABLE = -1
+MAGIC = b"PFLM"
+FILE_VERSION = 1
+HEADER = struct.Struct("<4sBBHII16s") # magic, version, diagonal, landmarks, columns, rows, obstacle hash
+
+class LandmarkTables:
+    def __init__(self,grid: GridModel,diagonal: bool = False,count=LANDMARKS,build=True):
+        self.grid = grid
+        self.diagonal = diagonal
+        self.count = count
+        self.landmarks = list() # cell ids
+        self.tables = list() # per landmark: array of distances to every cell (UNREACHABLE if none)
+        self.stale = False # obstacles changed since the tables were built
+        grid.listeners.append(self)
+        if build:
+            self.build()
+
+    def detach(self):
+        if self in self.grid.listeners:
+            self.grid.listeners.remove(self)
+
+    # breadth first distances from a cell to every cell
+    def distances(self,source) -> array:
+        adjacency = getAdjacency(self.grid,self.diagonal).neighbours
+        distances = array("i",[UNREACHABLE])*self.grid.size
+        distances[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            distance = distances[node]+1
+            for n in adjacency[node]:
+                if distances[n] == UNREACHABLE:
+                    distances[n] = distance
+                    queue.append(n)
+        return distances
+
+    # farthest-point selection: each landmark is the cell farthest from the previous ones
+    def build(self):
+        self.landmarks = list()
+        self.tables = list()
+        self.stale = False
+        first = next((id for id in range(self.grid.size) if self.grid.cells[id] != BLOCKED),None)
+        if first is None:
+            return
+        closest = self.distances(first) # distance to the closest landmark (to the first free cell at first)
+        for n in range(self.count):
+            landmark = max(range(self.grid.size),key=closest.__getitem__)
+            if closest[landmark] <= 0 and self.landmarks:
+                break # every reachable cell is a landmark already
+            table = self.distances(landmark)
+            self.landmarks.append(landmark)
+            self.tables.append(table)
+            for id in range(self.grid.size):
+                if table[id] < closest[id]:
+                    closest[id] = table[id]
+
+    # lower bound of the distance between two cells (0 if the landmarks don't tell anything)
+    def bound(self,a,b) -> int:
+        best = 0
+        for table in self.tables:
+            da, db = table[a], table[b]
+            if da != UNREACHABLE and db != UNREACHABLE and abs(da-db) > best:
+                best = abs(da-db)
+        return best
+
+    # GridModel listener
+    def onGridEdited(self,grid: GridModel,id,previous,previousHash):
+        if (previous == BLOCKED) != (grid.cells[id] == BLOCKED):
+            self.stale = True
+
+    def save(self,path):
+        with open(path,"wb") as f:
+            f.write(HEADER.pack(MAGIC,FILE_VERSION,self.diagonal,len(self.landmarks),self.grid.columns,self.grid.rows,bytes.fromhex(self.grid.obstacleHash())))
+            array("I",self.landmarks).tofile(f)
+            for table in self.tables:
+                table.tofile(f)
+
+# loads tables saved next to a grid, None if missing or saved for different obstacles/settings
+def loadTables(path,grid: GridModel,diagonal: bool):
+    try:
+        with open(path,"rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return None
+            magic, version, fileDiagonal, count, columns, rows, obstacles = HEADER.unpack(header)
+            if magic != MAGIC or version != FILE_VERSION or bool(fileDiagonal) != diagonal or (columns,rows) != tuple(grid.dimensions) or obstacles.hex() != grid.obstacleHash():
+                return None
+            landmarks = array("I")
+            landmarks.fromfile(f,count)
+            tables = list()
+            for n in range(count):
+                table = array("i")
+                table.fromfile(f,grid.size)
+                tables.append(table)
+    except (OSError,EOFError):
+        return None
+    landmarkTables = LandmarkTables(grid,diagonal,count,build=False)
+    landmarkTables.landmarks = list(landmarks)
+    landmarkTables.tables = tables
+    return landmarkTables
+
+# path of the tables file saved next to a .grd file
+def tablesPath(gridPath,diagonal: bool) -> str:
+    base = gridPath[:-4] if gridPath.endswith(".grd") else gridPath
+    return base + (".diagonal.alt" if diagonal else ".alt")
+
+CACHE = "landmarks" # GridModel.caches key of the grid's tables: {diagonal: LandmarkTables}
+
+# returns the landmark tables of a grid, (re)building them if necessary
+def getTables(grid: GridModel,diagonal: bool) -> LandmarkTables:
+    landmarkTables = grid.caches.setdefault(CACHE,dict())
+    tables = landmarkTables.get(diagonal)
+    if tables is None:
+        tables = LandmarkTables(grid,diagonal)
+        landmarkTables[diagonal] = tables
+    elif tables.stale:
+        tables.build()
+    return tables
+
+def setTables(grid: GridModel,tables: LandmarkTables):
+    landmarkTables = grid.caches.setdefault(CACHE,dict())
+    old = landmarkTables.get(tables.diagonal)
+    if old is not None and old is not tables:
+        old.detach()
+    landmarkTables[tables.diagonal] = tables
@@ -2,14 +2,22 @@ from algorithms import *
 from tkinter import *
 import tkinter.ttk as ttk
 from grid import *
-from queue import Queue
-from messages import *
 from os import listdir, mkdir, path
-import json
+import hpa
+import landmarks
+import heuristics
+import gridfile
+from render import RenderBuffer
+from flowfield import getFlowField, forgetFlowField
+from race import Race
+from raceview import RaceWindow
 
 CELL_SIZE = 30
 GRID_SIZE = (9,9)
+MAX_GRID_SIZE = 1024 # rows/columns (grids bigger than 16x16 are drawn on a canvas)
 DEFAULT_GRID = "hidden" # saved grid filename (no extension); None for default
+FRAME_TIME = 16 # ms between two applications of the search thread's changes
+GRID_COMPRESSION = gridfile.RAW # saved grids: RAW, RLE or ZLIB
 
 STATE_IDLE = 0
 STATE_RUNNING = 1
@@ -17,9 +25,6 @@ STATE_PAUSED = 2
 STATE_STEP = 3
 STATE_FINISHED = 4
 
-threadQueue = Queue() # message queue
-
-ALGORITHMS = [DepthFirstSearchStack,BreadthFirstSearch,Dijkstra,A_Star]
 SAVED_GRIDS_PATH = path.abspath(path.dirname(__file__)) + "/grids"
 
 class App():
@@ -46,6 +51,8 @@ class App():
 
         # algorithm selection
         self.algorithmThread = None
+        self.renderBuffer = None # changes of the running search thread, applied by onFrame
+        self.raceWindow = None # running or finished race (see onRaceClicked)
         self.createAlgorithmsSection()
 
         # execution state
@@ -74,6 +81,9 @@ class App():
         # select 1st algorithm
         self.algFrame.winfo_children()[0].invoke()
 
+        # render loop
+        self.window.after(FRAME_TIME,self.onFrame)
+
     # ttk style
     def createStyle(self):
         self.nStyle = ttk.Style()
@@ -127,6 +137,10 @@ class App():
         self.runPauseButton.pack(anchor=NW,padx=[8,10],pady=[10,0],fill=X)
         self.stepButton = ttk.Button(self.leftFrame,text="Step",style="NStyle.TButton")
         self.stepButton.pack(anchor=NW,padx=[8,10],pady=[5,0],fill=X)
+        self.instantButton = ttk.Button(self.leftFrame,text="Instant",style="NStyle.TButton")
+        self.instantButton.pack(anchor=NW,padx=[8,10],pady=[5,0],fill=X)
+        self.raceButton = ttk.Button(self.leftFrame,text="Race",style="NStyle.TButton") # every algorithm at once (see onRaceClicked)
+        self.raceButton.pack(anchor=NW,padx=[8,10],pady=[5,0],fill=X)
         self.stopButton = ttk.Button(self.leftFrame,text="Stop",style="StopButton.TButton")
         self.stopButton.pack(anchor=NW,padx=[8,10],pady=[5,0],fill=X)
         self.speedFrame = LabelFrame(self.leftFrame,text="Speed",padx=22,pady=0)
@@ -137,11 +151,33 @@ class App():
         self.clearButton = ttk.Button(self.leftFrame,text="Clear",style="StopButton.TButton")
         self.clearButton.pack(anchor=NW,padx=[8,10],pady=[5,5],fill=X)
         self.diagonalValue = BooleanVar()
-        self.diagonalSearchCheckbox = Checkbutton(self.leftFrame,text="Diagonal Search",variable=self.diagonalValue)
+        self.diagonalSearchCheckbox = Checkbutton(self.leftFrame,text="Diagonal Search",variable=self.diagonalValue,command=self.refreshFlowField)
         self.diagonalSearchCheckbox.pack(anchor=NW,padx=8,pady=[0,5])
+        self.flowFieldValue = BooleanVar()
+        self.flowFieldCheckbox = Checkbutton(self.leftFrame,text="Flow Field (to B)",variable=self.flowFieldValue,command=self.refreshFlowField)
+        self.flowFieldCheckbox.pack(anchor=NW,padx=8,pady=[0,5])
+        self.flowField = None # shown flow field (see refreshFlowField)
+        self.heuristicFrame = LabelFrame(self.leftFrame,text="Heuristic",padx=8,pady=2)
+        self.heuristicFrame.pack(anchor=NW,padx=5,fill=X)
+        self.heuristicValue = StringVar(value=heuristics.AUTO)
+        self.heuristicCombobox = ttk.Combobox(self.heuristicFrame,textvariable=self.heuristicValue,values=[heuristics.AUTO]+list(heuristics.HEURISTICS),state="readonly",width=10)
+        self.heuristicCombobox.pack(fill=X,pady=[0,2])
+        self.tieBreakingValue = StringVar(value=TIE_FIFO)
+        self.tieBreakingCombobox = ttk.Combobox(self.heuristicFrame,textvariable=self.tieBreakingValue,values=list(heuristics.TIE_BREAKING),state="readonly",width=10)
+        self.tieBreakingCombobox.pack(fill=X,pady=[0,2])
+        self.boundFrame = LabelFrame(self.leftFrame,text="Bound (ε) / Budget",padx=8,pady=2)
+        self.boundFrame.pack(anchor=NW,padx=5,fill=X)
+        self.epsilonValue = DoubleVar(value=EPSILON)
+        self.epsilonSpinbox = Spinbox(self.boundFrame,textvariable=self.epsilonValue,from_=1,to=5,increment=0.25,width=6,state="readonly")
+        self.epsilonSpinbox.pack(fill=X,pady=[0,2])
+        self.budgetValue = StringVar() # Instant time budget in ms, empty for none
+        self.budgetEntry = Entry(self.boundFrame,textvariable=self.budgetValue,width=6)
+        self.budgetEntry.pack(fill=X,pady=[0,2])
         # set handlers
         self.runPauseButton.configure(command=self.onRunPauseClicked)
         self.stepButton.configure(command=self.onStepClicked)
+        self.instantButton.configure(command=self.onInstantClicked)
+        self.raceButton.configure(command=self.onRaceClicked)
         self.stopButton.configure(command=self.onStopClicked)
         self.clearButton.configure(command=self.onClearClicked)
         self.speedScale.configure(command=self.onSpeedChanged)
@@ -153,7 +189,7 @@ class App():
     def createLegendSection(self):
         self.legendFrame = LabelFrame(self.rightFrame,text="Legend")
         self.legendFrame.pack(anchor=NW,padx=2)
-        legend = [("Empty",COLOR_EMPTY),("Blocked",COLOR_BLOCKED),("Start",COLOR_START),("End",COLOR_END),("Discovered",COLOR_DISCOVERED),("Visited",COLOR_VISITED),("Path",COLOR_PATH)]
+        legend = [("Empty",COLOR_EMPTY),("Terrain",COLOR_TERRAIN),("Blocked",COLOR_BLOCKED),("Start",COLOR_START),("End",COLOR_END),("Discovered",COLOR_DISCOVERED),("Visited",COLOR_VISITED),("Path",COLOR_PATH)]
         for n in legend:
             frame = Frame(self.legendFrame)
             frame.pack(side=LEFT)
@@ -170,6 +206,10 @@ class App():
         self.visitedLabel.pack(anchor=NW,padx=2)
         self.distanceLabel = Label(self.rightFrame,text="Distance: ")
         self.distanceLabel.pack(anchor=NW,padx=2)
+        self.heuristicLabel = Label(self.rightFrame,text="Heuristic: ")
+        self.heuristicLabel.pack(anchor=NW,padx=2)
+        self.boundLabel = Label(self.rightFrame,text="Bound (ε): ") # proven suboptimality bound of the path
+        self.boundLabel.pack(anchor=NW,padx=2)
         self.pathLabel = Label(self.rightFrame,text="Path: ",justify=LEFT,wraplength=300)
         self.pathLabel.pack(anchor=NW,padx=2)
         self.notesFrame = LabelFrame(self.rightFrame,text="Note")
@@ -180,7 +220,7 @@ class App():
     def createHelpSection(self):
         self.helpFrame = LabelFrame(self.rightFrame,text="Controls")
         self.helpFrame.pack(anchor=NW,padx=2)
-        controls = ["[Left-Click]: Block/Unblock", "[Right-Click]: Start/End"]
+        controls = ["[Left-Click]: Block/Unblock", "[Shift+Left-Click]: Terrain cost", "[Right-Click]: Start/End", "[Wheel/Middle-Drag]: Zoom/Pan (>16x16)"]
         for n in controls:
             Label(self.helpFrame,text=n).pack(side=LEFT,padx=5)
 
@@ -212,9 +252,13 @@ class App():
             n.destroy()
         grid = self.loadGrid(name) if name != 0 else None
         if grid:
-            self.grid = Grid(self.gridFrame,self.dummyImage,self.onCellClick,grid=grid["grid"],cellSize=grid["cellSize"],size=grid["dimensions"])
+            model, cellSize = grid
+            self.grid = createGrid(self.gridFrame,self.dummyImage,self.onCellClick,cellSize=cellSize,model=model)
+            self.loadGraphs(SAVED_GRIDS_PATH+"/"+name+".grd")
+            self.loadLandmarks(SAVED_GRIDS_PATH+"/"+name+".grd")
         else:
-            self.grid = Grid(self.gridFrame,self.dummyImage,self.onCellClick,None,CELL_SIZE,GRID_SIZE)
+            self.grid = createGrid(self.gridFrame,self.dummyImage,self.onCellClick,None,CELL_SIZE,GRID_SIZE)
+        self.refreshFlowField()
         if self.state != STATE_IDLE:
             self.state = STATE_IDLE
             self.__resetStats()
@@ -235,14 +279,14 @@ class App():
         topFrame = Frame(window)
         topFrame.pack(fill=X)
         validate = (window.register(self.__validateGridSize),'%d', '%i', '%P')
-        rowsField = Entry(topFrame, font="TkDefaultFont 16",width=3, validate='key', validatecommand=validate)
+        rowsField = Entry(topFrame, font="TkDefaultFont 16",width=4, validate='key', validatecommand=validate)
         rowsField.insert(0,str(self.grid.dimensions[0]))
         rowsField.grid(row=0,column=0,sticky=N+W+E)
         Label(topFrame,text="X",justify="center",width=1).grid(row=0,column=1,sticky=N+W+E)
         topFrame.grid_columnconfigure(0,weight=1)
         topFrame.grid_columnconfigure(1,weight=1)
         topFrame.grid_columnconfigure(2,weight=1)
-        columnsField = Entry(topFrame, font="TkDefaultFont 16",width=3, validate='key', validatecommand=validate)
+        columnsField = Entry(topFrame, font="TkDefaultFont 16",width=4, validate='key', validatecommand=validate)
         columnsField.grid(row=0,column=2,sticky=N+W+E)
         columnsField.insert(0,str(self.grid.dimensions[1]))
         # cell size
@@ -281,15 +325,16 @@ class App():
     def onGridResize(self,window,rowsField,columnsField,cellSizeField):
         global CELL_SIZE
         try:
-            x = max(2,min(int(rowsField.get()),16))
-            y = max(2,min(int(columnsField.get()),16))
+            x = max(2,min(int(rowsField.get()),MAX_GRID_SIZE))
+            y = max(2,min(int(columnsField.get()),MAX_GRID_SIZE))
             cellSize = max(15,min(int(cellSizeField.get()),40))
             if (x != self.grid.dimensions[0] or y != self.grid.dimensions[1]):
                 # destroy current grid
                 for n in self.gridFrame.winfo_children():
                     n.destroy()
                 # create default with new size
-                self.grid = Grid(self.gridFrame,self.dummyImage,self.onCellClick,None,cellSize,(x,y))
+                self.grid = createGrid(self.gridFrame,self.dummyImage,self.onCellClick,None,cellSize,(x,y))
+                self.refreshFlowField()
                 # reset state
                 self.state = STATE_IDLE
                 self.__resetStats()
@@ -301,13 +346,11 @@ class App():
         window.destroy()
         
     # file -> filename without extension
+    # returns (GridModel, cell size), binary and JSON files are both read (see gridfile.py)
+    # read into memory rather than mapped: the grid is edited and can be saved back over its file
     def loadGrid(self,file):
         try:
-            f = open(SAVED_GRIDS_PATH+"/"+file+".grd","r")
-            gridData = f.read()
-            grid = json.loads(gridData)
-            f.close()
-            return grid
+            return gridfile.load(SAVED_GRIDS_PATH+"/"+file+".grd",mapped=False)
         except:
             print("Failed to read file: ", SAVED_GRIDS_PATH+"/"+file)
         return None
@@ -328,47 +371,112 @@ class App():
             filename = field.get() or "mygrid"
             filename = filename.replace(" ", "_")
             filepath = SAVED_GRIDS_PATH+"/"+filename+".grd"
-            f = open(filepath,"w")
-            f.write(json.dumps({"cellSize": CELL_SIZE, "dimensions": self.grid.dimensions, "grid": self.grid.getSaveDict()}))
-            f.close()
+            gridfile.save(filepath,self.grid.model,CELL_SIZE,GRID_COMPRESSION)
+            self.saveGraphs(filepath)
+            self.saveLandmarks(filepath)
             print("Saved grid to:", filename)
         except Exception: print("Failed to save grid..")
         #window.grab_release()
         window.destroy()
 
+    # loads the HPA* cluster graphs saved next to a grid file (if still valid for its obstacles)
+    def loadGraphs(self,filepath):
+        for diagonal in (False,True):
+            graph = hpa.loadGraph(hpa.graphPath(filepath,diagonal),self.grid.model,diagonal)
+            if graph:
+                hpa.setGraph(self.grid.model,graph)
+
+    # saves the HPA* cluster graphs built for the current grid next to its file
+    def saveGraphs(self,filepath):
+        for diagonal, graph in self.grid.model.caches.get(hpa.CACHE,dict()).items():
+            graph.save(hpa.graphPath(filepath,diagonal))
+
+    # loads the ALT landmark tables saved next to a grid file (if still valid for its obstacles)
+    def loadLandmarks(self,filepath):
+        for diagonal in (False,True):
+            tables = landmarks.loadTables(landmarks.tablesPath(filepath,diagonal),self.grid.model,diagonal)
+            if tables:
+                landmarks.setTables(self.grid.model,tables)
+
+    # saves the ALT landmark tables built for the current grid next to its file
+    def saveLandmarks(self,filepath):
+        for diagonal, tables in self.grid.model.caches.get(landmarks.CACHE,dict()).items():
+            if tables.stale:
+                tables.build()
+            tables.save(landmarks.tablesPath(filepath,diagonal))
+
     # enables/disables buttons that shouldn't be clickable in runtime
     def setButtonsState(self,val):
         for rb in self.algFrame.winfo_children():
             rb.configure(state = val)
         self.clearButton.configure(state = val)
+        self.instantButton.configure(state = val)
+        self.raceButton.configure(state = val)
         if val == "enabled":
             self.menu.entryconfigure(1,state ="normal")
             self.diagonalSearchCheckbox.configure(state = "normal")
+            self.heuristicCombobox.configure(state = "readonly")
+            self.tieBreakingCombobox.configure(state = "readonly")
+            self.epsilonSpinbox.configure(state = "readonly")
+            self.budgetEntry.configure(state = "normal")
         else:
             self.menu.entryconfigure(1,state = val)
             self.diagonalSearchCheckbox.configure(state = val)
+            self.heuristicCombobox.configure(state = val)
+            self.tieBreakingCombobox.configure(state = val)
+            self.epsilonSpinbox.configure(state = val)
+            self.budgetEntry.configure(state = val)
 
         # creates a thread for the chosen algorithm
     
     def initSearchAlgorithm(self,step=False):
-        # threadQueue.get() -> to clear queue?
         if not self.algorithmThread: # create thread
-            self.algorithmThread = ALGORITHMS[self.algorithm.get()](threadQueue,self,self.grid,self.speed.get(),self.diagonalValue.get(),step)
+            # the thread only writes to the render buffer, Tk is updated from the main loop (see onFrame)
+            # and is controlled through its own control channel (algorithmThread.control)
+            self.renderBuffer = RenderBuffer()
+            self.algorithmThread = ALGORITHMS[self.algorithm.get()](None,self.renderBuffer,self.grid.model,self.speed.get(),self.diagonalValue.get(),step)
+            self.algorithmThread.view = self.renderBuffer
+            self.algorithmThread.setHeuristic(self.heuristicValue.get(),self.tieBreakingValue.get())
+            self.algorithmThread.setEpsilon(self.epsilonValue.get())
+            self.showHeuristic(ALGORITHMS[self.algorithm.get()])
+
+    # selected heuristic and tie-breaking policy, if the algorithm (class) uses them
+    def showHeuristic(self,algorithm):
+        if algorithm.informed:
+            name = heuristics.resolve(self.heuristicValue.get(),self.diagonalValue.get())[0]
+            self.heuristicLabel.configure(text="Heuristic: %s (%s)" % (name,self.tieBreakingValue.get()))
+        else:
+            self.heuristicLabel.configure(text="Heuristic: -")
 
-    # on grid click
-    def onCellClick(self,cell,left=False):
+    # on grid click (cell id)
+    def onCellClick(self,id,left=False,terrain=False):
         if self.state != STATE_IDLE:
             return
-        if left: # block/unblock
-            cell.block() # calls update
+        if terrain: # next terrain cost (1..TERRAIN_LEVELS)
+            self.grid.model.setCost(id,self.grid.model.costs[id] % TERRAIN_LEVELS + 1)
+        elif left: # block/unblock
+            self.grid.model.block(id) # the model updates the view
         else: # start/end
             self.startEndFlip = not self.startEndFlip
             if self.startEndFlip:
-                self.grid.replaceStart(cell)
+                self.grid.model.replaceStart(id)
             else:
-                self.grid.replaceEnd(cell)
-        # check start/end integrity
-        self.grid.integrityCheck()
+                self.grid.model.replaceEnd(id)
+        self.refreshFlowField()
+
+    # shows the flow field towards B as arrows if enabled, the field (kept on the grid, see getFlowField) repairs
+    # itself after edits, the ones not shown anymore are dropped
+    def refreshFlowField(self):
+        model = self.grid.model
+        diagonal = self.diagonalValue.get()
+        field = self.flowField
+        if field and (not self.flowFieldValue.get() or field.grid is not model or field.target != model.end or field.diagonal != diagonal):
+            forgetFlowField(field.grid,field.target,field.diagonal)
+            field = None
+        if field is None and self.flowFieldValue.get():
+            field = getFlowField(model,model.end,diagonal)
+        self.flowField = field
+        self.grid.showArrows(field)
 
     # event handlers
     def onAlgorithmChanged(self):
@@ -398,14 +506,12 @@ class App():
             self.state = STATE_PAUSED
             self.runPauseButton.configure(text="Resume")
             self.stateLabel.configure(text="State: Paused")
-            # send message
-            threadQueue.put((MSG_PAUSE,))
+            self.algorithmThread.control.pause()
         elif self.state == STATE_PAUSED or self.state == STATE_STEP:
             self.state = STATE_RUNNING
             self.runPauseButton.configure(text="Pause")
             self.stateLabel.configure(text="State: Running")
-            # send message
-            threadQueue.put((MSG_PAUSE,))
+            self.algorithmThread.control.resume()
         #self.window.focus() # remove focus from the button
 
     def onStepClicked(self):
@@ -423,14 +529,50 @@ class App():
             # run
             self.algorithmThread.start()
         else: # assume thread is running
-            # send message
-            threadQueue.put((MSG_STEP,))
+            self.algorithmThread.control.step()
+
+    # solves synchronously (no animation) and displays the result
+    def onInstantClicked(self):
+        if self.state != STATE_IDLE and self.state != STATE_FINISHED:
+            return
+        if self.state == STATE_FINISHED:
+            self.grid.clean()
+            self.__resetStats()
+        algorithm = ALGORITHMS[self.algorithm.get()]
+        budget = self.getBudget()
+        result = solve(self.grid.model,algorithm=algorithm,diagonal=self.diagonalValue.get(),heuristic=self.heuristicValue.get(),tieBreaking=self.tieBreakingValue.get(),
+                       epsilon=self.epsilonValue.get(),timeLimit=budget)
+        self.showHeuristic(algorithm)
+        self.grid.onCellsChanged({n: state for n, state in enumerate(result.marks) if state})
+        self.onSearchComplete(result.iterations,result.visited,result.path,result.bound)
+        self.stateLabel.configure(text="State: %s (%.2f ms)" % ("Finished" if result.complete else "Out of budget",result.time*1000))
+
+    # Instant time budget in seconds, None if not set (or not a positive number)
+    def getBudget(self):
+        try:
+            budget = float(self.budgetValue.get())
+        except ValueError:
+            return None
+        return budget/1000 if budget > 0 else None
+
+    # races every algorithm on a snapshot of the grid, one worker process each, in a separate window
+    # the grid can be edited during the race, the workers keep searching the snapshot
+    def onRaceClicked(self):
+        if self.state != STATE_IDLE and self.state != STATE_FINISHED:
+            return
+        if self.raceWindow:
+            self.raceWindow.close()
+        race = Race(self.grid.model,diagonal=self.diagonalValue.get(),heuristic=self.heuristicValue.get(),tieBreaking=self.tieBreakingValue.get(),epsilon=self.epsilonValue.get())
+        self.raceWindow = RaceWindow(self.window,self.dummyImage,race.start(),onClose=self.onRaceClosed)
+
+    def onRaceClosed(self):
+        self.raceWindow = None
 
     def onStopClicked(self):
         if self.algorithmThread:
-            # send message
-            threadQueue.put(None)
+            self.algorithmThread.control.cancel()
         self.algorithmThread = None
+        self.renderBuffer = None # late changes of the stopped thread are dropped
         self.state = STATE_IDLE
         self.runPauseButton.configure(text="Run")
         self.setButtonsState("enabled")
@@ -439,26 +581,47 @@ class App():
 
     def onSpeedChanged(self,val):
         if self.algorithmThread:
-            # send message
-            threadQueue.put((MSG_SPEED,val))
+            self.algorithmThread.control.setSpeed(val)
 
     def onClearClicked(self):
         if self.state != STATE_IDLE and self.state != STATE_FINISHED:
             return
         self.grid.clear()
 
-    def onStep(self,iter,visited):
+    # applies the search changes buffered since the previous frame: final cell states and stats, once per frame
+    def onFrame(self):
+        buffer = self.renderBuffer
+        if buffer:
+            cells, stats, result = buffer.drain()
+            self.grid.onCellsChanged(cells)
+            if stats:
+                self.onStep(*stats)
+            if result:
+                self.renderBuffer = None
+                self.onSearchComplete(*result)
+        if self.raceWindow:
+            self.raceWindow.update()
+        self.window.after(FRAME_TIME,self.onFrame)
+
+    def onStep(self,iter,visited,bound=None):
         self.iterationsLabel.configure(text="Iterations: " + str(iter))
         self.visitedLabel.configure(text="Visited: " + str(visited))
+        if bound is not None: # anytime search with a solution
+            self.showBound(bound)
+
+    # proven suboptimality bound of the current path (the path costs at most bound times the shortest one)
+    def showBound(self,bound):
+        self.boundLabel.configure(text="Bound (ε): " + ("-" if bound is None else "%.3f" % bound))
 
-    def onSearchComplete(self,iter,visited,path):
+    def onSearchComplete(self,iter,visited,path,bound=None):
         self.state = STATE_FINISHED
         self.runPauseButton.configure(text="Run")
         self.stateLabel.configure(text="State: Finished")
         self.iterationsLabel.configure(text="Iterations: " + str(iter))
         self.visitedLabel.configure(text="Visited: " + str(visited))
-        self.distanceLabel.configure(text="Distance: " + str(len(path)))
-        self.pathLabel.configure(text="Path: " + str(path))
+        self.distanceLabel.configure(text="Distance: " + str(len(path)) + " (cost: %g)" % round(self.grid.model.pathCost(path),2))
+        self.pathLabel.configure(text="Path: [" + ", ".join(self.grid.cellText(n) for n in path) + "]")
+        self.showBound(bound)
         self.algorithmThread = None
         self.setButtonsState("enabled")
 
@@ -468,13 +631,16 @@ class App():
         self.iterationsLabel.configure(text="Iterations:")
         self.visitedLabel.configure(text="Visited:")
         self.distanceLabel.configure(text="Distance:")
+        self.heuristicLabel.configure(text="Heuristic:")
+        self.boundLabel.configure(text="Bound (ε):")
         self.pathLabel.configure(text="Path:")
 
     def __centerWindow(self,window):
         x, y = self.window.winfo_x() + self.window.winfo_reqwidth()*0.5 - window.winfo_reqwidth()*0.5, self.window.winfo_y() + self.window.winfo_reqheight()*0.5 - window.winfo_reqheight()*0.5
         window.geometry("+%d+%d" % (x,y))
 
-# create app
-app = App()
-# run loop
-app.window.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    # create app
+    app = App()
+    # run loop
+    app.window.mainloop()
\ No newline at end of file
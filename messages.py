@@ -1,5 +0,0 @@
-# multithread queue messages
-# None -> STOP
-MSG_SPEED = 1
-MSG_PAUSE = 2
-MSG_STEP = 3
\ No newline at end of file
@@ -0,0 +1,210 @@
+import hashlib
+from math import sqrt
+
+# headless grid model
+# the layout is kept in a flat bytearray indexed by cell id (row*columns+column),
+# the tkinter Grid/Cell widgets (grid.py) are an optional view on top of it
+
+EMPTY = 0
+START = 1
+END = 2
+BLOCKED = 3
+DISCOVERED = 4
+VISITED = 5
+PATH = 6
+
+# order in which getNeighbours(cell) returns 
+# [(-1,0),(1,0),(0,-1),(0,1)] # WEST, EAST, NORTH, SOUTH
+NEIGHBOURS_ORDER = [(0,1),(1,0),(0,-1),(-1,0)] # N, E, S, W
+NEIGHBOURS_ORDER_DIAGONAL = [(0,1),(1,1),(1,0),(1,-1),(0,-1),(-1,-1),(-1,0),(-1,1)] # N, NE, E, SE, S, SW, W, NW
+
+DEFAULT_COST = 1 # terrain cost of entering a cell, 1..MAX_COST (blocked cells keep theirs, it's unused)
+MAX_COST = 255
+
+SQRT2 = sqrt(2)
+
+OBSTACLES = bytes(BLOCKED if n == BLOCKED else EMPTY for n in range(256)) # translation table, keeps only BLOCKED
+
+class GridModel:
+    # grid: saved grid dict ([row][col]: state), None for an empty grid
+    # cells: existing cell buffer (e.g. shared memory) used as is, without copying or writing to it
+    # costs: existing terrain cost buffer (one byte per cell) used as is, None for DEFAULT_COST everywhere
+    def __init__(self,grid=None,size=(8,8),cells=None,start=0,end=None,costs=None):
+        columns,rows = size
+        self.dimensions = size
+        self.columns = columns
+        self.rows = rows
+        self.size = columns*rows
+        self.view = None # optional listener, receives onCellChanged(id,state)
+        self.listeners = list() # layout edit listeners, receive onGridEdited(grid,id,previous,previousHash)
+        self.version = 0 # bumped on every layout edit
+        self.hash = None # content hash cache (see contentHash)
+        self.start = start
+        self.end = self.size-1 if end is None else end
+        if cells is not None:
+            self.cells = cells
+        else:
+            self.cells = bytearray(self.size) # EMPTY/START/END/BLOCKED per cell
+            if grid is not None:
+                self.load(grid)
+            self.cells[self.start] = START
+            self.cells[self.end] = END
+        self.costs = costs if costs is not None else bytearray([DEFAULT_COST])*self.size
+        self.highestCost = None # maxCost cache
+        # data derived from the grid by other modules (LPA* state, adjacency, component index..), name -> data
+        # kept on the grid so that it goes away with it: module-level caches keyed by the grid would keep it alive
+        # through their values (they reference the grid and are its listeners)
+        self.caches = dict()
+
+    # loads a saved grid dict ([row][col]: state)
+    def load(self,grid):
+        for row in range(self.rows):
+            rowData = grid.get(str(row)) or dict() # row and col are str because of the JSON parser
+            for col in range(self.columns):
+                state = rowData.get(str(col)) or EMPTY
+                id = row*self.columns+col
+                if state == START:
+                    self.start = id
+                elif state == END:
+                    self.end = id
+                elif state == BLOCKED:
+                    self.cells[id] = BLOCKED
+
+    # loads saved terrain costs ({row: {col: cost}}, only the cells that don't have DEFAULT_COST)
+    def loadCosts(self,costs):
+        for row, rowData in costs.items():
+            for col, cost in rowData.items():
+                self.costs[int(row)*self.columns+int(col)] = cost
+
+    # returns the id of the cell at row x, column y (None if out of bounds)
+    def get(self,x,y):
+        if 0 <= x < self.rows and 0 <= y < self.columns:
+            return x*self.columns+y
+        return None
+
+    # returns (row,column) of a cell id
+    def coords(self,id):
+        return divmod(id,self.columns)
+
+    # highest terrain cost, computed once and kept up to date by setCost
+    def maxCost(self):
+        if self.highestCost is None:
+            self.highestCost = max(self.costs)
+        return self.highestCost
+
+    # cost of a path of neighbouring cells: the terrain cost of every cell moved to, times sqrt(2) for diagonal moves
+    def pathCost(self,path):
+        cost = 0
+        for a, b in zip(path,path[1:]):
+            (ax,ay), (bx,by) = self.coords(a), self.coords(b)
+            cost += self.costs[b]*SQRT2 if ax != bx and ay != by else self.costs[b]
+        return cost
+
+    def isBlocked(self,id) -> bool:
+        return self.cells[id] == BLOCKED
+
+    # forwards a state change to the view (if any)
+    def notify(self,id,state):
+        if self.view:
+            self.view.onCellChanged(id,state)
+
+    # content hash of the layout and terrain costs, recomputed lazily after edits
+    def contentHash(self) -> bytes:
+        if self.hash is None:
+            hash = hashlib.blake2b(self.cells,digest_size=16)
+            hash.update(self.costs)
+            self.hash = hash.digest()
+        return self.hash
+
+
+    # hash of the blocked cells only (ignores where start/end are),
+    # for data that only depends on the obstacles
+    def obstacleHash(self) -> str:
+        return hashlib.blake2b(bytes(self.cells).translate(OBSTACLES),digest_size=16).hexdigest()
+
+    # sets a cell's layout state, bumps the version and informs the listeners and the view
+    def edit(self,id,state):
+        previous = self.cells[id]
+        if previous == state:
+            return
+        previousHash = self.hash
+        self.cells[id] = state
+        self.hash = None
+        self.version += 1
+        for listener in self.listeners:
+            listener.onGridEdited(self,id,previous,previousHash)
+        self.notify(id,state)
+
+    # sets a cell's terrain cost, the listeners receive an edit where previous is the (unchanged) state
+    def setCost(self,id,cost):
+        if not 1 <= cost <= MAX_COST:
+            raise ValueError("terrain cost must be between 1 and %d" % MAX_COST)
+        previousCost = self.costs[id]
+        if previousCost == cost:
+            return
+        if self.highestCost is not None:
+            if cost > self.highestCost:
+                self.highestCost = cost
+            elif previousCost == self.highestCost:
+                self.highestCost = None # might have been the only one
+        previousHash = self.hash
+        self.costs[id] = cost
+        self.hash = None
+        self.version += 1
+        for listener in self.listeners:
+            listener.onGridEdited(self,id,self.cells[id],previousHash)
+        self.notify(id,self.cells[id])
+
+    # blocks or unblocks the cell depending on its current state
+    # doesn't do anything if START/END
+    def block(self,id):
+        if id == self.start or id == self.end:
+            return
+        self.edit(id,EMPTY if self.cells[id] == BLOCKED else BLOCKED)
+
+    # unblocks every cell and resets the terrain costs
+    def clear(self):
+        for id in range(self.size):
+            if self.cells[id] == BLOCKED:
+                self.edit(id,EMPTY)
+            if self.costs[id] != DEFAULT_COST:
+                self.setCost(id,DEFAULT_COST)
+
+    def replaceStart(self,id):
+        if id == self.end or id == self.start:
+            self.reverseStart()
+        else:
+            previous = self.start
+            self.start = id
+            self.edit(previous,EMPTY)
+            self.edit(id,START)
+
+    def replaceEnd(self,id):
+        if id == self.end or id == self.start:
+            self.reverseStart()
+        else:
+            previous = self.end
+            self.end = id
+            self.edit(previous,EMPTY)
+            self.edit(id,END)
+
+    def reverseStart(self):
+        self.start, self.end = self.end, self.start
+        self.edit(self.start,START)
+        self.edit(self.end,END)
+
+    def getSaveDict(self):
+        save = {k:dict() for k in range(self.rows)}
+        for row in save.keys():
+            for column in range(self.columns):
+                save[row][column] = self.cells[row*self.columns+column]
+        return save
+
+    # terrain costs that aren't DEFAULT_COST ({row: {col: cost}})
+    def getCostsDict(self):
+        save = dict()
+        for id in range(self.size):
+            if self.costs[id] != DEFAULT_COST:
+                row, column = self.coords(id)
+                save.setdefault(row,dict())[column] = self.costs[id]
+        return save
@@ -0,0 +1,185 @@
+# search instrumentation (see PathFindingAlgorithm.instrument and solve(profile=...))
+# attaching a SearchProfile shadows the algorithm's step() and getPath(), its neighbour methods (algorithm.neighbourMethods)
+# and wraps its frontiers (algorithm.frontiers) on the instance only, detaching restores them:
+# algorithms that aren't instrumented run the exact same code as before
+# - counters: expansions, frontier pushes/pops, peak frontier size, neighbour lookups
+# - timers: neighbour generation, frontier operations, bookkeeping (the rest of step() and getPath())
+# - optional tracemalloc peak memory and Chrome trace events (chrome://tracing, ui.perfetto.dev)
+import json
+import time
+import tracemalloc
+
+FRONTIER_PUSHES = ("push","put","append","appendleft")
+FRONTIER_POPS = ("pop","get","popleft","remove")
+MAX_TRACE_EVENTS = 200000 # later events are dropped (see SearchProfile.dropped)
+
+# object.attribute.attribute.. -> (object holding the last attribute, last attribute name)
+def resolve(obj,path) -> tuple:
+    names = path.split(".")
+    for name in names[:-1]:
+        obj = getattr(obj,name)
+    return obj, names[-1]
+
+# forwards everything to a frontier (PriorityQueue, list, deque, Queue), counting and timing pushes/pops
+class ProfiledFrontier:
+    def __init__(self,frontier,profile,name):
+        self.frontier = frontier
+        for method in FRONTIER_PUSHES + FRONTIER_POPS:
+            if hasattr(frontier,method):
+                setattr(self,method,profile.wrapFrontier(getattr(frontier,method),name,method in FRONTIER_PUSHES,self))
+
+    def __getattr__(self,name):
+        return getattr(self.frontier,name)
+
+    def __len__(self) -> int:
+        return len(self.frontier) if hasattr(self.frontier,"__len__") else self.frontier.qsize()
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self,node) -> bool:
+        return node in self.frontier
+
+    def __iter__(self):
+        return iter(self.frontier)
+
+    def __iadd__(self,nodes): # list frontiers (stack += nodes)
+        push = self.append
+        for node in nodes:
+            push(node)
+        return self
+
+class SearchProfile:
+    def __init__(self,memory: bool = False,trace: bool = False):
+        self.memory = memory # tracemalloc peak (slows the search down, unlike the rest)
+        self.trace = trace # keep a Chrome trace event per step/neighbour lookup/frontier operation
+        self.algorithm = None
+        self.expansions = 0
+        self.iterations = 0
+        self.pushes = 0
+        self.pops = 0
+        self.peakFrontier = 0
+        self.neighbourLookups = 0
+        self.searchTime = 0.0 # in step() and getPath()
+        self.neighbourTime = 0.0
+        self.frontierTime = 0.0
+        self.peakMemory = None
+        self.events = list()
+        self.dropped = 0
+        self.origin = 0.0
+        self.restore = list() # (object, attribute, previous value or None if it was a class attribute)
+
+    def attach(self,algorithm):
+        self.algorithm = algorithm
+        self.origin = time.perf_counter()
+        self.tracing = False
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing = True
+        self.shadow(algorithm,"step",self.wrapSearch(algorithm.step,"step"))
+        self.shadow(algorithm,"getPath",self.wrapSearch(algorithm.getPath,"getPath"))
+        for path in algorithm.neighbourMethods:
+            obj, name = resolve(algorithm,path)
+            self.shadow(obj,name,self.wrapNeighbours(getattr(obj,name),name))
+        for path in algorithm.frontiers:
+            obj, name = resolve(algorithm,path)
+            self.shadow(obj,name,ProfiledFrontier(getattr(obj,name),self,path))
+
+    # stops the memory tracing and removes the wrappers
+    def detach(self):
+        if self.algorithm is None:
+            return
+        if self.tracing:
+            self.peakMemory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        for obj, name, previous in reversed(self.restore):
+            if previous is None:
+                delattr(obj,name)
+            else:
+                setattr(obj,name,previous)
+        self.restore.clear()
+        self.expansions = self.algorithm.visited
+        self.iterations = self.algorithm.iterations
+
+    def shadow(self,obj,name,value):
+        self.restore.append((obj,name,obj.__dict__.get(name)))
+        setattr(obj,name,value)
+
+    def event(self,name,start,end):
+        if len(self.events) < MAX_TRACE_EVENTS:
+            self.events.append({"name": name,"ph": "X","ts": (start-self.origin)*1e6,"dur": (end-start)*1e6,"pid": 0,"tid": 0})
+        else:
+            self.dropped += 1
+
+    def wrapSearch(self,method,name):
+        clock = time.perf_counter
+        def profiledSearch():
+            start = clock()
+            value = method()
+            end = clock()
+            self.searchTime += end-start
+            if self.trace:
+                self.event(name,start,end)
+            return value
+        return profiledSearch
+
+    def wrapNeighbours(self,method,name):
+        clock = time.perf_counter
+        def profiledNeighbours(*args):
+            start = clock()
+            neighbours = method(*args)
+            end = clock()
+            self.neighbourTime += end-start
+            self.neighbourLookups += 1
+            if self.trace:
+                self.event(name,start,end)
+            return neighbours
+        return profiledNeighbours
+
+    def wrapFrontier(self,method,name,push,frontier):
+        clock = time.perf_counter
+        def profiledFrontier(*args):
+            start = clock()
+            value = method(*args)
+            end = clock()
+            self.frontierTime += end-start
+            if push:
+                self.pushes += 1
+                size = len(frontier)
+                if size > self.peakFrontier:
+                    self.peakFrontier = size
+            else:
+                self.pops += 1
+            if self.trace:
+                self.event(name + "." + method.__name__,start,end)
+            return value
+        return profiledFrontier
+
+    def toDict(self) -> dict:
+        algorithm = type(self.algorithm) if self.algorithm else None
+        return {
+            "algorithm": (algorithm.name or algorithm.__name__) if algorithm else None,
+            "iterations": self.iterations,
+            "expansions": self.expansions,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "peakFrontier": self.peakFrontier,
+            "neighbourLookups": self.neighbourLookups,
+            "time": {
+                "total": self.searchTime,
+                "neighbours": self.neighbourTime,
+                "frontier": self.frontierTime,
+                "bookkeeping": max(0.0,self.searchTime-self.neighbourTime-self.frontierTime)},
+            "peakMemory": self.peakMemory}
+
+    def save(self,path):
+        with open(path,"w") as f:
+            json.dump(self.toDict(),f,indent=1)
+
+    # Chrome trace event file (trace=True)
+    def saveTrace(self,path):
+        with open(path,"w") as f:
+            json.dump({"traceEvents": self.events,"displayTimeUnit": "ms","otherData": self.toDict()},f)
+
+    def __repr__(self) -> str:
+        return "SearchProfile(%s)" % ", ".join("%s=%s" % item for item in self.toDict().items())
@@ -0,0 +1,175 @@
+# race: every algorithm of ALGORITHMS searching the same grid at the same time, one worker process each
+# the workers get a read-only snapshot of the grid (immutable copies of its cells and terrain costs, taken once),
+# edits made during the race don't reach them
+# every worker streams its progress (iterations, visited and the search state changes since its previous report)
+# through a queue and reports its result at the end, the caller drains the queue with poll() (e.g. once per UI frame)
+# a worker first builds the per-grid data its algorithm uses (see PathFindingAlgorithm.prepare), reported as setup time:
+# the search time doesn't include it, as for a search on a grid that already has it
+# or events() (blocking, headless)
+# py race.py grids/12x12.grd --diagonal -> summary table
+from algorithms import *
+from model import *
+import gridfile
+import multiprocessing
+import argparse
+import queue
+import sys
+import time
+
+PROGRESS_INTERVAL = 0.05 # seconds between two progress reports of a worker
+POLL_TIME = 0.1 # seconds events() waits for the next event before checking the workers
+
+EVENT_PROGRESS = "progress" # (EVENT_PROGRESS, index, iterations, visited, {cell: state})
+EVENT_DONE = "done" # (EVENT_DONE, index, SearchResult without marks, path cost, setup time in seconds)
+EVENT_FAILED = "failed" # (EVENT_FAILED, index, exit code), the worker died without a result
+
+# view and app of a worker's search: collects the search state changes and sends them every interval
+class ProgressReporter:
+    def __init__(self,events,index,interval=PROGRESS_INTERVAL):
+        self.events = events
+        self.index = index
+        self.interval = interval
+        self.cells = dict() # id -> last state since the previous report
+        self.next = 0 # perf_counter time of the next report
+
+    def onCellChanged(self,id,state):
+        self.cells[id] = state
+
+    def onStep(self,iterations,visited):
+        now = time.perf_counter()
+        if now >= self.next:
+            self.next = now+self.interval
+            self.send(iterations,visited)
+
+    def onSolution(self,bound):
+        pass
+
+    def send(self,iterations,visited):
+        self.events.put((EVENT_PROGRESS,self.index,iterations,visited,self.cells))
+        self.cells = dict()
+
+# worker process: one algorithm on the snapshot
+def _race(size,cells,costs,start,end,events,index,algorithm,diagonal,heuristic,tieBreaking,epsilon,interval):
+    grid = GridModel(size=size,cells=cells,start=start,end=end,costs=costs)
+    setupTime = time.perf_counter()
+    algorithm.prepare(grid,diagonal)
+    setupTime = time.perf_counter()-setupTime
+    reporter = ProgressReporter(events,index,interval)
+    result = solve(grid,algorithm=algorithm,diagonal=diagonal,heuristic=heuristic,tieBreaking=tieBreaking,epsilon=epsilon,observer=reporter)
+    reporter.send(result.iterations,result.visited) # last changes (path)
+    result.marks = None
+    events.put((EVENT_DONE,index,result,grid.pathCost(result.path),setupTime))
+
+class Race:
+    # algorithms: classes to race (None for ALGORITHMS), the other parameters are the same as solve()'s
+    def __init__(self,grid: GridModel,algorithms=None,diagonal: bool = False,heuristic=None,tieBreaking=TIE_FIFO,epsilon=None,interval=PROGRESS_INTERVAL):
+        self.grid = grid
+        self.algorithms = list(algorithms or ALGORITHMS)
+        self.diagonal = diagonal
+        self.heuristic = heuristic
+        self.tieBreaking = tieBreaking
+        self.epsilon = epsilon
+        self.interval = interval
+        self.results = dict() # index -> (SearchResult, path cost, setup time) of the finished algorithms
+        self.failed = dict() # index -> exit code of the workers that died without a result
+        self.processes = list()
+        self.queue = None
+        self.cells = None # snapshot the workers search (see start)
+        self.costs = None
+
+    # takes the snapshot and starts one worker process per algorithm
+    def start(self):
+        grid = self.grid
+        self.cells, self.costs = bytes(grid.cells), bytes(grid.costs)
+        self.queue = multiprocessing.Queue() # progress and results of every worker
+        for index, algorithm in enumerate(self.algorithms):
+            process = multiprocessing.Process(target=_race,args=(grid.dimensions,self.cells,self.costs,grid.start,grid.end,self.queue,index,algorithm,
+                                                                self.diagonal,self.heuristic,self.tieBreaking,self.epsilon,self.interval),daemon=True)
+            process.start()
+            self.processes.append(process)
+        return self
+
+    # True once every algorithm finished (or failed)
+    def isDone(self) -> bool:
+        return len(self.results)+len(self.failed) == len(self.algorithms)
+
+    # events received since the previous call, without blocking
+    def poll(self) -> list:
+        if self.isDone():
+            return list()
+        exited = [index for index, process in enumerate(self.processes) if process.exitcode is not None] # before draining: their last events are queued
+        events = list()
+        while True:
+            try:
+                events.append(self.record(self.queue.get_nowait()))
+            except queue.Empty:
+                break
+        for index in exited:
+            if index not in self.results and index not in self.failed:
+                events.append(self.record((EVENT_FAILED,index,self.processes[index].exitcode)))
+        if self.isDone():
+            self.close()
+        return events
+
+    # yields the events until every algorithm finished
+    def events(self):
+        while not self.isDone():
+            events = self.poll()
+            yield from events
+            if not events:
+                time.sleep(POLL_TIME)
+
+    def record(self,event):
+        if event[0] == EVENT_DONE:
+            self.results[event[1]] = (event[2],event[3],event[4])
+        elif event[0] == EVENT_FAILED:
+            self.failed[event[1]] = event[2]
+        return event
+
+    # stops the workers that are still running
+    def cancel(self):
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        self.close()
+
+    def close(self):
+        for process in self.processes:
+            process.join()
+        if self.queue is not None:
+            self.queue.close()
+
+    # (name, visited, search time in ms, setup time in ms, distance, path cost, bound) of the finished algorithms,
+    # fastest search first
+    def summary(self) -> list:
+        rows = list()
+        for index, (result, cost, setup) in sorted(self.results.items(),key=lambda item: item[1][0].time):
+            rows.append((self.algorithms[index].name or self.algorithms[index].__name__,result.visited,result.time*1000,setup*1000,len(result.path),cost,result.bound))
+        return rows
+
+    def table(self) -> str:
+        lines = ["%-20s %10s %10s %10s %9s %10s %7s" % ("algorithm","visited","time (ms)","setup (ms)","distance","cost","bound")]
+        for name, visited, ms, setup, distance, cost, bound in self.summary():
+            lines.append("%-20s %10d %10.2f %10.2f %9d %10.2f %7s" % (name,visited,ms,setup,distance,cost,"-" if bound is None else "%.3f" % bound))
+        for index, code in self.failed.items():
+            lines.append("%-20s failed (exit code %s)" % (self.algorithms[index].name or self.algorithms[index].__name__,code))
+        return "\n".join(lines)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Race every algorithm on a grid file, one process each.")
+    parser.add_argument("grid",help=".grd file")
+    parser.add_argument("--diagonal",action="store_true",help="8 neighbours")
+    args = parser.parse_args(argv)
+    grid = gridfile.load(args.grid)[0]
+    race = Race(grid,diagonal=args.diagonal).start()
+    try:
+        for event in race.events():
+            if event[0] != EVENT_PROGRESS:
+                print("finished:" if event[0] == EVENT_DONE else "failed:",race.algorithms[event[1]].name or race.algorithms[event[1]].__name__)
+    finally:
+        race.cancel()
+    print(race.table())
+    return 1 if race.failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
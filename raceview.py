@@ -0,0 +1,71 @@
+# race window: one mini view per algorithm of a Race (see race.py) showing the progress its worker streams,
+# and a summary table once every algorithm finished
+from tkinter import *
+import tkinter.ttk as ttk
+from grid import *
+from race import *
+
+RACE_VIEW_SIZE = 180 # max mini view width/height in pixels
+RACE_COLUMNS = 4 # mini views per row
+SUMMARY_COLUMNS = [("algorithm","algorithm",140),("visited","visited",70),("time","time (ms)",80),("setup","setup (ms)",80),("distance","distance",70),("cost","cost",70),("bound","bound",60)] # (id, heading, width)
+
+class RaceWindow:
+    # race: started Race, onClose: called when the window is closed
+    def __init__(self,parent,dummyImage,race: Race,onClose=None):
+        self.race = race
+        self.onClose = onClose
+        self.window = Toplevel(parent)
+        self.window.title("Race")
+        self.window.resizable(False,False)
+        self.window.protocol("WM_DELETE_WINDOW",self.close)
+        grid = race.grid
+        self.views = list()
+        self.labels = list()
+        viewsFrame = Frame(self.window)
+        viewsFrame.pack(padx=5,pady=5)
+        for index, algorithm in enumerate(race.algorithms):
+            frame = LabelFrame(viewsFrame,text=algorithm.name or algorithm.__name__)
+            frame.grid(row=index//RACE_COLUMNS,column=index%RACE_COLUMNS,padx=2,pady=2,sticky=N)
+            model = GridModel(size=grid.dimensions,cells=bytearray(race.cells),start=grid.start,end=grid.end,costs=bytearray(race.costs)) # the race's snapshot
+            view = CanvasGrid(frame,dummyImage,lambda id,left=False,terrain=False: None,cellSize=MAX_ZOOM,model=model,viewSize=RACE_VIEW_SIZE)
+            label = Label(frame,text="Visited: 0")
+            label.pack(anchor=NW)
+            self.views.append(view)
+            self.labels.append(label)
+        self.stateLabel = Label(self.window,text="Racing %d algorithms.." % len(race.algorithms))
+        self.stateLabel.pack(anchor=NW,padx=5)
+        self.table = ttk.Treeview(self.window,columns=[column for column, heading, width in SUMMARY_COLUMNS],show="headings",height=len(race.algorithms))
+        for column, heading, width in SUMMARY_COLUMNS:
+            self.table.heading(column,text=heading)
+            self.table.column(column,width=width,anchor=W if column == "algorithm" else E)
+        self.table.pack(padx=5,pady=5,fill=X)
+
+    # applies the events received since the previous call (once per UI frame)
+    def update(self):
+        for event in self.race.poll():
+            index = event[1]
+            if event[0] == EVENT_PROGRESS:
+                self.views[index].onCellsChanged(event[4])
+                self.labels[index].configure(text="Visited: %d" % event[3])
+            elif event[0] == EVENT_DONE:
+                result, cost, setup = event[2], event[3], event[4]
+                self.labels[index].configure(text="%d visited, %.1f ms (+%.1f ms setup), cost %g" % (result.visited,result.time*1000,setup*1000,round(cost,2)))
+            else:
+                self.labels[index].configure(text="Failed (exit code %s)" % event[2])
+            if event[0] != EVENT_PROGRESS and self.race.isDone():
+                self.showSummary()
+
+    # finished algorithms, fastest first
+    def showSummary(self):
+        self.stateLabel.configure(text="Finished")
+        for name, visited, ms, setup, distance, cost, bound in self.race.summary():
+            self.table.insert("",END,values=(name,visited,"%.2f" % ms,"%.2f" % setup,distance,"%.2f" % cost,"-" if bound is None else "%.3f" % bound))
+        for index, code in self.race.failed.items():
+            self.table.insert("",END,values=(self.race.algorithms[index].name or self.race.algorithms[index].__name__,"failed","","","","",""))
+
+    # stops the workers that are still running
+    def close(self):
+        self.race.cancel()
+        self.window.destroy()
+        if self.onClose:
+            self.onClose()
@@ -0,0 +1,39 @@
+# thread-safe buffer between a search thread and the Tk main loop
+# the search thread uses it as its view (onCellChanged) and app (onStep, onSolution, onSearchComplete), nothing touches Tk;
+# the main loop drains it once per frame and only applies the last state of every changed cell
+import threading
+
+class RenderBuffer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cells = dict() # id -> last state since the previous frame
+        self.stats = None # last (iterations, visited, bound)
+        self.bound = None # proven bound of the anytime search's current solution (see onSolution)
+        self.result = None # (iterations, visited, path, bound) once the search is complete
+
+    # view (search thread)
+    def onCellChanged(self,id,state):
+        with self.lock:
+            self.cells[id] = state
+
+    # app (search thread)
+    def onStep(self,iterations,visited):
+        with self.lock:
+            self.stats = (iterations,visited,self.bound)
+
+    # an anytime search found a better solution
+    def onSolution(self,bound):
+        with self.lock:
+            self.bound = bound
+
+    def onSearchComplete(self,iterations,visited,path,bound=None):
+        with self.lock:
+            self.result = (iterations,visited,path,bound)
+
+    # main loop, returns ({id: state}, stats, result) changed since the previous call (stats/result can be None)
+    def drain(self) -> tuple:
+        with self.lock:
+            cells, self.cells = self.cells, dict()
+            stats, self.stats = self.stats, None
+            result, self.result = self.result, None
+        return cells, stats, result
@@ -0,0 +1,54 @@
+# generation-stamped per-cell search data (g values), allocated once per grid and reused by the searches on it
+# a value only counts if its cell's stamp is the current generation, every other cell has the default value:
+# clearing is a generation bump (O(1)) instead of a pass over every cell, a search only pays for the cells it touches
+# searches acquire() a SearchData for their run and release() it when done, concurrent searches on the same grid
+# (e.g. a UI thread and a synchronous solve) get different ones
+from model import *
+from array import array
+from math import inf
+import threading
+
+MAX_GENERATION = 2**32-1 # stamps are unsigned 32 bit, wrapping around resets them
+
+class SearchData:
+    def __init__(self,size,default=inf):
+        self.default = default
+        self.values = array("d",[default])*size
+        self.stamps = array("I",[0])*size # generation in which the cell's value was set
+        self.generation = 1
+
+    # forgets every value (O(1), except once every MAX_GENERATION clears)
+    def clear(self):
+        self.generation += 1
+        if self.generation > MAX_GENERATION:
+            self.stamps = array("I",[0])*len(self.stamps)
+            self.generation = 1
+
+    def __getitem__(self,cell):
+        return self.values[cell] if self.stamps[cell] == self.generation else self.default
+
+    def __setitem__(self,cell,value):
+        self.values[cell] = value
+        self.stamps[cell] = self.generation
+
+    # True if the cell's value was set since the last clear
+    def __contains__(self,cell) -> bool:
+        return self.stamps[cell] == self.generation
+
+CACHE = "searchdata" # GridModel.caches key of the grid's pool: [released SearchData]
+lock = threading.Lock()
+
+# cleared search data for a search on a grid
+def acquire(grid: GridModel) -> SearchData:
+    with lock:
+        pool = grid.caches.setdefault(CACHE,list())
+        data = pool.pop() if pool else None
+    if data is None:
+        return SearchData(grid.size)
+    data.clear()
+    return data
+
+# gives the search data back to the grid's pool once the search is done with it
+def release(grid: GridModel,data: SearchData):
+    with lock:
+        grid.caches.setdefault(CACHE,list()).append(data)
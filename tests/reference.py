@@ -0,0 +1,67 @@
+# plain reference implementations the tests compare the searches and indexes against
+from model import *
+from math import inf
+import heapq
+import random
+
+MOVES = "moves" # every move costs 1 (BFS, LPA*, bidirectional searches..)
+COSTS = "costs" # moveCost: terrain cost of the cell moved to, times sqrt(2) diagonally (weighted searches)
+LENGTH = "length" # 1, sqrt(2) diagonally, terrain ignored (JPS)
+
+# random grid: blocked cells with the given density, random terrain costs (1..maxCost) on some of the others
+def randomGrid(seed,size=None,density=0.25,maxCost=1) -> GridModel:
+    rnd = random.Random(seed)
+    size = size or (rnd.randint(3,16),rnd.randint(3,16))
+    grid = GridModel(size=size)
+    for id in range(grid.size):
+        if id == grid.start or id == grid.end:
+            continue
+        if rnd.random() < density:
+            grid.block(id)
+        elif maxCost > 1 and rnd.random() < 0.3:
+            grid.setCost(id,rnd.randint(1,maxCost))
+    return grid
+
+def stepCost(grid: GridModel,a,b,metric) -> float:
+    (ax,ay), (bx,by) = grid.coords(a), grid.coords(b)
+    diagonal = ax != bx and ay != by
+    if metric == MOVES:
+        return 1
+    if metric == LENGTH:
+        return SQRT2 if diagonal else 1
+    return grid.costs[b]*SQRT2 if diagonal else grid.costs[b]
+
+def neighbours(grid: GridModel,cell,diagonal: bool) -> list:
+    x,y = grid.coords(cell)
+    cells = list()
+    for dx,dy in NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER:
+        n = grid.get(x+dx,y+dy)
+        if n is not None and grid.cells[n] != BLOCKED:
+            cells.append(n)
+    return cells
+
+# Dijkstra from origin: {cell: distance} of the reachable cells
+def distances(grid: GridModel,origin,diagonal: bool,metric=COSTS) -> dict:
+    found = {origin: 0}
+    heap = [(0,origin)]
+    while heap:
+        distance, cell = heapq.heappop(heap)
+        if distance > found[cell]:
+            continue
+        for n in neighbours(grid,cell,diagonal):
+            d = distance + stepCost(grid,cell,n,metric)
+            if d < found.get(n,inf):
+                found[n] = d
+                heapq.heappush(heap,(d,n))
+    return found
+
+# shortest distance between two cells, None if unreachable
+def shortest(grid: GridModel,origin,destination,diagonal: bool,metric=COSTS):
+    return distances(grid,origin,diagonal,metric).get(destination)
+
+# cost of a path with the metric, after checking that it is a valid path between the two cells
+def pathCost(grid: GridModel,path,origin,destination,diagonal: bool,metric=COSTS) -> float:
+    assert path[0] == origin and path[-1] == destination
+    for a, b in zip(path,path[1:]):
+        assert b in neighbours(grid,a,diagonal)
+    return sum(stepCost(grid,a,b,metric) for a, b in zip(path,path[1:]))
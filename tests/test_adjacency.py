@@ -0,0 +1,41 @@
+# the shared neighbour tuples follow the grid's edits
+from adjacency import Adjacency, getAdjacency
+from reference import *
+import pytest
+import random
+
+def same(grid: GridModel,adjacency: Adjacency,diagonal: bool):
+    fresh = Adjacency(grid,diagonal)
+    fresh.detach()
+    assert adjacency.neighbours == fresh.neighbours
+    for cell in range(grid.size):
+        assert list(adjacency.neighbours[cell]) == neighbours(grid,cell,diagonal)
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_edits(diagonal):
+    rnd = random.Random(8)
+    grid = randomGrid(8,size=(13,17),density=0.3)
+    adjacency = getAdjacency(grid,diagonal)
+    for edit in range(300):
+        cell = rnd.randrange(grid.size)
+        if edit % 3 == 0:
+            grid.setCost(cell,rnd.randint(1,9))
+        elif edit % 3 == 1:
+            grid.block(cell)
+        else:
+            grid.edit(cell,rnd.choice((EMPTY,BLOCKED)))
+        if edit % 20 == 0:
+            same(grid,adjacency,diagonal)
+    assert getAdjacency(grid,diagonal) is adjacency
+    same(grid,adjacency,diagonal)
+
+# moving the start/end markers doesn't block anything
+def test_markers():
+    grid = randomGrid(4,size=(9,9))
+    adjacency = getAdjacency(grid,True)
+    before = list(adjacency.neighbours)
+    grid.replaceStart(grid.get(4,4))
+    grid.replaceEnd(grid.get(0,8))
+    grid.reverseStart()
+    assert adjacency.neighbours == before
+    same(grid,adjacency,True)
@@ -0,0 +1,62 @@
+# bounded-suboptimal and anytime searches: the paths cost at most epsilon (or the reported bound) times the shortest one
+from algorithms import *
+from reference import *
+import pytest
+
+EPSILONS = (1.0,1.5,3.0)
+
+def cases():
+    for seed in range(20):
+        grid = randomGrid(seed,size=(18,18),density=0.25,maxCost=9)
+        for diagonal in (False,True):
+            yield grid, diagonal, shortest(grid,grid.start,grid.end,diagonal)
+
+@pytest.mark.parametrize("algorithm",(WeightedA_Star,FocalSearch,ARA_Star),ids=lambda algorithm: algorithm.__name__)
+def test_epsilonBound(algorithm):
+    for grid, diagonal, expected in cases():
+        for epsilon in EPSILONS:
+            for tieBreaking in (TIE_FIFO,TIE_HIGH_G):
+                result = solve(grid,algorithm=algorithm,diagonal=diagonal,epsilon=epsilon,tieBreaking=tieBreaking)
+                if expected is None:
+                    assert result.path == [] and result.bound is None
+                    continue
+                cost = pathCost(grid,result.path,grid.start,grid.end,diagonal)
+                limit = 1.0 if algorithm is ARA_Star else epsilon # ARA* keeps improving down to epsilon 1
+                assert result.bound is not None and result.bound <= limit + 1e-9
+                assert cost <= result.bound*expected + 1e-9
+
+# out of budget: the best path so far, with a bound that still holds
+@pytest.mark.parametrize("algorithm",(WeightedA_Star,FocalSearch,ARA_Star,A_Star),ids=lambda algorithm: algorithm.__name__)
+def test_budget(algorithm):
+    for grid, diagonal, expected in cases():
+        for budget in (1,5,20):
+            result = solve(grid,algorithm=algorithm,diagonal=diagonal,epsilon=3.0 if algorithm.bounded else None,maxExpansions=budget)
+            if not result.complete:
+                assert result.visited <= budget
+            if result.path and result.bound is not None:
+                assert grid.pathCost(result.path) <= result.bound*expected + 1e-9
+            if not result.path:
+                assert result.bound is None
+
+# ARA* finds a first path quickly and reports a bound for it before the search ends
+def test_anytime():
+    grid = GridModel(size=(40,40))
+    for row in range(35):
+        grid.block(grid.get(row,20))
+    solutions = list()
+    class Observer:
+        def onCellChanged(self,id,state):
+            pass
+        def onStep(self,iterations,visited):
+            pass
+        def onSolution(self,bound):
+            solutions.append(bound)
+    result = solve(grid,algorithm=ARA_Star,diagonal=True,epsilon=3.0,observer=Observer())
+    assert result.bound == 1.0
+    assert solutions and solutions[0] > 1.0 and solutions[-1] == 1.0
+    assert solutions == sorted(solutions,reverse=True)
+    assert grid.pathCost(result.path) == pytest.approx(shortest(grid,grid.start,grid.end,True))
+
+def test_invalidEpsilon():
+    with pytest.raises(ValueError):
+        solve(GridModel(size=(4,4)),algorithm=WeightedA_Star,epsilon=0.5)
@@ -0,0 +1,29 @@
+# path cache results against fresh searches, across edits
+from algorithms import *
+from cache import PathCache
+from reference import *
+import pytest
+import random
+
+# cached results (carried over edits or not) are the ones a fresh search returns
+@pytest.mark.parametrize("algorithm",(A_Star,BreadthFirstSearch,LPA_Star),ids=lambda algorithm: algorithm.__name__)
+def test_pathCache(algorithm):
+    rnd = random.Random(7)
+    grid = randomGrid(7,size=(14,14),density=0.15)
+    cache = PathCache()
+    cache.attach(grid)
+    queries = [(rnd.randrange(grid.size),rnd.randrange(grid.size)) for n in range(6)]
+    for edit in range(40):
+        for start, end in queries:
+            if grid.cells[start] == BLOCKED or grid.cells[end] == BLOCKED:
+                continue
+            cached = cache.solve(grid,start,end,algorithm)
+            fresh = solve(grid,start,end,algorithm)
+            assert len(cached.path) == len(fresh.path)
+            if fresh.path:
+                assert grid.pathCost(cached.path) == pytest.approx(grid.pathCost(fresh.path))
+                pathCost(grid,cached.path,start,end,False)
+        cell = rnd.randrange(grid.size)
+        if cell not in (grid.start,grid.end):
+            grid.block(cell)
+    assert cache.hits
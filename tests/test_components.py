@@ -0,0 +1,73 @@
+# the component index stays exact while cells are blocked and unblocked
+from algorithms import *
+from components import ComponentIndex, getIndex, unreachable
+from reference import *
+import pytest
+import random
+import gc
+import weakref
+
+# free cells grouped by component, as a set of frozensets (labels don't matter)
+def partition(grid: GridModel,component) -> set:
+    groups = dict()
+    for cell in range(grid.size):
+        if grid.cells[cell] != BLOCKED:
+            groups.setdefault(component(cell),set()).add(cell)
+    return {frozenset(group) for group in groups.values()}
+
+def reachablePartition(grid: GridModel,diagonal: bool) -> set:
+    groups = set()
+    seen = set()
+    for cell in range(grid.size):
+        if grid.cells[cell] != BLOCKED and cell not in seen:
+            group = frozenset(distances(grid,cell,diagonal,MOVES))
+            seen |= group
+            groups.add(group)
+    return groups
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_incrementalUpdates(diagonal):
+    for seed in range(8):
+        rnd = random.Random(seed)
+        grid = randomGrid(seed,size=(14,14),density=0.3)
+        index = getIndex(grid,diagonal)
+        for edit in range(150):
+            grid.block(rnd.randrange(grid.size))
+            if edit % 10 == 0:
+                assert partition(grid,index.component) == reachablePartition(grid,diagonal), (seed,edit)
+        fresh = ComponentIndex(grid,diagonal)
+        fresh.detach()
+        assert partition(grid,index.component) == partition(grid,fresh.component)
+
+def test_unreachable():
+    grid = GridModel(size=(10,10))
+    for row in range(10):
+        grid.block(grid.get(row,4))
+        grid.block(grid.get(row,5))
+    assert unreachable(grid,grid.start,grid.end,False)
+    assert unreachable(grid,grid.start,grid.end,True)
+    grid.block(grid.get(3,4)) # staggered gaps, only crossed diagonally
+    grid.block(grid.get(4,5))
+    assert unreachable(grid,grid.start,grid.end,False)
+    assert not unreachable(grid,grid.start,grid.end,True)
+    grid.block(grid.get(3,5)) # straight gap
+    assert not unreachable(grid,grid.start,grid.end,False)
+    grid.block(grid.get(3,5))
+    assert unreachable(grid,grid.start,grid.end,False)
+    assert unreachable(grid,grid.start,grid.get(3,5),False) # blocked destination
+    assert not unreachable(grid,grid.get(0,4),grid.start,False) # a blocked origin is checked by its free neighbours
+    assert unreachable(grid,grid.get(0,5),grid.start,False)
+
+# the per-grid data (component index, adjacency, LPA* state, landmark tables, HPA* graph, flow field)
+# goes away with the grid
+def test_gridCaches():
+    import flowfield
+    grid = randomGrid(4,size=(20,20),density=0.2)
+    for algorithm in ALGORITHMS:
+        solve(grid,algorithm=algorithm,diagonal=True)
+    flowfield.getFlowField(grid)
+    assert getIndex(grid,True) is getIndex(grid,True)
+    reference = weakref.ref(grid)
+    del grid
+    gc.collect()
+    assert reference() is None
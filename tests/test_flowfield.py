@@ -0,0 +1,59 @@
+# flow fields repaired after edits match fields built from scratch on the edited grid
+from flowfield import FlowField, getFlowField, forgetFlowField
+from reference import *
+from math import inf
+import pytest
+import random
+
+def check(grid: GridModel,field: FlowField,diagonal: bool):
+    expected = distances(grid,field.target,diagonal,MOVES) if grid.cells[field.target] != BLOCKED else dict()
+    for cell in range(grid.size):
+        if grid.cells[cell] == BLOCKED:
+            continue
+        assert field.distances[cell] == expected.get(cell,inf), cell
+        path = field.path(cell)
+        if cell in expected:
+            assert len(path)-1 == expected[cell]
+            pathCost(grid,path,cell,field.target,diagonal,MOVES)
+        else:
+            assert path == [] and field.nextStep(cell) is None
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_repairAfterEdits(diagonal):
+    for seed in range(6):
+        rnd = random.Random(seed)
+        grid = randomGrid(seed,size=(15,15),density=0.25)
+        field = getFlowField(grid,diagonal=diagonal)
+        for edit in range(120):
+            grid.block(rnd.randrange(grid.size))
+            if edit % 8 == 0:
+                check(grid,field,diagonal)
+        fresh = FlowField(grid,field.target,diagonal)
+        fresh.detach()
+        assert field.distances == fresh.distances
+        check(grid,field,diagonal)
+
+def test_blockedTarget():
+    grid = GridModel(size=(8,8))
+    target = grid.get(4,4)
+    field = getFlowField(grid,target)
+    assert getFlowField(grid,target) is field
+    grid.block(target)
+    check(grid,field,False)
+    assert all(field.nextStep(cell) is None for cell in range(grid.size))
+    grid.block(target)
+    check(grid,field,False)
+
+# one cached field per target and neighbour mode, dropped ones stop following the edits
+def test_cachedFields():
+    grid = GridModel(size=(8,8))
+    field = getFlowField(grid,diagonal=True)
+    assert getFlowField(grid,grid.end,True) is field
+    assert getFlowField(grid) is not field
+    listeners = len(grid.listeners)
+    for n in range(3):
+        assert getFlowField(grid,diagonal=True) is field
+    assert len(grid.listeners) == listeners
+    forgetFlowField(grid,diagonal=True)
+    assert field not in grid.listeners
+    assert getFlowField(grid,diagonal=True) is not field
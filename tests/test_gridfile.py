@@ -0,0 +1,78 @@
+# .grd files (every compression) and JSON files load back the grid they were saved from
+import gridfile
+import os
+from reference import *
+import pytest
+
+def same(a: GridModel,b: GridModel):
+    assert a.dimensions == b.dimensions
+    assert (a.start,a.end) == (b.start,b.end)
+    assert bytes(a.cells) == bytes(b.cells)
+    assert bytes(a.costs) == bytes(b.costs)
+
+@pytest.mark.parametrize("compression",sorted(gridfile.COMPRESSIONS))
+def test_roundTrip(tmp_path,compression):
+    for seed in range(5):
+        grid = randomGrid(seed,size=(17+seed,9),maxCost=MAX_COST)
+        path = str(tmp_path / ("%d.grd" % seed))
+        gridfile.save(path,grid,24,gridfile.COMPRESSIONS[compression])
+        loaded, cellSize = gridfile.load(path)
+        assert cellSize == 24
+        same(grid,loaded)
+
+def test_json(tmp_path):
+    grid = randomGrid(1,size=(13,7),maxCost=9)
+    path = str(tmp_path / "grid.json")
+    gridfile.saveJSON(path,grid,16)
+    loaded, cellSize = gridfile.load(path)
+    assert cellSize == 16
+    same(grid,loaded)
+
+def test_convert(tmp_path):
+    grid = randomGrid(2,size=(20,20),maxCost=5)
+    gridfile.save(str(tmp_path / "a.grd"),grid,20)
+    gridfile.convert(str(tmp_path / "a.grd"),str(tmp_path / "b.grd"),"zlib")
+    gridfile.convert(str(tmp_path / "b.grd"),str(tmp_path / "c.json"),"json")
+    gridfile.convert(str(tmp_path / "c.json"),str(tmp_path / "d.grd"),"rle")
+    same(grid,gridfile.load(str(tmp_path / "d.grd"))[0])
+
+# a mapped grid can be edited and searched, the file isn't written
+def test_mappedEdits(tmp_path):
+    grid = randomGrid(3,size=(12,12))
+    path = tmp_path / "grid.grd"
+    gridfile.save(str(path),grid,20)
+    data = path.read_bytes()
+    loaded = gridfile.load(str(path))[0]
+    loaded.block(loaded.get(5,5))
+    loaded.setCost(loaded.get(6,6),7)
+    assert path.read_bytes() == data
+
+def test_version1(tmp_path):
+    grid = randomGrid(4,size=(6,5))
+    path = tmp_path / "old.grd"
+    path.write_bytes(gridfile.HEADER.pack(gridfile.MAGIC,1,gridfile.RAW,20,grid.columns,grid.rows,grid.start,grid.end) + bytes(grid.cells))
+    loaded = gridfile.load(str(path))[0]
+    same(grid,loaded)
+
+@pytest.mark.parametrize("data",(b"PFGR\x02",gridfile.HEADER.pack(gridfile.MAGIC,9,0,20,4,4,0,15),gridfile.HEADER.pack(gridfile.MAGIC,2,0,20,4,4,0,15)+bytes(3)),ids=("header","version","cells"))
+def test_invalid(tmp_path,data):
+    path = tmp_path / "bad.grd"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        gridfile.load(str(path))
+
+# a grid saved back over the file it is mapped from keeps its cells, the file gets the new ones
+@pytest.mark.parametrize("mapped",(True,False))
+def test_saveOverLoaded(tmp_path,mapped):
+    grid = randomGrid(5,size=(15,11),maxCost=9)
+    path = str(tmp_path / "grid.grd")
+    gridfile.save(path,grid,20)
+    loaded = gridfile.load(path,mapped)[0]
+    assert isinstance(loaded.cells,bytearray) != mapped
+    same(grid,loaded)
+    loaded.block(loaded.get(5,5))
+    loaded.setCost(loaded.get(6,6),7)
+    gridfile.save(path,loaded,20)
+    gridfile.save(path,loaded,20)
+    same(loaded,gridfile.load(path,mapped)[0])
+    assert sorted(os.listdir(str(tmp_path))) == ["grid.grd"]
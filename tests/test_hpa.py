@@ -0,0 +1,46 @@
+# the HPA* cluster graph stays the one a fresh build gives while cells are blocked and unblocked
+from algorithms import *
+from reference import *
+import hpa
+import pytest
+import random
+
+def same(graph: hpa.ClusterGraph,fresh: hpa.ClusterGraph):
+    assert graph.borders == fresh.borders
+    assert graph.inter == fresh.inter
+    assert graph.nodes == fresh.nodes
+    assert graph.intra == fresh.intra
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_incrementalUpdates(diagonal):
+    for seed in range(4):
+        rnd = random.Random(seed)
+        grid = randomGrid(seed,size=(37,43),density=0.2)
+        graph = hpa.getGraph(grid,diagonal)
+        for edit in range(200):
+            grid.block(rnd.randrange(grid.size))
+            if edit % 25 == 0:
+                assert hpa.getGraph(grid,diagonal) is graph
+                fresh = hpa.ClusterGraph(grid,diagonal)
+                fresh.detach()
+                same(graph,fresh)
+
+# paths found after edits are valid, found whenever there is one, and cost what they cost with a fresh graph
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_pathsAfterEdits(diagonal):
+    rnd = random.Random(5)
+    grid = randomGrid(5,size=(30,30),density=0.15)
+    graph = hpa.getGraph(grid,diagonal)
+    for edit in range(40):
+        result = solve(grid,algorithm=HPA_Star,diagonal=diagonal)
+        assert hpa.getGraph(grid,diagonal) is graph
+        expected = shortest(grid,grid.start,grid.end,diagonal,MOVES)
+        if expected is None:
+            assert result.path == []
+        else:
+            cost = pathCost(grid,result.path,grid.start,grid.end,diagonal,MOVES)
+            assert cost >= expected
+            copy = GridModel(size=grid.dimensions,cells=bytearray(grid.cells),start=grid.start,end=grid.end) # fresh graph
+            assert len(solve(copy,algorithm=HPA_Star,diagonal=diagonal).path)-1 == cost
+        for n in range(5): # mostly cells of the path
+            grid.block(rnd.choice(result.path[1:-1]) if len(result.path) > 2 and rnd.random() < 0.6 else rnd.randrange(grid.size))
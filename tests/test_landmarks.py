@@ -0,0 +1,65 @@
+# ALT landmark tables: rebuilt after edits, exact distances, saved and loaded next to a grid file
+from algorithms import *
+from reference import *
+import landmarks
+import pytest
+import random
+
+def check(grid: GridModel,tables: landmarks.LandmarkTables,diagonal: bool):
+    assert not tables.stale and tables.landmarks
+    for landmark, table in zip(tables.landmarks,tables.tables):
+        expected = distances(grid,landmark,diagonal,MOVES)
+        assert list(table) == [expected.get(cell,landmarks.UNREACHABLE) for cell in range(grid.size)]
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_rebuildAfterEdits(diagonal):
+    rnd = random.Random(3)
+    grid = randomGrid(3,size=(20,20),density=0.2)
+    tables = landmarks.getTables(grid,diagonal)
+    check(grid,tables,diagonal)
+    for edit in range(10):
+        for n in range(8):
+            grid.block(rnd.randrange(grid.size))
+        assert tables.stale
+        assert landmarks.getTables(grid,diagonal) is tables
+        check(grid,tables,diagonal)
+        fresh = landmarks.LandmarkTables(grid,diagonal)
+        fresh.detach()
+        assert (tables.landmarks,tables.tables) == (fresh.landmarks,fresh.tables)
+        # the bounds stay admissible, ALT paths stay optimal
+        expected = distances(grid,grid.end,diagonal,MOVES)
+        for cell in expected:
+            assert tables.bound(cell,grid.end) <= expected[cell]
+        result = solve(grid,algorithm=ALT_Star,diagonal=diagonal)
+        if grid.start in expected:
+            assert pathCost(grid,result.path,grid.start,grid.end,diagonal) == pytest.approx(shortest(grid,grid.start,grid.end,diagonal))
+
+# terrain cost edits don't change the tables
+def test_costEdits():
+    grid = randomGrid(1,size=(12,12))
+    tables = landmarks.getTables(grid,False)
+    grid.setCost(grid.get(5,5),9)
+    assert not tables.stale
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_saveAndLoad(tmp_path,diagonal):
+    grid = randomGrid(6,size=(16,14),density=0.2)
+    tables = landmarks.getTables(grid,diagonal)
+    path = landmarks.tablesPath(str(tmp_path / "grid.grd"),diagonal)
+    tables.save(path)
+    loaded = landmarks.loadTables(path,grid,diagonal)
+    assert loaded.landmarks == tables.landmarks and loaded.tables == tables.tables
+    loaded.detach()
+    assert landmarks.loadTables(path,grid,not diagonal) is None # other neighbour mode
+    grid.block(next(cell for cell in range(1,grid.size) if grid.cells[cell] == EMPTY))
+    assert landmarks.loadTables(path,grid,diagonal) is None # other obstacles
+    assert landmarks.loadTables(str(tmp_path / "missing.alt"),grid,diagonal) is None
+
+def test_setTables(tmp_path):
+    grid = randomGrid(2,size=(10,10))
+    old = landmarks.getTables(grid,True)
+    old.save(str(tmp_path / "grid.diagonal.alt"))
+    loaded = landmarks.loadTables(str(tmp_path / "grid.diagonal.alt"),grid,True)
+    landmarks.setTables(grid,loaded)
+    assert landmarks.getTables(grid,True) is loaded
+    assert old not in grid.listeners and loaded in grid.listeners
@@ -0,0 +1,65 @@
+# LPA* repairs its kept search data after edits: the repaired paths are the shortest ones of the edited grid
+from algorithms import *
+from reference import *
+import pytest
+import random
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_repairAfterEdits(diagonal):
+    rnd = random.Random(11)
+    grid = randomGrid(11,size=(16,16),density=0.2)
+    state = None
+    for edit in range(60):
+        result = solve(grid,algorithm=LPA_Star,diagonal=diagonal)
+        assert state is None or grid.caches[LPA_CACHE] is state # repaired, not rebuilt
+        state = grid.caches[LPA_CACHE]
+        expected = shortest(grid,grid.start,grid.end,diagonal,MOVES)
+        if expected is None:
+            assert result.path == []
+        else:
+            assert pathCost(grid,result.path,grid.start,grid.end,diagonal,MOVES) == expected
+        # block a cell of the path most of the time (forces a detour), otherwise toggle a random one
+        cells = result.path[1:-1] if result.path and rnd.random() < 0.7 else range(grid.size)
+        grid.block(rnd.choice(cells) if cells else rnd.randrange(grid.size))
+
+def test_repairVisitsLess():
+    grid = GridModel(size=(30,30))
+    for row in range(25):
+        grid.block(grid.get(row,15))
+    first = solve(grid,algorithm=LPA_Star)
+    assert first.path
+    grid.block(next(cell for cell in range(grid.size) if grid.cells[cell] == EMPTY and cell not in first.path))
+    repaired = solve(grid,algorithm=LPA_Star)
+    assert len(repaired.path) == len(first.path)
+    assert repaired.visited < first.visited
+
+# a new query (other end, neighbour mode) or an edit the state didn't see starts over
+def test_newQueries():
+    grid = randomGrid(2,size=(12,12),density=0.2)
+    solve(grid,algorithm=LPA_Star)
+    state = grid.caches[LPA_CACHE]
+    end = next(cell for cell in reversed(range(grid.size-1)) if grid.cells[cell] == EMPTY)
+    result = solve(grid,end=end,algorithm=LPA_Star)
+    assert grid.caches[LPA_CACHE] is not state
+    assert state not in grid.listeners
+    expected = shortest(grid,grid.start,end,False,MOVES)
+    assert (len(result.path)-1 if result.path else None) == expected
+    LPA_Star.forget(grid)
+    assert LPA_CACHE not in grid.caches
+
+# a re-run after edits reports its search state to the observer only, never to the grid's view
+def test_noViewCallbacks():
+    class Recorder:
+        def __init__(self):
+            self.cells = list()
+        def onCellChanged(self,id,state):
+            self.cells.append(id)
+    grid = GridModel(size=(12,12))
+    grid.view = Recorder()
+    solve(grid,algorithm=LPA_Star)
+    for row in range(8):
+        grid.block(grid.get(row,6))
+    grid.view.cells.clear()
+    result = solve(grid,algorithm=LPA_Star)
+    assert grid.view.cells == []
+    assert len(result.path)-1 == shortest(grid,grid.start,grid.end,False,MOVES)
@@ -0,0 +1,62 @@
+# solve() paths against a plain Dijkstra (reference.py)
+from algorithms import *
+from reference import *
+import pytest
+
+SEEDS = range(30)
+
+# what the optimal searches minimize: moveCost for the weighted ones, moves for the others,
+# JPS moves diagonally at sqrt(2) but ignores the terrain
+def metric(algorithm,diagonal: bool):
+    if algorithm.weighted:
+        return COSTS
+    if algorithm is JumpPointSearch and diagonal:
+        return LENGTH
+    return MOVES
+
+@pytest.mark.parametrize("diagonal",(False,True))
+@pytest.mark.parametrize("algorithm",[algorithm for algorithm in ALGORITHMS if algorithm.optimal],ids=lambda algorithm: algorithm.__name__)
+def test_optimalSearches(algorithm,diagonal):
+    for seed in SEEDS:
+        grid = randomGrid(seed,maxCost=9 if seed % 2 else 1)
+        expected = shortest(grid,grid.start,grid.end,diagonal,metric(algorithm,diagonal))
+        result = solve(grid,algorithm=algorithm,diagonal=diagonal)
+        assert result.complete
+        if expected is None:
+            assert result.path == []
+        else:
+            assert pathCost(grid,result.path,grid.start,grid.end,diagonal,metric(algorithm,diagonal)) == pytest.approx(expected), seed
+
+# every search finds a path when there is one, and the bound it reports holds for the path's cost
+@pytest.mark.parametrize("diagonal",(False,True))
+@pytest.mark.parametrize("algorithm",ALGORITHMS,ids=lambda algorithm: algorithm.__name__)
+def test_paths(algorithm,diagonal):
+    for seed in SEEDS:
+        grid = randomGrid(seed,maxCost=9 if seed % 2 else 1)
+        expected = shortest(grid,grid.start,grid.end,diagonal)
+        result = solve(grid,algorithm=algorithm,diagonal=diagonal)
+        if expected is None:
+            assert result.path == [] and result.bound is None
+            continue
+        cost = pathCost(grid,result.path,grid.start,grid.end,diagonal)
+        assert cost == pytest.approx(grid.pathCost(result.path))
+        if result.bound is not None:
+            assert cost <= result.bound*expected + 1e-9, seed
+
+def test_startAndEnd():
+    grid = randomGrid(3,size=(12,12),density=0.2)
+    reachable = distances(grid,5,True)
+    for end in (40,77,130):
+        result = solve(grid,5,end,Dijkstra,diagonal=True)
+        if end in reachable:
+            assert pathCost(grid,result.path,5,end,True) == pytest.approx(reachable[end])
+        else:
+            assert result.path == []
+
+def test_walledOff():
+    grid = GridModel(size=(9,9))
+    for row in range(9):
+        grid.block(grid.get(row,4))
+    for algorithm in ALGORITHMS:
+        result = solve(grid,algorithm=algorithm,diagonal=True)
+        assert result.path == [] and result.visited == 0
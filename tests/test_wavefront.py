@@ -0,0 +1,44 @@
+# wavefront distance fields give the same distances and paths as BreadthFirstSearch
+from algorithms import *
+from reference import *
+import gridfile
+import os
+import pytest
+
+pytest.importorskip("numpy")
+import wavefront
+
+GRIDS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"grids")
+
+def grids():
+    for name in sorted(os.listdir(GRIDS)):
+        if name.endswith(".grd"):
+            yield name, gridfile.load(os.path.join(GRIDS,name))[0]
+    for seed in range(4):
+        yield "random %d" % seed, randomGrid(seed,size=(25,20),density=0.3)
+
+@pytest.mark.parametrize("diagonal",(False,True))
+def test_sameAsBreadthFirstSearch(diagonal):
+    for name, grid in grids():
+        field = wavefront.distanceField(grid,diagonal=diagonal)
+        expected = distances(grid,grid.start,diagonal,MOVES)
+        for cell in range(grid.size):
+            assert field.distance(cell) == expected.get(cell,wavefront.UNREACHED), (name,cell)
+        result = solve(grid,algorithm=BreadthFirstSearch,diagonal=diagonal)
+        assert field.path(grid.end) == result.path, name
+        if result.path:
+            assert field.distance(grid.end) == len(result.path)-1
+
+# other origins, paths to every cell are valid shortest ones
+def test_paths():
+    grid = randomGrid(9,size=(18,18),density=0.25)
+    for origin in (grid.get(9,9),grid.get(0,17),grid.get(17,3)):
+        if grid.cells[origin] == BLOCKED:
+            grid.block(origin)
+        field = wavefront.distanceField(grid,origin,True)
+        for cell in range(grid.size):
+            path = field.path(cell)
+            if path:
+                assert pathCost(grid,path,origin,cell,True,MOVES) == field.distance(cell)
+            else:
+                assert cell == origin or field.distance(cell) == wavefront.UNREACHED
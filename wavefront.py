@@ -0,0 +1,79 @@
+# NumPy wavefront engine: complete BFS distance fields for whole-map analyses
+# every iteration expands the whole frontier at once: per direction, a precomputed mask tells which cells have an
+# unblocked neighbour that way and the neighbours are the frontier ids shifted by the direction's offset
+# the frontier is kept in BreadthFirstSearch's queue order (parent order, then neighboursOrder), so every cell gets
+# the same distance and the same parent as with BreadthFirstSearch
+# NumPy is optional, only this module needs it
+from model import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+UNREACHED = -1
+
+class DistanceField:
+    def __init__(self,grid: GridModel,origin,diagonal,distances,directions):
+        self.grid = grid
+        self.origin = origin
+        self.neighboursOrder = NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER
+        self.distances = distances # (rows, columns) int32, UNREACHED if the cell can't be reached
+        self.directions = directions # (rows, columns) int8, neighboursOrder index of the move from the parent, UNREACHED for the origin
+
+    def distance(self,cell) -> int:
+        return int(self.distances.flat[cell])
+
+    # cells from the origin to a cell (same as BreadthFirstSearch.getPath), empty if unreachable
+    def path(self,cell) -> list:
+        if cell == self.origin or self.distances.flat[cell] == UNREACHED:
+            return list()
+        path = [cell]
+        while cell != self.origin:
+            dx,dy = self.neighboursOrder[self.directions.flat[cell]]
+            cell -= dx*self.grid.columns+dy
+            path.append(cell)
+        path.reverse()
+        return path
+
+# BFS distance field from origin (None for the grid's start)
+def distanceField(grid: GridModel,origin=None,diagonal: bool = False) -> DistanceField:
+    if np is None:
+        raise ImportError("wavefront requires NumPy (pip install numpy)")
+    origin = grid.start if origin is None else origin
+    order = NEIGHBOURS_ORDER_DIAGONAL if diagonal else NEIGHBOURS_ORDER
+    rows, columns = grid.rows, grid.columns
+    free = np.frombuffer(bytes(grid.cells),dtype=np.uint8).reshape(rows,columns) != BLOCKED
+    # masks[k][cell]: the neighbour of cell in direction k is inside the grid and unblocked
+    masks = list()
+    offsets = list()
+    for dx,dy in order:
+        mask = np.zeros((rows,columns),dtype=bool)
+        mask[max(-dx,0):rows-max(dx,0),max(-dy,0):columns-max(dy,0)] = free[max(dx,0):rows+min(dx,0),max(dy,0):columns+min(dy,0)]
+        masks.append(mask.ravel())
+        offsets.append(dx*columns+dy)
+    distances = np.full(rows*columns,UNREACHED,dtype=np.int32)
+    directions = np.full(rows*columns,UNREACHED,dtype=np.int8)
+    distances[origin] = 0
+    frontier = np.array([origin],dtype=np.int64) # in BFS queue order
+    count = len(order)
+    level = 0
+    while frontier.size:
+        level += 1
+        targets = list()
+        keys = list() # position of the parent in the frontier * count + direction: BFS discovery order
+        for k in range(count):
+            positions = np.flatnonzero(masks[k][frontier])
+            cells = frontier[positions] + offsets[k]
+            new = distances[cells] == UNREACHED
+            targets.append(cells[new])
+            keys.append(positions[new]*count + k)
+        targets = np.concatenate(targets)
+        keys = np.concatenate(keys)
+        sort = np.argsort(keys)
+        targets, keys = targets[sort], keys[sort]
+        first = np.sort(np.unique(targets,return_index=True)[1]) # first discovery of every cell, in discovery order
+        frontier = targets[first]
+        distances[frontier] = level
+        directions[frontier] = keys[first] % count
+    return DistanceField(grid,origin,diagonal,distances.reshape(rows,columns),directions.reshape(rows,columns))